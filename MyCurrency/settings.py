@@ -43,6 +43,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "MyCurrencyApp.monitoring.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -86,11 +87,76 @@ DATABASES = {
     }
 }
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+#
+# The "rates" cache is shared by every worker. Use "file" to share it between
+# the workers of one host, or "memcached"/"redis" (requires pymemcache/redis).
+
+RATE_CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "rates": {
+        "BACKEND": RATE_CACHE_BACKENDS[os.getenv("RATE_CACHE_BACKEND", "locmem")],
+        "LOCATION": os.getenv("RATE_CACHE_LOCATION", str(BASE_DIR / ".rate_cache")),
+        "TIMEOUT": int(os.getenv("RATE_CACHE_TIMEOUT", 3600)),
+    },
+}
+
+# HTTP connection pool shared by the provider instances of a process.
+PROVIDER_HTTP = {
+    "pool_connections": int(os.getenv("PROVIDER_HTTP_POOL_CONNECTIONS", 4)),
+    "pool_maxsize": int(os.getenv("PROVIDER_HTTP_POOL_MAXSIZE", 16)),
+    "keep_alive": os.getenv("PROVIDER_HTTP_KEEP_ALIVE", "True") == "True",
+    "max_retries": int(os.getenv("PROVIDER_HTTP_MAX_RETRIES", 2)),
+    "backoff_factor": float(os.getenv("PROVIDER_HTTP_BACKOFF_FACTOR", 0.2)),
+}
+
+# Thread pool fetching the dates of providers without time series. Mock reads the
+# database, so its calls are not run in parallel.
+PROVIDER_FETCH = {
+    "max_workers": int(os.getenv("PROVIDER_FETCH_MAX_WORKERS", 8)),
+    "max_concurrency": {
+        "Fixer": int(os.getenv("FIXER_MAX_CONCURRENCY", 4)),
+        "Mock": 1,
+    },
+}
+
+# Providers are skipped after consecutive failures until the recovery timeout (seconds)
+# elapses; failed (provider, date) lookups are not retried for the negative cache TTL.
+PROVIDER_CIRCUIT_BREAKER = {
+    "failure_threshold": int(os.getenv("PROVIDER_FAILURE_THRESHOLD", 3)),
+    "recovery_timeout": int(os.getenv("PROVIDER_RECOVERY_TIMEOUT", 30)),
+    "negative_cache_ttl": int(os.getenv("PROVIDER_NEGATIVE_CACHE_TTL", 60)),
+}
+
+# Currency whose rate vector is stored once per valuation date to derive cross rates.
+CROSS_RATE_BASE_CURRENCY = os.getenv("CROSS_RATE_BASE_CURRENCY", "EUR")
+
+# Process-local cache of the latest exchange rates served by the converter.
+LATEST_RATE_CACHE = {
+    "max_entries": int(os.getenv("LATEST_RATE_CACHE_MAX_ENTRIES", 1024)),
+    "ttl": int(os.getenv("LATEST_RATE_CACHE_TTL", 300)),
+}
+
 if "test" in sys.argv:
     DATABASES["default"] = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
     }
+    # Cached rates are not rolled back with test transactions.
+    LATEST_RATE_CACHE = {"max_entries": 0, "ttl": 0}
+    CACHES["rates"] = {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    # The source/date index includes non-key columns on PostgreSQL only.
+    SILENCED_SYSTEM_CHECKS = ["models.W040"]
 
 
 # Password validation
@@ -145,6 +211,10 @@ LOGGING = {
             "format": "{levelname} {asctime} {module} {message}",
             "style": "{",
         },
+        "json": {
+            "format": "{message}",
+            "style": "{",
+        },
     },
     "handlers": {
         "console": {
@@ -152,6 +222,10 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        "metrics": {
+            "class": "logging.StreamHandler",
+            "formatter": "json",
+        },
     },
     "loggers": {
         "django": {
@@ -162,5 +236,16 @@ LOGGING = {
             "handlers": ["console"],
             "level": "DEBUG",
         },
+        # One JSON line with the query, provider and cache metrics of each request,
+        # silenced while testing
+        "MyCurrencyApp.monitoring": {
+            "handlers": ["metrics"],
+            "level": (
+                "WARNING"
+                if "test" in sys.argv
+                else os.getenv("REQUEST_METRICS_LOG_LEVEL", "INFO")
+            ),
+            "propagate": False,
+        },
     },
 }
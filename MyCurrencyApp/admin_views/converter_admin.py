@@ -3,7 +3,7 @@ from django.urls import path
 from django.shortcuts import render
 from django.contrib import admin
 from ..forms.converter_form import CurrencyConverterForm
-from ..helper.get_create_exchange_rate import get_or_create_exchange_rate
+from ..helper.get_batch_exchange_rates import get_or_create_exchange_rates
 
 
 class ConverterAdmin(admin.ModelAdmin):
@@ -33,6 +33,7 @@ class ConverterAdmin(admin.ModelAdmin):
         """
         Handles requests to the custom currency converter view.
         Displays a form for currency conversion and processes the conversion logic.
+        The rates of all target currencies are resolved in a single batch.
 
         Args:
             request (HttpRequest): The HTTP request object.
@@ -49,10 +50,17 @@ class ConverterAdmin(admin.ModelAdmin):
             amount = form.cleaned_data["amount"]
 
             conversion_result = {}
+            exchange_rates = get_or_create_exchange_rates(
+                [
+                    (source_currency.code, target_currency.code)
+                    for target_currency in target_currencies
+                    if target_currency.code != source_currency.code
+                ]
+            )
 
             for target_currency in target_currencies:
-                exchange_rate = get_or_create_exchange_rate(
-                    source_currency, target_currency
+                exchange_rate = exchange_rates.get(
+                    (source_currency.code, target_currency.code)
                 )
 
                 if exchange_rate or target_currency.code == source_currency.code:
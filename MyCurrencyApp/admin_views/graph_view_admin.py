@@ -4,10 +4,11 @@ from django.shortcuts import render
 from django.http import JsonResponse
 from datetime import datetime
 
+from ..cache.currency_ids import currency_ids
 from ..forms.converter_form import CurrencyExchangeRateForm
 from ..helper.get_currency_rates import get_currency_rates_data
-from ..models import Currency
-from ..utils import format_data_for_chart
+from ..helper.rate_matrix import load_rate_matrices
+from ..utils import format_data_for_chart, get_date_range
 
 
 class ExchangeRateGraphAdmin(admin.ModelAdmin):
@@ -57,6 +58,8 @@ class ExchangeRateGraphAdmin(admin.ModelAdmin):
     def exchange_rate_all_currencies(self, request):
         """
         Fetches and returns exchange rate data for all currencies based on the specified date range.
+        Rates are read from the rate matrices of the range; only source currencies with
+        gaps go through get_currency_rates_data to fetch the missing dates.
 
         Args:
             request (HttpRequest): The HTTP request object containing start_date and end_date parameters.
@@ -73,11 +76,25 @@ class ExchangeRateGraphAdmin(admin.ModelAdmin):
         except (ValueError, TypeError):
             return JsonResponse({"error": "Invalid date format"}, status=400)
 
-        source_currencies = Currency.objects.values_list("code", flat=True).distinct()
+        source_currencies = sorted(currency_ids.get_codes().values())
         response_data = {}
 
         date_format = "%Y-%m-%d"
+        valuation_dates = get_date_range(
+            start_date.strftime(date_format), end_date.strftime(date_format)
+        )
+        rate_matrices = load_rate_matrices(valuation_dates, source_currencies)
+
         for source_currency in source_currencies:
+            if len(rate_matrices) == len(valuation_dates) and all(
+                rate_matrix.is_complete_for(source_currency)
+                for rate_matrix in rate_matrices.values()
+            ):
+                response_data[source_currency] = _matrix_rates_data(
+                    rate_matrices, source_currency
+                )
+                continue
+
             rates_data = get_currency_rates_data(
                 source_currency,
                 start_date.strftime(date_format),
@@ -87,3 +104,18 @@ class ExchangeRateGraphAdmin(admin.ModelAdmin):
 
         formatted_data = format_data_for_chart(response_data)
         return JsonResponse({"data": formatted_data})
+
+
+def _matrix_rates_data(rate_matrices, source_currency):
+    """
+    Formats the rates of a source currency held in rate matrices like get_currency_rates_data.
+    """
+    rates_data = {}
+    for valuation_date, rate_matrix in sorted(rate_matrices.items()):
+        for target_currency, rate_value in rate_matrix.rates_from(
+            source_currency
+        ).items():
+            rates_data.setdefault(target_currency, []).append(
+                {"rate_value": round(rate_value, 6), "valuation_date": valuation_date}
+            )
+    return rates_data
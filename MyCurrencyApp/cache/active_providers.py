@@ -0,0 +1,55 @@
+import threading
+import time
+
+from django.db import transaction
+
+from ..models import CurrencyProvider
+from .shared_rate_cache import shared_rate_cache
+
+
+class ActiveProviderList:
+    """
+    Process-wide list of the active providers in order of priority, so reading a
+    stored rate does not query the provider table first.
+
+    The list is tagged with the provider generation of the shared rate cache and
+    reloaded when another process bumps it, or after ``reload_interval`` seconds when
+    the shared cache is not shared between processes (e.g. the local memory cache).
+    """
+
+    def __init__(self, reload_interval=60):
+        self.reload_interval = reload_interval
+        self._providers = None
+        self._generation = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    def get(self):
+        """
+        Returns the active providers in order of priority.
+        """
+        generation = shared_rate_cache.provider_generation()
+        with self._lock:
+            if (
+                self._providers is None
+                or self._generation != generation
+                or time.monotonic() - self._loaded_at > self.reload_interval
+            ):
+                self._providers = list(
+                    CurrencyProvider.objects.filter(active=True).order_by("priority")
+                )
+                self._generation = generation
+                self._loaded_at = time.monotonic()
+            return self._providers
+
+    def clear(self):
+        """
+        Reloads the list in this process, and in every process sharing the rate
+        cache once the change is committed.
+        """
+        with self._lock:
+            self._providers = None
+        transaction.on_commit(shared_rate_cache.bump_providers)
+
+
+active_providers = ActiveProviderList()
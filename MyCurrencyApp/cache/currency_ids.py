@@ -0,0 +1,63 @@
+import threading
+
+from ..models import Currency
+
+
+class CurrencyIdMap:
+    """
+    Process-wide map between currency codes and ids, so rate queries filter on the
+    foreign key columns instead of joining Currency on its code.
+
+    The map is loaded at once (the currency table is small), cleared when a currency
+    is saved or deleted, and reloaded when a code is missing, e.g. a currency created
+    by another process.
+    """
+
+    def __init__(self):
+        self._ids = None
+        self._codes = None
+        self._lock = threading.Lock()
+
+    def _load(self, reload=False):
+        with self._lock:
+            if self._ids is None or reload:
+                self._ids = dict(Currency.objects.values_list("code", "id"))
+                self._codes = {
+                    currency_id: code for code, currency_id in self._ids.items()
+                }
+            return self._ids, self._codes
+
+    def get_id(self, currency_code):
+        """
+        Returns the id of a currency code, or None if the currency does not exist.
+        """
+        return self.get_ids([currency_code]).get(currency_code)
+
+    def get_ids(self, currency_codes):
+        """
+        Returns the ids of the existing currencies among ``currency_codes``, keyed by code.
+        """
+        ids, _ = self._load()
+        if any(code not in ids for code in currency_codes):
+            ids, _ = self._load(reload=True)
+        return {code: ids[code] for code in currency_codes if code in ids}
+
+    def get_codes(self):
+        """
+        Returns the code of every currency keyed by id.
+        """
+        return self._load()[1]
+
+    def get_code(self, currency_id):
+        codes = self.get_codes()
+        if currency_id not in codes:
+            codes = self._load(reload=True)[1]
+        return codes.get(currency_id)
+
+    def clear(self):
+        with self._lock:
+            self._ids = None
+            self._codes = None
+
+
+currency_ids = CurrencyIdMap()
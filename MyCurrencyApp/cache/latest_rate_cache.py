@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from ..monitoring.request_metrics import record_cache_lookup
+
+
+class LatestRateCache:
+    """
+    Process-local cache of exchange rates keyed by (source, target, valuation date)
+    and an optional version, e.g. the generation of the pair in the shared cache.
+
+    Entries expire after ``ttl`` seconds and the least recently used entry is
+    evicted once ``max_entries`` is reached. A ``max_entries`` of 0 disables the cache.
+    """
+
+    def __init__(self, max_entries=1024, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        source_currency_code, target_currency_code, valuation_date, version=None
+    ):
+        return (
+            source_currency_code,
+            target_currency_code,
+            str(valuation_date),
+            version,
+        )
+
+    def get(
+        self, source_currency_code, target_currency_code, valuation_date, version=None
+    ):
+        """
+        Returns the cached rate, or None if it is missing or expired.
+        """
+        key = self.make_key(
+            source_currency_code, target_currency_code, valuation_date, version
+        )
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                record_cache_lookup("local", False)
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            record_cache_lookup("local", True)
+            return entry[0]
+
+    def set(
+        self,
+        source_currency_code,
+        target_currency_code,
+        valuation_date,
+        rate,
+        version=None,
+    ):
+        if not self.max_entries or rate is None:
+            return
+
+        key = self.make_key(
+            source_currency_code, target_currency_code, valuation_date, version
+        )
+
+        with self._lock:
+            self._entries[key] = (rate, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, source_currency_code, target_currency_code):
+        """
+        Drops every cached valuation date of the given currency pair.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key in self._entries
+                if key[0] == source_currency_code and key[1] == target_currency_code
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns the hit/miss counters and the current number of entries.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
+
+
+latest_rate_cache = LatestRateCache(
+    **getattr(settings, "LATEST_RATE_CACHE", {"max_entries": 1024, "ttl": 300})
+)
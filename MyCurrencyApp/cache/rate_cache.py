@@ -0,0 +1,68 @@
+from django.db import transaction
+
+from .latest_rate_cache import latest_rate_cache
+from .shared_rate_cache import shared_rate_cache
+
+
+def get_cached_latest_rate(source_currency_code, target_currency_code, valuation_date):
+    """
+    Looks a rate up in the process-local cache, then in the shared cache.
+
+    Returns:
+        tuple: The cached rate (or None) and the generation of the currency pair,
+            which must be passed back to ``cache_latest_rate``.
+    """
+    generation = shared_rate_cache.generation(
+        source_currency_code, target_currency_code
+    )
+    rate = latest_rate_cache.get(
+        source_currency_code, target_currency_code, valuation_date, generation
+    )
+    if rate is not None:
+        return rate, generation
+
+    rate = shared_rate_cache.get(
+        "latest", generation, source_currency_code, target_currency_code, valuation_date
+    )
+    if rate is not None:
+        latest_rate_cache.set(
+            source_currency_code,
+            target_currency_code,
+            valuation_date,
+            rate,
+            generation,
+        )
+    return rate, generation
+
+
+def cache_latest_rate(
+    source_currency_code, target_currency_code, valuation_date, generation, rate
+):
+    """
+    Stores a rate read under ``generation`` in both cache layers.
+    """
+    latest_rate_cache.set(
+        source_currency_code, target_currency_code, valuation_date, rate, generation
+    )
+    shared_rate_cache.set(
+        "latest",
+        generation,
+        source_currency_code,
+        target_currency_code,
+        valuation_date,
+        value=rate,
+    )
+
+
+def invalidate_pair(source_currency_code, target_currency_code):
+    """
+    Supersedes the cached rates of a currency pair in this and every other worker once
+    the current transaction commits, so readers cannot cache rates of the pair that
+    are not committed yet, and rolled back writes leave the cache untouched.
+    """
+
+    def invalidate():
+        latest_rate_cache.invalidate(source_currency_code, target_currency_code)
+        shared_rate_cache.bump(source_currency_code, target_currency_code)
+
+    transaction.on_commit(invalidate)
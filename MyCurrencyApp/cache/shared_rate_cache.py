@@ -0,0 +1,121 @@
+import time
+
+from django.core.cache import caches
+
+from ..monitoring.request_metrics import record_cache_lookup
+
+
+class SharedRateCache:
+    """
+    Rate cache shared by every worker, built on the Django cache configured as ``alias``.
+
+    Cached values are keyed by a generation counter of the currency pair (and of the
+    source currency for multi-target values). Writers bump the counters, which makes
+    every value cached under an older generation unreachable for all workers.
+
+    Cached rates may be derived from the inverse pair or from the base currency
+    vector, so the generation of a pair also includes the counters of its inverse
+    pair and of the base currency, and the generation of a source includes the
+    counter of the base currency.
+    """
+
+    key_prefix = "rates"
+
+    def __init__(self, alias="rates"):
+        self.alias = alias
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def _generation_key(self, source_currency_code, target_currency_code="*"):
+        return f"{self.key_prefix}:gen:{source_currency_code}:{target_currency_code}"
+
+    def _get_generation(self, key):
+        generation = self.cache.get(key)
+        if generation is None:
+            # A missing counter (never set or evicted) starts from a fresh value so
+            # values cached under an evicted generation can never be matched again.
+            self.cache.add(key, time.time_ns(), timeout=None)
+            generation = self.cache.get(key, time.time_ns())
+        return generation
+
+    def _get_generations(self, keys):
+        keys = list(dict.fromkeys(keys))
+        generations = self.cache.get_many(keys)
+        return ".".join(
+            str(generations[key] if key in generations else self._get_generation(key))
+            for key in keys
+        )
+
+    def generation(self, source_currency_code, target_currency_code):
+        return self._get_generations(
+            [
+                self._generation_key(source_currency_code, target_currency_code),
+                self._generation_key(target_currency_code, source_currency_code),
+                self._generation_key(self._base_currency_code()),
+            ]
+        )
+
+    def source_generation(self, source_currency_code):
+        return self._get_generations(
+            [
+                self._generation_key(source_currency_code),
+                self._generation_key(self._base_currency_code()),
+            ]
+        )
+
+    @staticmethod
+    def _base_currency_code():
+        from ..helper.cross_rates import get_base_currency_code
+
+        return get_base_currency_code()
+
+    def provider_generation(self):
+        """
+        Returns the generation of the active providers, for process-local copies.
+        """
+        return self._get_generations([f"{self.key_prefix}:gen:providers"])
+
+    def bump(self, source_currency_code, target_currency_code):
+        """
+        Supersedes every value cached for the currency pair and its source currency.
+        """
+        self._bump(self._generation_key(source_currency_code, target_currency_code))
+        self._bump(self._generation_key(source_currency_code))
+
+    def bump_providers(self):
+        """
+        Supersedes the process-local copies of the active providers in every worker.
+        """
+        self._bump(f"{self.key_prefix}:gen:providers")
+
+    def _bump(self, key):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.add(key, time.time_ns(), timeout=None)
+
+    def get(self, name, generation, *parts):
+        value = self.cache.get(self._value_key(name, generation, parts))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        record_cache_lookup("shared", value is not None)
+        return value
+
+    def set(self, name, generation, *parts, value):
+        if value is not None:
+            self.cache.set(self._value_key(name, generation, parts), value)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _value_key(self, name, generation, parts):
+        return ":".join([self.key_prefix, name, str(generation), *map(str, parts)])
+
+
+shared_rate_cache = SharedRateCache()
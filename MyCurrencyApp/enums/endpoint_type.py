@@ -7,3 +7,4 @@ class EndpointType(Enum):
     """
 
     LATEST = "latest"
+    TIMESERIES = "timeseries"
@@ -0,0 +1,20 @@
+class IsoCurrencies:
+    """
+    ISO 4217 currency codes, most traded first, used to generate production-sized
+    rate tables.
+    """
+
+    CODES = """
+        EUR USD GBP CHF JPY CAD AUD NZD SEK NOK DKK CNY HKD SGD KRW
+        INR BRL MXN ZAR PLN AED AFN ALL AMD ANG AOA ARS AWG AZN BAM
+        BBD BDT BGN BHD BIF BMD BND BOB BOV BSD BTN BWP BYN BZD CDF
+        CLF CLP COP COU CRC CUC CUP CVE CZK DJF DOP DZD EGP ERN ETB
+        FJD FKP GEL GHS GIP GMD GNF GTQ GYD HNL HRK HTG HUF IDR ILS
+        IQD IRR ISK JMD JOD KES KGS KHR KMF KPW KWD KYD KZT LAK LBP
+        LKR LRD LSL LTL LVL LYD MAD MDL MGA MKD MMK MNT MOP MRO MRU
+        MUR MVR MWK MXV MYR MZN NAD NGN NIO NPR OMR PAB PEN PGK PHP
+        PKR PYG QAR RON RSD RUB RWF SAR SBD SCR SDG SHP SLE SLL SOS
+        SRD SSP STD STN SVC SYP SZL THB TJS TMT TND TOP TRY TTD TWD
+        TZS UAH UGX USN UYI UYU UZS VEF VES VND VUV WST XAF XCD XOF
+        XPF YER ZMK ZMW ZWL
+    """.split()
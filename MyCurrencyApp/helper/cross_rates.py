@@ -0,0 +1,190 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import Q
+
+from ..cache.currency_ids import currency_ids
+from ..models import Currency, CurrencyExchangeRate
+from ..utils import bulk_update_exchange_rates
+
+RATE_PRECISION = Decimal("0.000001")
+
+
+def get_base_currency_code():
+    """
+    Returns the currency whose rate vector is stored once per valuation date and
+    used to derive every other currency pair.
+    """
+    return getattr(settings, "CROSS_RATE_BASE_CURRENCY", "EUR")
+
+
+def derive_rate(base_rates, source_currency_code, target_currency_code):
+    """
+    Derives a cross rate from a base currency vector.
+
+    Args:
+        base_rates (dict): Rates of the base currency keyed by currency code.
+        source_currency_code (str): The code of the source currency.
+        target_currency_code (str): The code of the target currency.
+
+    Returns:
+        Decimal or None: The cross rate, or None if the vector lacks one of the currencies.
+    """
+    base_currency_code = get_base_currency_code()
+    base_rates = {**base_rates, base_currency_code: Decimal(1)}
+
+    source_rate = base_rates.get(source_currency_code)
+    target_rate = base_rates.get(target_currency_code)
+    if not source_rate or not target_rate:
+        return None
+
+    return (Decimal(target_rate) / Decimal(source_rate)).quantize(RATE_PRECISION)
+
+
+def get_cross_rate(source_currency_code, target_currency_code, valuation_date):
+    """
+    Retrieves the rate of a currency pair for a valuation date with a single query.
+    A stored direct-pair rate wins; otherwise the rate is derived from the stored
+    base currency vector.
+
+    Args:
+        source_currency_code (str): The code of the source currency.
+        target_currency_code (str): The code of the target currency.
+        valuation_date (date): The valuation date.
+
+    Returns:
+        Decimal or None: The exchange rate, or None if it can't be derived.
+    """
+    base_currency_code = get_base_currency_code()
+    ids = currency_ids.get_ids(
+        [source_currency_code, target_currency_code, base_currency_code]
+    )
+    source_currency_id = ids.get(source_currency_code)
+    target_currency_id = ids.get(target_currency_code)
+    base_currency_id = ids.get(base_currency_code)
+
+    rows = CurrencyExchangeRate.objects.filter(
+        Q(
+            source_currency_id=source_currency_id,
+            target_currency_id=target_currency_id,
+        )
+        | Q(
+            source_currency_id=base_currency_id,
+            target_currency_id__in=[source_currency_id, target_currency_id],
+        ),
+        valuation_date=valuation_date,
+    ).values_list("source_currency_id", "target_currency_id", "rate_value")
+
+    base_rates = {}
+    for row_source_id, row_target_id, rate_value in rows:
+        if row_source_id == source_currency_id:
+            if row_target_id == target_currency_id:
+                return rate_value
+        if row_source_id == base_currency_id:
+            base_rates[currency_ids.get_code(row_target_id)] = rate_value
+
+    return derive_rate(base_rates, source_currency_code, target_currency_code)
+
+
+def get_cross_rates_for_dates(source_currency_code, valuation_dates):
+    """
+    Derives the rates of a source currency against every currency of the stored base
+    currency vectors, for each of the given valuation dates, with a single query.
+
+    Args:
+        source_currency_code (str): The code of the source currency.
+        valuation_dates (list): Dates in "YYYY-MM-DD" format.
+
+    Returns:
+        dict: Derived rates organized by target currency, in the same format as
+            ``get_currency_rates_data``.
+    """
+    base_currency_code = get_base_currency_code()
+    if source_currency_code == base_currency_code or not valuation_dates:
+        return {}
+
+    currency_codes = currency_ids.get_codes()
+    base_rates_by_date = {}
+    for valuation_date, target_currency_id, rate_value in (
+        CurrencyExchangeRate.objects.filter(
+            source_currency_id=currency_ids.get_id(base_currency_code),
+            valuation_date__in=valuation_dates,
+        )
+        # Rates of higher priority providers come last and overwrite the others
+        .order_by("valuation_date", "-provider__priority").values_list(
+            "valuation_date", "target_currency_id", "rate_value"
+        )
+    ):
+        base_rates_by_date.setdefault(valuation_date, {})[
+            currency_codes.get(target_currency_id)
+        ] = rate_value
+
+    response_data = {}
+    for valuation_date, base_rates in base_rates_by_date.items():
+        if source_currency_code not in base_rates:
+            continue
+
+        for target_currency_code in [base_currency_code, *base_rates]:
+            if target_currency_code == source_currency_code:
+                continue
+            response_data.setdefault(target_currency_code, []).append(
+                {
+                    "rate_value": derive_rate(
+                        base_rates, source_currency_code, target_currency_code
+                    ),
+                    "valuation_date": valuation_date,
+                }
+            )
+
+    return response_data
+
+
+def save_base_rates(data, valuation_date, provider):
+    """
+    Persists the base currency vector returned alongside adjusted provider rates, so
+    that later lookups of any pair on that date can be derived without a provider call.
+
+    Args:
+        data (dict): Provider response containing "base_currency" and "base_rates".
+        valuation_date (date): The date of the rates.
+        provider (CurrencyProvider): The provider of the rates.
+    """
+    base_rates = data.get("base_rates") if data else None
+    if not base_rates:
+        return
+
+    currencies = Currency.objects.in_bulk(
+        [data["base_currency"], *base_rates], field_name="code"
+    )
+    bulk_update_exchange_rates(
+        get_base_rate_rows(data, valuation_date, provider, currencies)
+    )
+
+
+def get_base_rate_rows(data, valuation_date, provider, currencies):
+    """
+    Builds the rows of bulk_update_exchange_rates for the base currency vector of a
+    provider response.
+
+    Args:
+        data (dict): Provider response containing "base_currency" and "base_rates".
+        valuation_date (date): The date of the rates.
+        provider (CurrencyProvider): The provider of the rates.
+        currencies (dict): Currency objects keyed by code.
+
+    Returns:
+        list: (base_currency, target_currency, valuation_date, rate_value, provider) tuples.
+    """
+    base_rates = data.get("base_rates") if data else None
+    base_currency = currencies.get(data.get("base_currency")) if base_rates else None
+    if not base_currency:
+        return []
+
+    rows = []
+    for target_currency_code, rate_value in base_rates.items():
+        target_currency = currencies.get(target_currency_code)
+        if rate_value and target_currency and target_currency != base_currency:
+            rows.append(
+                (base_currency, target_currency, valuation_date, rate_value, provider)
+            )
+    return rows
@@ -0,0 +1,255 @@
+import logging
+from datetime import datetime
+from decimal import Decimal
+
+from django.utils.timezone import now
+
+from ..cache.currency_ids import currency_ids
+from ..cache.rate_cache import cache_latest_rate, get_cached_latest_rate
+from ..enums.endpoint_type import EndpointType
+from ..models import (
+    Currency,
+    CurrencyExchangeRate,
+    CurrencyProvider,
+    LatestExchangeRate,
+)
+from ..providers.circuit_breaker import guarded_fetch
+from ..providers.single_flight import advisory_lock, provider_fetches
+from ..utils import bulk_update_exchange_rates, get_provider_instance
+from .cross_rates import get_base_currency_code, get_base_rate_rows
+from .rate_matrix import RateMatrix
+
+
+def get_or_create_exchange_rates(currency_pairs):
+    """
+    Retrieves the latest exchange rates of many currency pairs at once.
+    Cached rates are served without touching the database, the remaining pairs are
+    resolved with a single query (direct-pair rows first, then the stored base currency
+    vector) and pairs still missing are fetched with at most one provider call per
+    source currency.
+
+    Args:
+        currency_pairs (list): (source_currency_code, target_currency_code) tuples.
+
+    Returns:
+        dict: The exchange rate (Decimal or None) keyed by (source, target) tuple.
+    """
+    valuation_date = now().date()
+    exchange_rates = {}
+    generations = {}
+
+    for source_currency_code, target_currency_code in set(currency_pairs):
+        if source_currency_code == target_currency_code:
+            exchange_rates[(source_currency_code, target_currency_code)] = Decimal(1)
+            continue
+
+        rate_value, generation = get_cached_latest_rate(
+            source_currency_code, target_currency_code, valuation_date
+        )
+        if rate_value is not None:
+            exchange_rates[(source_currency_code, target_currency_code)] = rate_value
+        else:
+            generations[(source_currency_code, target_currency_code)] = generation
+
+    if not generations:
+        return exchange_rates
+
+    stored_rates = _get_stored_rates(list(generations), valuation_date)
+    missing_pairs = []
+
+    for pair, generation in generations.items():
+        rate_value = stored_rates.get(pair)
+        if rate_value:
+            exchange_rates[pair] = rate_value
+            cache_latest_rate(*pair, valuation_date, generation, rate_value)
+        else:
+            missing_pairs.append(pair)
+
+    if missing_pairs:
+        exchange_rates.update(fetch_and_save_latest_rates(missing_pairs))
+
+    return exchange_rates
+
+
+def convert_amounts(conversions):
+    """
+    Converts many amounts at once.
+
+    Args:
+        conversions (list): (source_currency_code, target_currency_code, amount) tuples.
+
+    Returns:
+        list: One dictionary per conversion, in the order of ``conversions``, with the
+            exchange rate and converted amount (both None if the rate is not available).
+    """
+    exchange_rates = get_or_create_exchange_rates(
+        [(source, target) for source, target, _ in conversions]
+    )
+
+    results = []
+    for source_currency_code, target_currency_code, amount in conversions:
+        exchange_rate = exchange_rates.get((source_currency_code, target_currency_code))
+        results.append(
+            {
+                "source_currency": source_currency_code,
+                "target_currency": target_currency_code,
+                "exchange_rate": exchange_rate,
+                "amount": amount,
+                "converted_amount": (
+                    Decimal(amount) * exchange_rate if exchange_rate else None
+                ),
+            }
+        )
+    return results
+
+
+def _get_stored_rates(currency_pairs, valuation_date):
+    """
+    Resolves the rates of the given pairs for a valuation date with a single query of
+    the LatestExchangeRate table.
+    Direct-pair rows win over inverse rates and rates derived from the base currency
+    vector.
+
+    Returns:
+        dict: The exchange rate keyed by (source, target) tuple, for resolvable pairs only.
+    """
+    base_currency_code = get_base_currency_code()
+    source_codes = {source for source, _ in currency_pairs}
+    currency_codes = source_codes | {target for _, target in currency_pairs}
+
+    ids = currency_ids.get_ids(currency_codes | {base_currency_code})
+    codes = currency_ids.get_codes()
+    rows = (
+        (codes.get(source_currency_id), codes.get(target_currency_id), rate_value)
+        for source_currency_id, target_currency_id, rate_value in (
+            LatestExchangeRate.objects.filter(
+                source_currency_id__in=[
+                    ids[code]
+                    for code in source_codes | {base_currency_code}
+                    if code in ids
+                ],
+                target_currency_id__in=list(ids.values()),
+                valuation_date=valuation_date,
+                provider__active=True,
+            )
+            .order_by("-provider__priority", "updated_at")
+            .values_list("source_currency_id", "target_currency_id", "rate_value")
+        )
+    )
+
+    matrix = RateMatrix.from_rows(
+        valuation_date, sorted(currency_codes | {base_currency_code}), rows
+    )
+
+    stored_rates = {}
+    for pair in currency_pairs:
+        rate_value = matrix.decimal_rate(*pair)
+        if rate_value:
+            stored_rates[pair] = rate_value
+    return stored_rates
+
+
+def fetch_and_save_latest_rates(currency_pairs):
+    """
+    Fetches the latest rates of the given pairs from the active providers, with one call
+    per source currency and provider, and saves them in the database.
+
+    Returns:
+        dict: The exchange rate (Decimal or None) keyed by (source, target) tuple.
+    """
+    targets_by_source = {}
+    for source_currency_code, target_currency_code in currency_pairs:
+        targets_by_source.setdefault(source_currency_code, set()).add(
+            target_currency_code
+        )
+
+    source_currencies = Currency.objects.in_bulk(
+        list(targets_by_source), field_name="code"
+    )
+    providers = CurrencyProvider.objects.filter(active=True).order_by("priority")
+    exchange_rates = {pair: None for pair in currency_pairs}
+
+    for source_currency_code, target_currency_codes in targets_by_source.items():
+        source_currency = source_currencies.get(source_currency_code)
+        if not source_currency:
+            continue
+
+        for provider in providers:
+            try:
+                rates = fetch_latest_rates(source_currency, provider)
+
+                for target_currency_code in target_currency_codes:
+                    rate_value = rates.get(target_currency_code)
+                    if rate_value:
+                        exchange_rates[(source_currency_code, target_currency_code)] = (
+                            round(Decimal(rate_value), 3)
+                        )
+
+                if rates:
+                    break
+
+            except Exception as e:
+                logging.error(f"Error fetching from provider {provider.name}: {e}")
+                continue
+
+    return exchange_rates
+
+
+def fetch_latest_rates(source_currency, provider):
+    """
+    Fetches today's rates of a source currency from a provider and saves them.
+    Concurrent fetches of the same (provider, source currency, date) are coalesced: one
+    in-flight fetch per process, serialized across processes by a database lock, and
+    waiters receive the leader's rates. The lock is not a transaction: only saving the
+    rates is, so the provider call does not keep a transaction open.
+
+    Args:
+        source_currency (Currency): The source currency.
+        provider (CurrencyProvider): The provider to fetch from.
+
+    Returns:
+        dict: The rates of the source currency keyed by target currency code.
+    """
+    key = ("latest", provider.name, source_currency.code, datetime.now().date())
+    return provider_fetches.do(
+        key, lambda: _fetch_and_save_latest_rates(key, source_currency, provider)
+    )
+
+
+def _fetch_and_save_latest_rates(key, source_currency, provider):
+    with advisory_lock(key):
+        # Another process may have saved the rates while this one waited for the lock.
+        codes = currency_ids.get_codes()
+        stored_rates = {
+            codes.get(target_currency_id): rate_value
+            for target_currency_id, rate_value in CurrencyExchangeRate.objects.filter(
+                source_currency=source_currency,
+                provider=provider,
+                valuation_date=key[-1],
+            ).values_list("target_currency_id", "rate_value")
+        }
+        if stored_rates:
+            return stored_rates
+
+        provider_instance = get_provider_instance(provider, provider.url)
+        provider_instance.set_url(provider.url, EndpointType.LATEST.value)
+        data = guarded_fetch(
+            provider,
+            (source_currency.code, "", key[-1]),
+            lambda: provider_instance.get_exchange_rate_data(
+                source_currency.code, "", ""
+            ),
+        )
+        rates = data.get("rates", {}) if data else {}
+
+        currencies = Currency.objects.in_bulk(field_name="code")
+        rows = get_base_rate_rows(data, key[-1], provider, currencies)
+        for target_currency_code, rate_value in rates.items():
+            target_currency = currencies.get(target_currency_code)
+            if rate_value and target_currency and target_currency != source_currency:
+                rows.append(
+                    (source_currency, target_currency, key[-1], rate_value, provider)
+                )
+        bulk_update_exchange_rates(rows)
+
+        return rates
@@ -1,19 +1,26 @@
 import logging
-from datetime import datetime
 from decimal import Decimal
 
 from django.utils.timezone import now
 
-from ..enums.endpoint_type import EndpointType
-from ..models import Currency, CurrencyExchangeRate, CurrencyProvider
-from ..utils import get_provider_instance, update_exchange_rate_activity
+from ..cache.active_providers import active_providers
+from ..cache.rate_cache import cache_latest_rate, get_cached_latest_rate
+from ..models import Currency
+from .get_batch_exchange_rates import fetch_latest_rates
+from .latest_rates import get_latest_rate
 
 
 def get_or_create_exchange_rate(source_currency_code, target_currency_code):
     """
     Retrieves the latest exchange rate between the source and target currencies.
+    Rates already served today are answered from the process-local or shared rate
+    cache without touching the database.
+    Otherwise the current rate is read from LatestExchangeRate with a single primary
+    key lookup, or derived from the stored base currency vector of the day. The
+    currencies are only loaded when the rate has to be fetched.
     If the exchange rate is not available in the database, it attempts to fetch it
     from an active currency provider. The rate is then saved in the database.
+    Concurrent fetches of the same source currency share a single provider call.
 
     Args:
         source_currency_code (str): The code of the source currency.
@@ -22,40 +29,37 @@ def get_or_create_exchange_rate(source_currency_code, target_currency_code):
     Returns:
         Decimal or None: The exchange rate if found or fetched successfully, otherwise None.
     """
-    source_currency = Currency.objects.get(code=source_currency_code)
-    target_currency = Currency.objects.get(code=target_currency_code)
+    valuation_date = now().date()
+    cached_rate, generation = get_cached_latest_rate(
+        source_currency_code, target_currency_code, valuation_date
+    )
+    if cached_rate is not None:
+        return cached_rate
 
-    exchange_rate = CurrencyExchangeRate.objects.filter(
-        source_currency__code=source_currency.code,
-        target_currency__code=target_currency.code,
-        active=True,
-        valuation_date=now().date(),
-    ).first()
+    providers = active_providers.get()
+    rate_value = get_latest_rate(
+        source_currency_code, target_currency_code, valuation_date, providers
+    )
 
-    if exchange_rate:
-        return exchange_rate.rate_value
+    if rate_value:
+        cache_latest_rate(
+            source_currency_code,
+            target_currency_code,
+            valuation_date,
+            generation,
+            rate_value,
+        )
+        return rate_value
 
-    providers = CurrencyProvider.objects.filter(active=True).order_by("priority")
+    source_currency = Currency.objects.get(code=source_currency_code)
+    target_currency = Currency.objects.get(code=target_currency_code)
 
     for provider in providers:
         try:
-            provider_instance = get_provider_instance(provider, provider.url)
-            provider_instance.set_url(provider.url, EndpointType.LATEST.value)
-            data = provider_instance.get_exchange_rate_data(
-                source_currency.code, target_currency.code, ""
-            )
-            if data and data.get("rates", []):
-                rates = data.get("rates", [])
-                rate_value = rates[target_currency.code]
-                if rate_value:
-                    update_exchange_rate_activity(
-                        source_currency,
-                        target_currency,
-                        rate_value,
-                        datetime.now(),
-                        provider,
-                    )
-                    return round(Decimal(rate_value), 3)
+            rates = fetch_latest_rates(source_currency, provider)
+            rate_value = rates.get(target_currency.code)
+            if rate_value:
+                return round(Decimal(rate_value), 3)
 
         except Exception as e:
             logging.error(f"Error fetching from provider {provider.name}: {e}")
@@ -1,13 +1,20 @@
 import logging
 
-from ..models import CurrencyExchangeRate, CurrencyProvider, Currency
-from ..utils import get_date_range, get_provider_instance, update_exchange_rate_activity
+from ..cache.shared_rate_cache import shared_rate_cache
+from ..models import CurrencyProvider, Currency
+from ..utils import bulk_update_exchange_rates, get_date_range, get_provider_instance
+from .cross_rates import get_base_rate_rows, get_cross_rates_for_dates
+from .provider_rates import fetch_provider_rates
+from .rate_rows import get_rate_rows
 
 
 def get_currency_rates_data(source_currency_code, date_from, date_to):
     """
     Retrieves exchange rate data for a specified source currency and date range.
-    If rates for some dates are missing, they are fetched from external providers.
+    If rates for some dates are missing, they are derived from the stored base currency
+    vectors or, failing that, fetched from external providers.
+    Complete results are shared between workers through the rate cache until a new
+    rate of the source currency is written.
 
     Args:
         source_currency_code (str): The code of the source currency.
@@ -17,37 +24,73 @@ def get_currency_rates_data(source_currency_code, date_from, date_to):
     Returns:
         dict: A dictionary containing exchange rate data, organized by target currency.
     """
+    generation = shared_rate_cache.source_generation(source_currency_code)
+    cached_data = shared_rate_cache.get(
+        "range", generation, source_currency_code, date_from, date_to
+    )
+    if cached_data is not None:
+        return cached_data
+
     valuation_dates = get_date_range(date_from, date_to)
 
-    existing_rates = CurrencyExchangeRate.objects.filter(
-        source_currency__code=source_currency_code,
-        valuation_date__range=[date_from, date_to],
-    ).order_by("valuation_date")
     response_data = {}
 
-    for rate in existing_rates:
-        if rate.target_currency.code not in response_data:
-            response_data[rate.target_currency.code] = []
-        response_data[rate.target_currency.code].append(
-            {"rate_value": rate.rate_value, "valuation_date": rate.valuation_date}
+    for target_currency_code, valuation_date, rate_value in get_rate_rows(
+        source_currency_code, date_from, date_to
+    ):
+        response_data.setdefault(target_currency_code, []).append(
+            {"rate_value": rate_value, "valuation_date": valuation_date}
         )
 
     existing_dates = set(
-        rate.valuation_date.strftime("%Y-%m-%d") for rate in existing_rates
+        rate["valuation_date"].strftime("%Y-%m-%d")
+        for rates in response_data.values()
+        for rate in rates
     )
     missing_dates = [date for date in valuation_dates if date not in existing_dates]
 
     if missing_dates:
-        response_data.update(
-            _fetch_and_save_from_providers(source_currency_code, missing_dates)
-        )
+        derived_data = get_cross_rates_for_dates(source_currency_code, missing_dates)
+        for target_currency_code, rates in derived_data.items():
+            response_data.setdefault(target_currency_code, []).extend(rates)
+            existing_dates.update(
+                rate["valuation_date"].strftime("%Y-%m-%d") for rate in rates
+            )
+        missing_dates = [date for date in missing_dates if date not in existing_dates]
 
+    if missing_dates:
+        fetched_data = _fetch_and_save_from_providers(
+            source_currency_code, missing_dates
+        )
+        for target_currency_code, rates in fetched_data.items():
+            response_data.setdefault(target_currency_code, []).extend(rates)
+            existing_dates.update(str(rate["valuation_date"]) for rate in rates)
+        missing_dates = [date for date in missing_dates if date not in existing_dates]
+
+    # Derived and fetched rates were added after the stored ones
+    for rates in response_data.values():
+        rates.sort(key=lambda rate: str(rate["valuation_date"]))
+
+    # Ranges missing dates (e.g. after a provider failure) are fetched again next time
+    if not missing_dates:
+        shared_rate_cache.set(
+            "range",
+            generation,
+            source_currency_code,
+            date_from,
+            date_to,
+            value=response_data,
+        )
     return response_data
 
 
 def _fetch_and_save_from_providers(source_currency_code, missing_dates):
     """
     Retrieves exchange rates for missing dates from active providers and saves them to the database.
+    Providers supporting time series are called once per run of consecutive dates, the
+    others once per date in parallel. The rates of each provider are saved with one
+    bulk upsert, and dates a provider could not return are tried with the next one.
+    Providers with an open circuit are skipped, as are dates that failed recently.
 
     Args:
         source_currency_code (str): The code of the source currency.
@@ -58,35 +101,49 @@ def _fetch_and_save_from_providers(source_currency_code, missing_dates):
     """
     response_data = {}
     providers = CurrencyProvider.objects.filter(active=True).order_by("priority")
+    currencies = Currency.objects.in_bulk(field_name="code")
 
     for provider in providers:
+        if not missing_dates:
+            break
+
         try:
             provider_instance = get_provider_instance(provider, provider.url)
-
-            for valuation_date in missing_dates:
-                provider_instance.set_url(provider.url, valuation_date)
-                data = provider_instance.get_exchange_rate_data(
-                    source_currency_code, "", valuation_date
+            fetched_data = [
+                data
+                for data in fetch_provider_rates(
+                    provider, provider_instance, source_currency_code, "", missing_dates
                 )
-                rates = data.get("rates", {})
-
-                if data and rates:
-                    for target_currency in rates:
-                        rate_value = rates[target_currency]
-                        if target_currency not in response_data:
-                            response_data[target_currency] = []
-                        response_data[target_currency].append(
-                            {
-                                "rate_value": rate_value,
-                                "valuation_date": data.get("valuation_date"),
-                            }
-                        )
-
-            if response_data:
-                _process_update_exchange_rate_activity(
-                    source_currency_code, provider, response_data
+                if data.get("rates")
+            ]
+            provider_data = {}
+
+            for data in fetched_data:
+                for target_currency, rate_value in data["rates"].items():
+                    provider_data.setdefault(target_currency, []).append(
+                        {
+                            "rate_value": rate_value,
+                            "valuation_date": data["valuation_date"],
+                        }
+                    )
+
+            rows = []
+            for data in fetched_data:
+                rows += get_base_rate_rows(
+                    data, data["valuation_date"], provider, currencies
                 )
-                break
+            rows += _get_exchange_rate_rows(
+                source_currency_code, provider, provider_data, currencies
+            )
+            bulk_update_exchange_rates(rows)
+
+            for target_currency, rates in provider_data.items():
+                response_data.setdefault(target_currency, []).extend(rates)
+
+            fetched_dates = {data["valuation_date"] for data in fetched_data}
+            missing_dates = [
+                date for date in missing_dates if date not in fetched_dates
+            ]
 
         except Exception as e:
             logging.error(f"Error fetching from provider {provider.name}: {e}")
@@ -95,29 +152,37 @@ def _fetch_and_save_from_providers(source_currency_code, missing_dates):
     return response_data
 
 
-def _process_update_exchange_rate_activity(source_currency_code, provider, new_data):
+def _get_exchange_rate_rows(source_currency_code, provider, new_data, currencies):
     """
-    Updates exchange rate activity records in the database for the given source currency,
+    Builds the rows of bulk_update_exchange_rates for the given source currency,
     provider, and new exchange rate data.
 
     Args:
         source_currency_code (str): The code of the source currency.
         provider (CurrencyProvider): The provider from which the rates were fetched.
         new_data (dict): The newly fetched exchange rate data, organized by target currency.
+        currencies (dict): Currency objects keyed by code.
+
+    Returns:
+        list: (source_currency, target_currency, valuation_date, rate_value, provider) tuples.
     """
-    source_currency = Currency.objects.get(code=source_currency_code)
+    source_currency = currencies.get(source_currency_code)
+    rows = []
 
     for target_currency_code, rates in new_data.items():
-        target_currency = Currency.objects.get(code=target_currency_code)
+        target_currency = currencies.get(target_currency_code)
+        if not source_currency or not target_currency:
+            continue
 
         for entry in rates:
-            valuation_date = entry.get("valuation_date")
-            rate_value = entry.get("rate_value")
-
-            update_exchange_rate_activity(
-                source_currency,
-                target_currency,
-                rate_value,
-                valuation_date,
-                provider,
+            rows.append(
+                (
+                    source_currency,
+                    target_currency,
+                    entry.get("valuation_date"),
+                    entry.get("rate_value"),
+                    provider,
+                )
             )
+
+    return rows
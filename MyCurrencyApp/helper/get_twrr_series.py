@@ -1,76 +1,375 @@
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
 
-from ..models import Currency, CurrencyExchangeRate, CurrencyProvider
+from ..cache.shared_rate_cache import shared_rate_cache
+from ..models import Currency, CurrencyProvider
 from ..utils import (
+    bulk_update_exchange_rates,
     get_date_range,
     get_provider_instance,
-    update_exchange_rate_activity,
+    to_date,
 )
+from .cross_rates import get_base_currency_code, get_base_rate_rows
+from .get_currency_rates import (
+    _fetch_and_save_from_providers as _fetch_and_save_source_rates,
+)
+from .provider_rates import fetch_provider_rates
+from .rate_matrix import load_rate_matrices
+from .rate_rows import get_boundary_rates, get_pair_rate_rows, get_rate_rows
+from .twrr_engine import TwrrSeries
 
 
-def calculate_twrr(source_currency_code, exchanged_currency_code, amount, start_date):
+def calculate_twrr(
+    source_currency_code,
+    exchanged_currency_code,
+    amount,
+    start_date,
+    end_date=None,
+    window=None,
+):
     """
     Retrieves historical exchange rates and calculates the Time-Weighted Rate of Return (TWRR).
+    Returns are computed over the whole series at once by TwrrSeries. With a window,
+    the rates of the window before the start date are loaded too, so the trailing
+    TWRR of every date of the period covers a full window.
 
     Args:
         source_currency_code (str): The source currency code (e.g., "USD").
         exchanged_currency_code (str): The exchanged currency code (e.g., "EUR").
         amount (float): The amount invested.
         start_date (str): The start date of the investment.
+        end_date (str, optional): The end date of the investment. Defaults to today.
+        window (int, optional): Length in days of the trailing TWRR of every date.
 
     Returns:
-        list: A list of dictionaries containing historical TWRR values.
+        list: A list of dictionaries containing historical TWRR values: the rate, the
+            return of the period ending on the date ("twrr"), the TWRR since the start
+            date ("cumulative_twrr"), the value of the amount and, with a window, the
+            TWRR of the window ending on the date ("rolling_twrr").
     """
-    valuation_dates = get_date_range(start_date, datetime.today().strftime("%Y-%m-%d"))
+    end_date = end_date or datetime.today().strftime("%Y-%m-%d")
+    rate_series = _get_rate_series(
+        source_currency_code,
+        exchanged_currency_code,
+        _get_series_start_date(start_date, window),
+        end_date,
+    )
 
-    existing_rates = CurrencyExchangeRate.objects.filter(
-        source_currency__code=source_currency_code,
-        target_currency__code=exchanged_currency_code,
-        valuation_date__gte=start_date,
-    ).order_by("valuation_date")
+    prepared_series = _prepare_twrr_series(rate_series, start_date, window)
+    if not prepared_series:
+        return None
 
-    existing_dates = set(
-        rate.valuation_date.strftime("%Y-%m-%d") for rate in existing_rates
+    twrr_series, rolling_returns = prepared_series
+    return twrr_series.to_dicts(amount, rolling_returns)
+
+
+def calculate_twrr_batch(investments, start_date, end_date=None, window=None):
+    """
+    Calculates the TWRR series of many investments over a shared period.
+    The stored rates of every pair are loaded with one query, missing dates are derived
+    from the rate matrices of those dates (one more query) and the dates still missing
+    are fetched with one grouped provider call per source currency. Returns are
+    computed once per pair and shared by the investments in that pair.
+
+    Args:
+        investments (list): (source_currency_code, exchanged_currency_code, amount) tuples.
+        start_date (str): The start date of the investments.
+        end_date (str, optional): The end date of the investments. Defaults to today.
+        window (int, optional): Length in days of the trailing TWRR of every date.
+
+    Returns:
+        list: The TWRR series of each investment, as returned by calculate_twrr (None
+            if no rate is available), in the order of ``investments``.
+    """
+    end_date = end_date or datetime.today().strftime("%Y-%m-%d")
+    currency_pairs = list(
+        dict.fromkeys((source, exchanged) for source, exchanged, _ in investments)
     )
-    missing_dates = [date for date in valuation_dates if date not in existing_dates]
+    rate_series = _get_rate_series_batch(
+        currency_pairs, _get_series_start_date(start_date, window), end_date
+    )
+    prepared_series = {
+        currency_pair: _prepare_twrr_series(
+            rate_series[currency_pair], start_date, window
+        )
+        for currency_pair in currency_pairs
+    }
 
-    if missing_dates:
-        new_rates = _fetch_and_save_from_providers(
-            source_currency_code, exchanged_currency_code, missing_dates
+    results = []
+    for source_currency_code, exchanged_currency_code, amount in investments:
+        prepared = prepared_series[(source_currency_code, exchanged_currency_code)]
+        results.append(prepared[0].to_dicts(amount, prepared[1]) if prepared else None)
+    return results
+
+
+def calculate_twrr_summary(
+    source_currency_code, exchanged_currency_code, amount, start_date, end_date=None
+):
+    """
+    Calculates the TWRR from the start date to the end date without building the series.
+    The product of the daily growth factors (1 + r1)(1 + r2)...(1 + rt) telescopes to
+    rate_t / rate_0, so the TWRR of the period only needs its first and last rates,
+    read with two index lookups. If the start or end date has no stored rate, the
+    full series is built (and missing rates derived or fetched) instead, so the
+    summary always matches the last date of the series mode.
+
+    Args:
+        source_currency_code (str): The source currency code (e.g., "USD").
+        exchanged_currency_code (str): The exchanged currency code (e.g., "EUR").
+        amount (float): The amount invested.
+        start_date (str): The start date of the investment.
+        end_date (str, optional): The end date of the investment. Defaults to today.
+
+    Returns:
+        dict: The first and last valuation dates and rates of the period, its TWRR and
+            the value of the amount on both dates, or None if no rate is available.
+    """
+    end_date = end_date or datetime.today().strftime("%Y-%m-%d")
+    boundary_rates = get_boundary_rates(
+        source_currency_code, exchanged_currency_code, start_date, end_date
+    )
+
+    stored_dates = [valuation_date.isoformat() for valuation_date, _ in boundary_rates]
+    if stored_dates != [start_date, end_date]:
+        rate_series = _get_rate_series(
+            source_currency_code, exchanged_currency_code, start_date, end_date
         )
-        existing_rates = list(existing_rates) + new_rates
+        if not rate_series:
+            return None
+        boundary_rates = [rate_series[0], rate_series[-1]]
+
+    first, last = TwrrSeries.from_rate_series(boundary_rates).to_dicts(amount)
+    return {
+        "start_date": first["valuation_date"],
+        "end_date": last["valuation_date"],
+        "start_rate": first["rate_value"],
+        "end_rate": last["rate_value"],
+        "twrr": last["cumulative_twrr"],
+        "start_amount": first["amount"],
+        "end_amount": last["amount"],
+    }
 
-    if not existing_rates:
+
+def _get_series_start_date(start_date, window):
+    """
+    Returns the first date of the rates needed for a series starting on ``start_date``,
+    a window earlier for rolling returns.
+    """
+    if not window:
+        return start_date
+    return (
+        datetime.strptime(start_date, "%Y-%m-%d") - timedelta(days=window)
+    ).strftime("%Y-%m-%d")
+
+
+def _prepare_twrr_series(rate_series, start_date, window):
+    """
+    Builds the TwrrSeries of the dates from ``start_date`` and, with a window, their
+    rolling returns, computed over the rates before ``start_date`` as well.
+
+    Returns:
+        tuple: (TwrrSeries, rolling returns or None), or None if no date is left.
+    """
+    twrr_series = TwrrSeries.from_rate_series(rate_series)
+    if not window:
+        return (twrr_series, None) if rate_series else None
+
+    rolling_returns = twrr_series.rolling_returns(window)
+    first_index = bisect_left(
+        twrr_series.valuation_dates,
+        datetime.strptime(start_date, "%Y-%m-%d").date(),
+    )
+    if first_index == len(twrr_series):
         return None
+    return twrr_series[first_index:], rolling_returns[first_index:]
 
-    previous_rate_value = None
-    twrr_series = []
 
-    for rate in sorted(existing_rates, key=lambda x: x.valuation_date):
-        rate_value = Decimal(rate.rate_value)
-        valuation_date = rate.valuation_date.strftime("%Y-%m-%d")
+def _get_rate_series_batch(currency_pairs, start_date, end_date):
+    """
+    Retrieves the (valuation_date, rate_value) series of many currency pairs over the
+    same range. Cached series are reused; the other pairs share one stored rates query,
+    one rate matrices query for their missing dates and one provider fetch per source
+    currency for the dates that could not be derived.
 
-        if previous_rate_value is None:
-            twrr_value = 0
+    Returns:
+        dict: (valuation_date, rate_value) tuples sorted by valuation date, keyed by pair.
+    """
+    rate_series = {}
+    generations = {}
+    for currency_pair in currency_pairs:
+        generation = shared_rate_cache.generation(*currency_pair)
+        cached_series = shared_rate_cache.get(
+            "series", generation, *currency_pair, start_date, end_date
+        )
+        if cached_series is not None:
+            rate_series[currency_pair] = cached_series
         else:
-            twrr_value = (rate_value / previous_rate_value) - 1
+            generations[currency_pair] = generation
 
-        current_amount = Decimal(amount) * rate_value
+    if not generations:
+        return rate_series
 
-        twrr_series.append(
-            {
-                "valuation_date": valuation_date,
-                "rate_value": rate_value,
-                "twrr": twrr_value,
-                "amount": current_amount,
-            }
+    valuation_dates = get_date_range(start_date, end_date)
+    stored_series = get_pair_rate_rows(list(generations), start_date, end_date)
+
+    missing_dates = {}
+    for currency_pair, series in stored_series.items():
+        existing_dates = set(
+            valuation_date.strftime("%Y-%m-%d") for valuation_date, _ in series
         )
+        pair_dates = [date for date in valuation_dates if date not in existing_dates]
+        if pair_dates:
+            missing_dates[currency_pair] = pair_dates
 
-        previous_rate_value = rate_value
+    if missing_dates:
+        currency_codes = {code for pair in missing_dates for code in pair}
+        rate_matrices = load_rate_matrices(
+            set().union(*missing_dates.values()),
+            sorted(currency_codes | {get_base_currency_code()}),
+        )
+        for currency_pair, pair_dates in list(missing_dates.items()):
+            still_missing = []
+            for date in pair_dates:
+                rate_matrix = rate_matrices.get(to_date(date))
+                rate_value = rate_matrix and rate_matrix.decimal_rate(*currency_pair)
+                if rate_value:
+                    stored_series[currency_pair].append(
+                        (rate_matrix.valuation_date, rate_value)
+                    )
+                else:
+                    still_missing.append(date)
+
+            if still_missing:
+                missing_dates[currency_pair] = still_missing
+            else:
+                del missing_dates[currency_pair]
+
+    dates_by_source = {}
+    for (source_currency_code, _), pair_dates in missing_dates.items():
+        dates_by_source.setdefault(source_currency_code, set()).update(pair_dates)
+
+    for source_currency_code, source_dates in dates_by_source.items():
+        fetched_data = _fetch_and_save_source_rates(
+            source_currency_code, sorted(source_dates)
+        )
+        for (pair_source, exchanged_currency_code), pair_dates in list(
+            missing_dates.items()
+        ):
+            if pair_source != source_currency_code:
+                continue
+            pair_dates = set(pair_dates)
+            fetched_rates = [
+                rate
+                for rate in fetched_data.get(exchanged_currency_code, [])
+                if rate["valuation_date"] in pair_dates
+            ]
+            stored_series[(pair_source, exchanged_currency_code)] += [
+                (to_date(rate["valuation_date"]), Decimal(str(rate["rate_value"])))
+                for rate in fetched_rates
+            ]
+            if len({rate["valuation_date"] for rate in fetched_rates}) == len(
+                pair_dates
+            ):
+                del missing_dates[(pair_source, exchanged_currency_code)]
 
-    return twrr_series
+    for currency_pair, generation in generations.items():
+        series = sorted(stored_series[currency_pair], key=lambda rate: rate[0])
+        # Series missing dates (e.g. after a provider failure) are fetched again next time
+        if currency_pair not in missing_dates:
+            shared_rate_cache.set(
+                "series",
+                generation,
+                *currency_pair,
+                start_date,
+                end_date,
+                value=series,
+            )
+        rate_series[currency_pair] = series
+    return rate_series
+
+
+def _get_rate_series(
+    source_currency_code, exchanged_currency_code, start_date, end_date
+):
+    """
+    Retrieves the (valuation_date, rate_value) series of a currency pair. Missing dates are
+    derived from the rate matrices of those dates (inverse or base currency cross rates)
+    or fetched from providers. Complete series are shared between workers through the rate
+    cache until a new rate of the pair is written.
+
+    Args:
+        source_currency_code (str): The source currency code.
+        exchanged_currency_code (str): The exchanged currency code.
+        start_date (str): The first date of the series in "YYYY-MM-DD" format.
+        end_date (str): The last date of the series in "YYYY-MM-DD" format.
+
+    Returns:
+        list: (valuation_date, rate_value) tuples sorted by valuation date.
+    """
+    generation = shared_rate_cache.generation(
+        source_currency_code, exchanged_currency_code
+    )
+    rate_series = shared_rate_cache.get(
+        "series",
+        generation,
+        source_currency_code,
+        exchanged_currency_code,
+        start_date,
+        end_date,
+    )
+    if rate_series is not None:
+        return rate_series
+
+    valuation_dates = get_date_range(start_date, end_date)
+
+    rate_series = [
+        (valuation_date, rate_value)
+        for _, valuation_date, rate_value in get_rate_rows(
+            source_currency_code, start_date, end_date, exchanged_currency_code
+        )
+    ]
+    existing_dates = set(
+        valuation_date.strftime("%Y-%m-%d") for valuation_date, _ in rate_series
+    )
+    missing_dates = [date for date in valuation_dates if date not in existing_dates]
+
+    if missing_dates:
+        rate_matrices = load_rate_matrices(
+            missing_dates,
+            [source_currency_code, exchanged_currency_code, get_base_currency_code()],
+        )
+        for valuation_date, rate_matrix in rate_matrices.items():
+            rate_value = rate_matrix.decimal_rate(
+                source_currency_code, exchanged_currency_code
+            )
+            if rate_value:
+                rate_series.append((valuation_date, rate_value))
+                existing_dates.add(valuation_date.strftime("%Y-%m-%d"))
+        missing_dates = [date for date in missing_dates if date not in existing_dates]
+
+    if missing_dates:
+        new_rates = _fetch_and_save_from_providers(
+            source_currency_code, exchanged_currency_code, missing_dates
+        )
+        rate_series += [(rate.valuation_date, rate.rate_value) for rate in new_rates]
+        fetched_dates = {str(rate.valuation_date) for rate in new_rates}
+        missing_dates = [date for date in missing_dates if date not in fetched_dates]
+
+    rate_series.sort(key=lambda rate: rate[0])
+    # Series missing dates (e.g. after a provider failure) are fetched again next time
+    if not missing_dates:
+        shared_rate_cache.set(
+            "series",
+            generation,
+            source_currency_code,
+            exchanged_currency_code,
+            start_date,
+            end_date,
+            value=rate_series,
+        )
+    return rate_series
 
 
 def _fetch_and_save_from_providers(
@@ -78,6 +377,10 @@ def _fetch_and_save_from_providers(
 ):
     """
     Fetches and saves exchange rates for missing dates from providers and returns the new rates.
+    Providers supporting time series are called once per run of consecutive dates, the
+    others once per date in parallel. The rates of each provider are saved with one
+    bulk upsert, and dates a provider could not return are tried with the next one.
+    Providers with an open circuit are skipped, as are dates that failed recently.
 
     Args:
         source_currency_code (str): The source currency code.
@@ -87,32 +390,61 @@ def _fetch_and_save_from_providers(
     Returns:
         list: A list of new CurrencyExchangeRate objects representing the newly fetched rates.
     """
-    source_currency = Currency.objects.get(code=source_currency_code)
-    target_currency = Currency.objects.get(code=exchanged_currency_code)
+    currencies = Currency.objects.in_bulk(field_name="code")
+    source_currency = currencies[source_currency_code]
+    target_currency = currencies[exchanged_currency_code]
     new_rates = []
     providers = CurrencyProvider.objects.filter(active=True).order_by("priority")
 
     for provider in providers:
+        if not missing_dates:
+            break
+
         try:
             provider_instance = get_provider_instance(provider, provider.url)
+            fetched_data = fetch_provider_rates(
+                provider,
+                provider_instance,
+                source_currency_code,
+                exchanged_currency_code,
+                missing_dates,
+            )
+            rows = []
+            for data in fetched_data:
+                # Failed dates come back without rates, or with an empty list
+                if not (data and data.get("rates")):
+                    continue
 
-            for valuation_date in missing_dates:
-                provider_instance.set_url(provider.url, valuation_date)
-                data = provider_instance.get_exchange_rate_data(
-                    source_currency_code, exchanged_currency_code, valuation_date
+                rows += get_base_rate_rows(
+                    data, data["valuation_date"], provider, currencies
                 )
 
-                if data and data.get("rates", []):
-                    rate_value = data["rates"].get(exchanged_currency_code)
-                    if rate_value:
-                        new_rate = update_exchange_rate_activity(
+                rate_value = data["rates"].get(exchanged_currency_code)
+                if rate_value:
+                    rows.append(
+                        (
                             source_currency,
                             target_currency,
+                            data["valuation_date"],
                             rate_value,
-                            datetime.strptime(valuation_date, "%Y-%m-%d").date(),
                             provider,
                         )
-                        new_rates.append(new_rate)
+                    )
+
+            saved_rates = [
+                rate
+                for rate in bulk_update_exchange_rates(rows)
+                if rate.source_currency == source_currency
+                and rate.target_currency == target_currency
+            ]
+            new_rates += saved_rates
+            fetched_dates = {
+                rate.valuation_date.strftime("%Y-%m-%d") for rate in saved_rates
+            }
+
+            missing_dates = [
+                date for date in missing_dates if date not in fetched_dates
+            ]
 
         except Exception as e:
             logging.error(f"Error fetching from provider {provider.name}: {e}")
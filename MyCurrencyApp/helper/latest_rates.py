@@ -0,0 +1,62 @@
+from ..models import LatestExchangeRate
+from .cross_rates import derive_rate, get_base_currency_code
+
+
+def get_latest_rate(
+    source_currency_code, target_currency_code, valuation_date, providers
+):
+    """
+    Retrieves the current rate of a currency pair with a single primary key lookup of
+    the LatestExchangeRate rows of the pair and of the base currency vector.
+    The direct-pair rate of the highest priority provider wins; otherwise the rate is
+    derived from the base currency rates of a provider.
+
+    Args:
+        source_currency_code (str): The code of the source currency.
+        target_currency_code (str): The code of the target currency.
+        valuation_date (date): Only rates of this date are current.
+        providers (list): The providers to read, in order of priority.
+
+    Returns:
+        Decimal or None: The exchange rate, or None if no current rate is stored.
+    """
+    base_currency_code = get_base_currency_code()
+    latest_rates = LatestExchangeRate.objects.in_bulk(
+        [
+            LatestExchangeRate.make_key(source_code, target_code, provider.id)
+            for provider in providers
+            for source_code, target_code in [
+                (source_currency_code, target_currency_code),
+                (base_currency_code, source_currency_code),
+                (base_currency_code, target_currency_code),
+            ]
+        ]
+    )
+
+    def current_rate(source_code, target_code, provider):
+        latest_rate = latest_rates.get(
+            LatestExchangeRate.make_key(source_code, target_code, provider.id)
+        )
+        if latest_rate and latest_rate.valuation_date == valuation_date:
+            return latest_rate.rate_value
+        return None
+
+    for provider in providers:
+        rate_value = current_rate(source_currency_code, target_currency_code, provider)
+        if rate_value:
+            return rate_value
+
+    for provider in providers:
+        base_rates = {
+            code: current_rate(base_currency_code, code, provider)
+            for code in [source_currency_code, target_currency_code]
+        }
+        rate_value = derive_rate(
+            {code: rate for code, rate in base_rates.items() if rate},
+            source_currency_code,
+            target_currency_code,
+        )
+        if rate_value:
+            return rate_value
+
+    return None
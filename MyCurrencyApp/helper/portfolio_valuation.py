@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import numpy as np
+
+from ..utils import get_date_range
+from .cross_rates import get_base_currency_code
+from .get_currency_rates import (
+    _fetch_and_save_from_providers as _fetch_and_save_source_rates,
+)
+from .rate_matrix import load_rate_matrices
+from .twrr_engine import AMOUNT_DECIMALS, RETURN_DECIMALS, TwrrSeries, to_scaled_ints
+
+
+def value_portfolio(holdings, reporting_currency_code, start_date, end_date=None):
+    """
+    Values a portfolio of currency holdings in a reporting currency on every date of a
+    period, and calculates its TWRR.
+
+    The rate matrices of every date are loaded with one query and completed with
+    inverse and base currency cross rates. The rates of the held currencies into the
+    reporting currency are stacked into a dates × currencies array, so the values of
+    all dates are one matrix-vector product with the holdings vector. Dates missing a
+    rate are fetched with one grouped provider call for the reporting currency.
+    Holdings do not change over the period, so the TWRR is the growth of the value.
+
+    Args:
+        holdings (dict): The amount held keyed by currency code.
+        reporting_currency_code (str): The currency the portfolio is valued in.
+        start_date (str): The first date of the period in "YYYY-MM-DD" format.
+        end_date (str, optional): The last date of the period. Defaults to today.
+
+    Returns:
+        dict: The valuation series, one dict per date with the value, the return of
+            the period ending on the date ("twrr") and the TWRR since the first date
+            ("cumulative_twrr"), and the dates that could not be valued.
+    """
+    end_date = end_date or datetime.today().strftime("%Y-%m-%d")
+    currency_codes = list(holdings)
+    matrix_codes = list(
+        dict.fromkeys(
+            currency_codes + [reporting_currency_code, get_base_currency_code()]
+        )
+    )
+    valuation_dates = get_date_range(start_date, end_date)
+
+    rate_matrices = load_rate_matrices(valuation_dates, matrix_codes)
+    missing_dates = _get_missing_dates(
+        rate_matrices, valuation_dates, currency_codes, reporting_currency_code
+    )
+    if missing_dates:
+        _fetch_and_save_source_rates(reporting_currency_code, missing_dates)
+        rate_matrices.update(load_rate_matrices(missing_dates, matrix_codes))
+        missing_dates = _get_missing_dates(
+            rate_matrices, valuation_dates, currency_codes, reporting_currency_code
+        )
+
+    missing = set(missing_dates)
+    valued_dates = [
+        valuation_date
+        for valuation_date in sorted(rate_matrices)
+        if valuation_date.strftime("%Y-%m-%d") not in missing
+    ]
+    amounts = np.array([float(holdings[code]) for code in currency_codes])
+    values = (
+        _get_rate_columns(
+            rate_matrices, valued_dates, currency_codes, reporting_currency_code
+        )
+        @ amounts
+    )
+
+    valuation_series = []
+    if valued_dates:
+        value_series = TwrrSeries(valued_dates, to_scaled_ints(values, AMOUNT_DECIMALS))
+        period_returns = np.round(value_series.period_returns(), RETURN_DECIMALS)
+        cumulative_returns = np.round(
+            value_series.cumulative_returns(), RETURN_DECIMALS
+        )
+        valuation_series = [
+            {
+                "valuation_date": valuation_date.isoformat(),
+                "value": round(value, AMOUNT_DECIMALS),
+                "twrr": period_return,
+                "cumulative_twrr": cumulative_return,
+            }
+            for valuation_date, value, period_return, cumulative_return in zip(
+                valued_dates,
+                values.tolist(),
+                period_returns.tolist(),
+                cumulative_returns.tolist(),
+            )
+        ]
+
+    return {"valuation_series": valuation_series, "missing_dates": missing_dates}
+
+
+def _get_rate_columns(
+    rate_matrices, valuation_dates, currency_codes, reporting_currency_code
+):
+    """
+    Returns the rates of ``currency_codes`` into the reporting currency as a
+    dates × currencies array, NaN where a rate is unknown.
+    """
+    if not valuation_dates:
+        return np.empty((0, len(currency_codes)))
+
+    first_matrix = rate_matrices[valuation_dates[0]]
+    currency_indexes = [first_matrix.index[code] for code in currency_codes]
+    reporting_index = first_matrix.index[reporting_currency_code]
+    return np.array(
+        [
+            rate_matrices[valuation_date].rates[currency_indexes, reporting_index]
+            for valuation_date in valuation_dates
+        ]
+    )
+
+
+def _get_missing_dates(
+    rate_matrices, valuation_dates, currency_codes, reporting_currency_code
+):
+    """
+    Returns the dates of ``valuation_dates`` without a rate of every held currency
+    into the reporting currency.
+    """
+    dates = sorted(rate_matrices)
+    rate_columns = _get_rate_columns(
+        rate_matrices, dates, currency_codes, reporting_currency_code
+    )
+    complete = ~np.isnan(rate_columns).any(axis=1)
+    complete_dates = {
+        valuation_date.strftime("%Y-%m-%d")
+        for valuation_date, is_complete in zip(dates, complete)
+        if is_complete
+    }
+    return [date for date in valuation_dates if date not in complete_dates]
@@ -0,0 +1,145 @@
+import logging
+
+from ..enums.endpoint_type import EndpointType
+from ..monitoring.request_metrics import measure
+from ..providers.circuit_breaker import ProviderUnavailable, guarded_fetch
+from ..providers.fetch_pool import fetch_concurrently
+from ..utils import get_date_range, get_date_spans
+
+
+def fetch_provider_rates(
+    provider,
+    provider_instance,
+    source_currency_code,
+    exchanged_currency_code,
+    valuation_dates,
+):
+    """
+    Fetches the rates of many dates from a provider. Providers supporting time series
+    are called once per run of consecutive dates, the others once per date, in
+    parallel up to the provider concurrency limit. The dates of runs whose time
+    series call failed are fetched again one by one.
+    Providers with an open circuit are skipped, as are lookups that failed recently.
+
+    Args:
+        provider (CurrencyProvider): The provider to fetch from.
+        provider_instance (BaseProvider): The provider client.
+        source_currency_code (str): The source currency code.
+        exchanged_currency_code (str): The exchanged currency code, or "" for all.
+        valuation_dates (list): Date strings in "YYYY-MM-DD" format.
+
+    Returns:
+        list: The provider data of each fetched date, in the format of
+            get_exchange_rate_data, sorted by valuation date.
+    """
+    requested_dates = set(valuation_dates)
+    daily_dates = sorted(valuation_dates)
+    fetched_data = []
+
+    if provider_instance.supports_timeseries:
+        daily_dates = []
+        for span, data, error in _fetch_all(
+            provider,
+            provider_instance,
+            _fetch_series,
+            source_currency_code,
+            exchanged_currency_code,
+            get_date_spans(valuation_dates, provider_instance.max_timeseries_days),
+        ):
+            if data is None and not isinstance(error, ProviderUnavailable):
+                # Rejected time series (e.g. not in the plan) are fetched day by day
+                daily_dates += [
+                    date for date in get_date_range(*span) if date in requested_dates
+                ]
+            fetched_data.extend(
+                day_data
+                for day_data in data or []
+                if day_data["valuation_date"] in requested_dates
+            )
+
+    for _, data, _ in _fetch_all(
+        provider,
+        provider_instance,
+        _fetch_day,
+        source_currency_code,
+        exchanged_currency_code,
+        daily_dates,
+    ):
+        fetched_data.extend(data or [])
+
+    fetched_data.sort(key=lambda day_data: day_data["valuation_date"])
+    return fetched_data
+
+
+def _fetch_all(
+    provider,
+    provider_instance,
+    fetch,
+    source_currency_code,
+    exchanged_currency_code,
+    items,
+):
+    if not items:
+        return []
+
+    with measure("provider-fetch"):
+        results = fetch_concurrently(
+            provider,
+            provider_instance,
+            lambda instance, item: fetch(
+                provider, instance, source_currency_code, exchanged_currency_code, item
+            ),
+            items,
+        )
+
+    for item, _, error in results:
+        if error:
+            logging.error(
+                f"Error fetching {item} from provider {provider.name}: {error}"
+            )
+    return results
+
+
+def _fetch_day(
+    provider, provider_instance, source_currency_code, exchanged_currency_code, date
+):
+    provider_instance.set_url(provider.url, date)
+    data = guarded_fetch(
+        provider,
+        (source_currency_code, exchanged_currency_code, date),
+        lambda: provider_instance.get_exchange_rate_data(
+            source_currency_code, exchanged_currency_code, date
+        ),
+    )
+    if not data:
+        return []
+    return [{**data, "valuation_date": data.get("valuation_date") or date}]
+
+
+def _fetch_series(
+    provider, provider_instance, source_currency_code, exchanged_currency_code, span
+):
+    start_date, end_date = span
+    provider_instance.set_url(provider.url, EndpointType.TIMESERIES.value)
+    data = guarded_fetch(
+        provider,
+        (source_currency_code, exchanged_currency_code, f"{start_date}/{end_date}"),
+        lambda: provider_instance.get_exchange_rate_series(
+            source_currency_code, exchanged_currency_code, start_date, end_date
+        ),
+    )
+    if not data:
+        return None
+
+    base_rates = data.get("base_rates", {})
+    return [
+        {
+            "source_currency": source_currency_code,
+            "exchanged_currency": exchanged_currency_code,
+            "rates": rates,
+            "valuation_date": valuation_date,
+            "base_currency": data.get("base_currency"),
+            "base_rates": base_rates.get(valuation_date, {}),
+        }
+        for valuation_date, rates in sorted(data.get("rates", {}).items())
+    ]
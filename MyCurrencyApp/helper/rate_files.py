@@ -0,0 +1,173 @@
+"""
+Parsing of exchange rate files. The module does not use the database, so the parse
+workers of the ingest pipeline can import it without setting up Django.
+"""
+
+import csv
+import json
+import os
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+JSON_READ_SIZE = 1 << 16
+
+
+def iter_rate_records(file_path):
+    """
+    Streams the exchange rate records of a CSV, JSON array or JSON Lines file without
+    loading the whole file in memory.
+
+    Args:
+        file_path (str): Path of a .csv, .json, .jsonl or .ndjson file.
+
+    Yields:
+        dict: Records with source_currency_code, target_currency_code, valuation_date
+            and rate_value keys.
+    """
+    file_extension = os.path.splitext(file_path)[-1].lower()
+
+    with open(file_path, "r", newline="") as rate_file:
+        if file_extension == ".csv":
+            yield from csv.DictReader(rate_file)
+        elif file_extension in (".jsonl", ".ndjson"):
+            for line in rate_file:
+                if line.strip():
+                    yield json.loads(line)
+        elif file_extension == ".json":
+            yield from _iter_json_array(rate_file)
+        else:
+            raise ValueError(f"Unsupported file type: {file_extension}")
+
+
+def _iter_json_array(rate_file):
+    """
+    Decodes the elements of a top-level JSON array one by one.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+
+    while True:
+        # Skip the separators between elements, reading more input when needed.
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position < len(buffer):
+                break
+            chunk = rate_file.read(JSON_READ_SIZE)
+            if not chunk:
+                return
+            buffer, position = buffer[position:] + chunk, 0
+
+        if not started:
+            if buffer[position] != "[":
+                raise ValueError("Expected a JSON array of exchange rates")
+            started = True
+            position += 1
+            continue
+
+        if buffer[position] == "]":
+            return
+
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            chunk = rate_file.read(JSON_READ_SIZE)
+            if not chunk:
+                raise
+            buffer, position = buffer[position:] + chunk, 0
+            continue
+
+        yield record
+        position = end
+
+
+def normalize_record(record, currency_ids, provider_id):
+    """
+    Validates a record and resolves its currencies with an in-memory code to id map.
+
+    Args:
+        record (dict): A record of iter_rate_records.
+        currency_ids (dict): Currency ids keyed by code.
+        provider_id (int): The provider of the rates.
+
+    Returns:
+        tuple or None: (source_currency_id, target_currency_id, provider_id,
+            valuation_date, rate_value), or None if the record is invalid.
+    """
+    try:
+        source_currency_id = currency_ids[record["source_currency_code"]]
+        target_currency_id = currency_ids[record["target_currency_code"]]
+        valuation_date = datetime.strptime(record["valuation_date"], "%Y-%m-%d").date()
+        rate_value = Decimal(str(record["rate_value"]))
+    except (KeyError, TypeError, ValueError, InvalidOperation):
+        return None
+
+    if (
+        source_currency_id == target_currency_id
+        or not rate_value.is_finite()
+        or rate_value <= 0
+    ):
+        return None
+
+    return (
+        source_currency_id,
+        target_currency_id,
+        provider_id,
+        valuation_date,
+        rate_value,
+    )
+
+
+_parse_worker = {}
+
+
+def init_parse_worker(queue, currency_ids, provider_id, batch_size):
+    """
+    Initializes a parse worker process with the writer queue and the in-memory
+    currency code to id map.
+    """
+    _parse_worker.update(
+        queue=queue,
+        currency_ids=currency_ids,
+        provider_id=provider_id,
+        batch_size=batch_size,
+    )
+
+
+def parse_rate_file(file_path):
+    """
+    Parses, validates and normalizes a rate file in a parse worker, sending batches of
+    normalized rows to the writer queue as ("rows", file_path, rows) messages,
+    followed by ("done", file_path, stats) or ("error", file_path, message).
+
+    Args:
+        file_path (str): The file to parse.
+    """
+    queue = _parse_worker["queue"]
+    batch_size = _parse_worker["batch_size"]
+    rows = []
+    records = invalid = 0
+
+    try:
+        for record in iter_rate_records(file_path):
+            records += 1
+            row = normalize_record(
+                record, _parse_worker["currency_ids"], _parse_worker["provider_id"]
+            )
+            if row is None:
+                invalid += 1
+                continue
+
+            rows.append(row)
+            if len(rows) >= batch_size:
+                queue.put(("rows", file_path, rows))
+                rows = []
+
+        if rows:
+            queue.put(("rows", file_path, rows))
+        queue.put(("done", file_path, {"records": records, "invalid": invalid}))
+
+    except Exception as e:
+        queue.put(("error", file_path, str(e)))
@@ -0,0 +1,78 @@
+"""
+Synthetic exchange rate history for load testing. Every currency follows a seeded
+geometric random walk against a common numeraire, so generated rates are consistent:
+the cross rate of two pairs matches the rate of the third pair.
+"""
+
+import numpy as np
+
+
+def generate_log_levels(currency_count, day_count, seed=0, volatility=0.005):
+    """
+    Generates the log value of every currency on every day.
+
+    Args:
+        currency_count (int): Number of currencies.
+        day_count (int): Number of consecutive days.
+        seed (int): Seed of the random generator; equal seeds give equal histories.
+        volatility (float): Standard deviation of the daily log return.
+
+    Returns:
+        numpy.ndarray: A (day_count, currency_count) array of log values.
+    """
+    rng = np.random.default_rng(seed)
+    initial_levels = rng.uniform(-3, 3, currency_count)
+    daily_returns = rng.normal(0, volatility, (day_count, currency_count))
+    daily_returns[0] = 0
+    return initial_levels + daily_returns.cumsum(axis=0)
+
+
+def iter_generated_rates(
+    currency_codes,
+    source_codes,
+    valuation_dates,
+    provider_count=1,
+    seed=0,
+    volatility=0.005,
+    spread=0.0005,
+):
+    """
+    Yields the generated rates from every source currency to every other currency,
+    date by date. Each provider quotes the same walk with its own small noise.
+
+    Args:
+        currency_codes (list): Codes of the generated currencies.
+        source_codes (list): Codes whose full rate vector is generated.
+        valuation_dates (list): The consecutive dates of the history.
+        provider_count (int): Number of providers quoting the rates.
+        seed (int): Seed of the random generator.
+        volatility (float): Standard deviation of the daily log return.
+        spread (float): Standard deviation of the relative noise of each provider.
+
+    Yields:
+        tuple: (provider_index, source_code, target_code, valuation_date, rate_value)
+            tuples, rates rounded to 6 decimals.
+    """
+    levels = generate_log_levels(
+        len(currency_codes), len(valuation_dates), seed, volatility
+    )
+    noise = np.random.default_rng(seed + 1)
+    source_indexes = [currency_codes.index(code) for code in source_codes]
+
+    for day_index, valuation_date in enumerate(valuation_dates):
+        day_levels = levels[day_index]
+        for source_index in source_indexes:
+            rates = np.exp(day_levels[source_index] - day_levels)
+            for provider_index in range(provider_count):
+                quoted_rates = np.round(
+                    rates * (1 + noise.normal(0, spread, len(rates))), 6
+                ).tolist()
+                for target_index, rate_value in enumerate(quoted_rates):
+                    if target_index != source_index:
+                        yield (
+                            provider_index,
+                            currency_codes[source_index],
+                            currency_codes[target_index],
+                            valuation_date,
+                            rate_value,
+                        )
@@ -0,0 +1,177 @@
+import csv
+import io
+import json
+import os
+from functools import reduce
+from operator import or_
+
+from django.db import connection, transaction
+from django.db.models import OuterRef, Q, Subquery
+
+from ..cache.rate_cache import invalidate_pair
+from ..models import Currency, CurrencyExchangeRate
+from ..utils import update_latest_exchange_rates
+
+
+def write_exchange_rate_rows(rows, batch_size=1000):
+    """
+    Inserts normalized rows in one transaction, skipping rows that already exist for
+    their currency pair, valuation date and provider. PostgreSQL loads the rows with
+    COPY into a temporary table; other databases use batched inserts.
+
+    Args:
+        rows (list): Tuples returned by normalize_record.
+        batch_size (int): Rows per INSERT statement on databases without COPY.
+
+    Returns:
+        int: The number of rows inserted, without the skipped existing rows.
+    """
+    if not rows:
+        return 0
+
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            return _copy_exchange_rate_rows(rows)
+
+        # bulk_create does not report the rows ignored on conflict
+        stored_rows = CurrencyExchangeRate.objects.count()
+        CurrencyExchangeRate.objects.bulk_create(
+            [
+                CurrencyExchangeRate(
+                    source_currency_id=source_currency_id,
+                    target_currency_id=target_currency_id,
+                    provider_id=provider_id,
+                    valuation_date=valuation_date,
+                    rate_value=rate_value,
+                )
+                for (
+                    source_currency_id,
+                    target_currency_id,
+                    provider_id,
+                    valuation_date,
+                    rate_value,
+                ) in rows
+            ],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+        return CurrencyExchangeRate.objects.count() - stored_rows
+
+
+def _copy_exchange_rate_rows(rows):
+    data = io.StringIO()
+    csv.writer(data).writerows(rows)
+    data.seek(0)
+    table_name = connection.ops.quote_name(CurrencyExchangeRate._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMPORARY TABLE import_exchange_rates ("
+            "source_currency_id bigint, target_currency_id bigint, "
+            "provider_id bigint, valuation_date date, rate_value numeric(18, 6)"
+            ") ON COMMIT DROP"
+        )
+        cursor.copy_expert(
+            "COPY import_exchange_rates FROM STDIN WITH (FORMAT csv)", data
+        )
+        cursor.execute(
+            f"INSERT INTO {table_name} "
+            "(source_currency_id, target_currency_id, provider_id, valuation_date, "
+            "rate_value, active, created_at, updated_at) "
+            "SELECT source_currency_id, target_currency_id, provider_id, "
+            "valuation_date, rate_value, true, now(), now() "
+            "FROM import_exchange_rates "
+            "ON CONFLICT (source_currency_id, target_currency_id, valuation_date, "
+            "provider_id) DO NOTHING"
+        )
+        return cursor.rowcount
+
+
+def refresh_imported_pairs(pairs, stdout=None, batch_size=500):
+    """
+    Invalidates the cached rates of the imported (source_id, target_id) pairs and
+    moves their latest rates forward, which bulk imports bypass. Only the latest row
+    of each imported pair and provider is read, in batches of ``batch_size`` pairs.
+    """
+    currency_codes = dict(Currency.objects.values_list("id", "code"))
+    for source_currency_id, target_currency_id in pairs:
+        invalidate_pair(
+            currency_codes[source_currency_id], currency_codes[target_currency_id]
+        )
+
+    latest_dates = (
+        CurrencyExchangeRate.objects.filter(
+            source_currency_id=OuterRef("source_currency_id"),
+            target_currency_id=OuterRef("target_currency_id"),
+            provider_id=OuterRef("provider_id"),
+        )
+        .order_by("-valuation_date")
+        .values("valuation_date")[:1]
+    )
+    pairs = list(pairs)
+    refreshed = 0
+    for start in range(0, len(pairs), batch_size):
+        latest_rates = list(
+            CurrencyExchangeRate.objects.filter(
+                reduce(
+                    or_,
+                    (
+                        Q(
+                            source_currency_id=source_currency_id,
+                            target_currency_id=target_currency_id,
+                        )
+                        for source_currency_id, target_currency_id in pairs[
+                            start : start + batch_size
+                        ]
+                    ),
+                ),
+                valuation_date=Subquery(latest_dates),
+            ).select_related("source_currency", "target_currency")
+        )
+        update_latest_exchange_rates(latest_rates)
+        refreshed += len(latest_rates)
+
+    if stdout:
+        stdout.write(f"Refreshed {refreshed} latest exchange rates")
+
+
+class ImportCheckpoint:
+    """
+    Records how many records of a file were imported, so an interrupted import
+    resumes after the last committed chunk. The checkpoint is discarded if the file
+    changed since it was written.
+    """
+
+    def __init__(self, file_path, checkpoint_path=None):
+        self.file_path = file_path
+        self.path = checkpoint_path or f"{file_path}.checkpoint"
+        stat = os.stat(file_path)
+        self.signature = {"size": stat.st_size, "mtime": stat.st_mtime}
+
+    def load(self):
+        try:
+            with open(self.path) as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return 0
+
+        if checkpoint.get("signature") != self.signature:
+            return 0
+        return checkpoint.get("records", 0)
+
+    def save(self, records):
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as checkpoint_file:
+            json.dump(
+                {
+                    "file": self.file_path,
+                    "signature": self.signature,
+                    "records": records,
+                },
+                checkpoint_file,
+            )
+        os.replace(temporary_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
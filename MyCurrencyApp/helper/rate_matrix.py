@@ -0,0 +1,174 @@
+from decimal import Decimal
+
+import numpy as np
+
+from ..cache.currency_ids import currency_ids
+from ..models import CurrencyExchangeRate
+from ..utils import to_date
+from .cross_rates import get_base_currency_code
+
+
+class RateMatrix:
+    """
+    Snapshot of every exchange rate of a valuation date as a dense N×N float64 array.
+
+    ``rates[i, j]`` is the rate from ``currency_codes[i]`` to ``currency_codes[j]``, or NaN
+    if it is unknown. Direct rows win; missing pairs are completed with the inverse of
+    the opposite pair, then triangulated through the base currency row.
+    """
+
+    def __init__(self, valuation_date, currency_codes, rates):
+        self.valuation_date = valuation_date
+        self.currency_codes = list(currency_codes)
+        self.index = {code: i for i, code in enumerate(self.currency_codes)}
+        self.rates = rates
+
+    @classmethod
+    def from_rows(cls, valuation_date, currency_codes, rows):
+        """
+        Builds a matrix from (source_code, target_code, rate_value) rows. Later rows
+        overwrite earlier rows of the same pair.
+        """
+        index = {code: i for i, code in enumerate(currency_codes)}
+        rates = np.full((len(index), len(index)), np.nan)
+
+        for source_currency_code, target_currency_code, rate_value in rows:
+            source_index = index.get(source_currency_code)
+            target_index = index.get(target_currency_code)
+            if source_index is not None and target_index is not None and rate_value:
+                rates[source_index, target_index] = float(rate_value)
+
+        matrix = cls(valuation_date, currency_codes, rates)
+        matrix._complete()
+        return matrix
+
+    @classmethod
+    def from_db(cls, valuation_date, currency_codes=None):
+        return load_rate_matrices([valuation_date], currency_codes).get(
+            to_date(valuation_date)
+        )
+
+    def _complete(self):
+        np.fill_diagonal(self.rates, 1.0)
+
+        missing = np.isnan(self.rates)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.rates[missing] = (1.0 / self.rates.T)[missing]
+
+        base_index = self.index.get(get_base_currency_code())
+        if base_index is None:
+            return
+
+        base_rates = self.rates[base_index]
+        missing = np.isnan(self.rates)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross_rates = base_rates[np.newaxis, :] / base_rates[:, np.newaxis]
+        self.rates[missing] = cross_rates[missing]
+
+    def rate(self, source_currency_code, target_currency_code):
+        """
+        Returns the rate of a currency pair as a float, or None if it is unknown.
+        """
+        source_index = self.index.get(source_currency_code)
+        target_index = self.index.get(target_currency_code)
+        if source_index is None or target_index is None:
+            return None
+
+        rate_value = self.rates[source_index, target_index]
+        return None if np.isnan(rate_value) else float(rate_value)
+
+    def decimal_rate(self, source_currency_code, target_currency_code):
+        """
+        Returns the rate of a currency pair rounded to the stored precision.
+        """
+        rate_value = self.rate(source_currency_code, target_currency_code)
+        return None if rate_value is None else Decimal(f"{rate_value:.6f}")
+
+    def rates_from(self, source_currency_code):
+        """
+        Returns every known rate of a source currency keyed by target currency code.
+        """
+        row = self.rates[self.index[source_currency_code]]
+        return {
+            code: float(row[i])
+            for i, code in enumerate(self.currency_codes)
+            if code != source_currency_code and not np.isnan(row[i])
+        }
+
+    def is_complete_for(self, source_currency_code):
+        source_index = self.index.get(source_currency_code)
+        return source_index is not None and not np.isnan(self.rates[source_index]).any()
+
+    def consistency_errors(self, tolerance=1e-4):
+        """
+        Finds the pairs whose rate disagrees with its inverse or with the rate
+        triangulated through the base currency by more than ``tolerance`` (relative).
+
+        Returns:
+            list: (source_code, target_code) tuples of inconsistent pairs.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inconsistent = np.abs(self.rates * self.rates.T - 1.0) > tolerance
+
+            base_index = self.index.get(get_base_currency_code())
+            if base_index is not None:
+                base_rates = self.rates[base_index]
+                cross_rates = base_rates[np.newaxis, :] / base_rates[:, np.newaxis]
+                inconsistent |= np.abs(self.rates / cross_rates - 1.0) > tolerance
+
+        return [
+            (self.currency_codes[i], self.currency_codes[j])
+            for i, j in zip(*np.nonzero(inconsistent))
+        ]
+
+
+def load_rate_matrices(valuation_dates, currency_codes=None):
+    """
+    Builds the rate matrices of many valuation dates with a single rate query.
+
+    Args:
+        valuation_dates (list): Dates as date objects or "YYYY-MM-DD" strings.
+        currency_codes (list, optional): Currencies of the matrices. Defaults to every
+            currency in the database.
+
+    Returns:
+        dict: A RateMatrix keyed by valuation date, for dates with at least one rate.
+    """
+    valuation_dates = sorted(
+        {to_date(valuation_date) for valuation_date in valuation_dates}
+    )
+    if not valuation_dates:
+        return {}
+
+    if currency_codes is None:
+        currency_codes = sorted(currency_ids.get_codes().values())
+    currency_codes = list(dict.fromkeys(currency_codes))
+
+    ids = list(currency_ids.get_ids(currency_codes).values())
+    codes = currency_ids.get_codes()
+    rows_by_date = {}
+    for valuation_date, source_currency_id, target_currency_id, rate_value in (
+        CurrencyExchangeRate.objects.filter(
+            valuation_date__range=[valuation_dates[0], valuation_dates[-1]],
+            source_currency_id__in=ids,
+            target_currency_id__in=ids,
+        )
+        .order_by("-provider__priority", "updated_at")
+        .values_list(
+            "valuation_date",
+            "source_currency_id",
+            "target_currency_id",
+            "rate_value",
+        )
+    ):
+        rows_by_date.setdefault(valuation_date, []).append(
+            (codes.get(source_currency_id), codes.get(target_currency_id), rate_value)
+        )
+
+    return {
+        valuation_date: RateMatrix.from_rows(
+            valuation_date, currency_codes, rows_by_date[valuation_date]
+        )
+        for valuation_date in valuation_dates
+        if valuation_date in rows_by_date
+    }
@@ -0,0 +1,122 @@
+from ..cache.currency_ids import currency_ids
+from ..models import CurrencyExchangeRate
+
+
+def get_rate_rows(
+    source_currency_code, date_from, date_to, exchanged_currency_code=None
+):
+    """
+    Retrieves the stored rates of a source currency over a date range with a single
+    query. Only the target currency id, valuation date and rate are selected, and ids
+    are mapped back to codes in memory, so no Currency row is loaded per rate.
+    When several providers stored a rate of the same date, the rate of the highest
+    priority provider is kept.
+
+    Args:
+        source_currency_code (str): The code of the source currency.
+        date_from (str): The start date of the range in "YYYY-MM-DD" format.
+        date_to (str): The end date of the range in "YYYY-MM-DD" format.
+        exchanged_currency_code (str, optional): Restricts the rates to one target currency.
+
+    Returns:
+        list: (target_currency_code, valuation_date, rate_value) tuples sorted by
+            valuation date.
+    """
+    filters = {
+        "source_currency_id": currency_ids.get_id(source_currency_code),
+        "valuation_date__range": [date_from, date_to],
+    }
+    if exchanged_currency_code is not None:
+        filters["target_currency_id"] = currency_ids.get_id(exchanged_currency_code)
+
+    rows = (
+        CurrencyExchangeRate.objects.filter(**filters)
+        .order_by("valuation_date", "provider__priority")
+        .values_list("target_currency_id", "valuation_date", "rate_value")
+    )
+    codes = currency_ids.get_codes()
+    rate_rows = []
+    stored_dates = set()
+    for target_currency_id, valuation_date, rate_value in rows:
+        if (target_currency_id, valuation_date) in stored_dates:
+            continue
+        stored_dates.add((target_currency_id, valuation_date))
+        rate_rows.append((codes.get(target_currency_id), valuation_date, rate_value))
+    return rate_rows
+
+
+def get_boundary_rates(
+    source_currency_code, exchanged_currency_code, date_from, date_to
+):
+    """
+    Retrieves the first and the last stored rate of a currency pair within a date
+    range, with one index lookup each. Rates of higher priority providers win.
+
+    Args:
+        source_currency_code (str): The code of the source currency.
+        exchanged_currency_code (str): The code of the exchanged currency.
+        date_from (str): The start date of the range in "YYYY-MM-DD" format.
+        date_to (str): The end date of the range in "YYYY-MM-DD" format.
+
+    Returns:
+        list: The (valuation_date, rate_value) tuples of the first and last stored
+            dates, or an empty list if the pair has no rate in the range.
+    """
+    rates = CurrencyExchangeRate.objects.filter(
+        source_currency_id=currency_ids.get_id(source_currency_code),
+        target_currency_id=currency_ids.get_id(exchanged_currency_code),
+        valuation_date__range=[date_from, date_to],
+    ).values_list("valuation_date", "rate_value")
+
+    first_rate = rates.order_by("valuation_date", "provider__priority").first()
+    if first_rate is None:
+        return []
+    last_rate = rates.order_by("-valuation_date", "provider__priority").first()
+    return [first_rate, last_rate]
+
+
+def get_pair_rate_rows(currency_pairs, date_from, date_to):
+    """
+    Retrieves the stored rates of many currency pairs over a date range with a single
+    query. Rates of the sources and targets of the pairs are selected together and
+    the requested pairs are picked in memory. When several providers stored a rate of
+    the same date, the rate of the highest priority provider is kept.
+
+    Args:
+        currency_pairs (list): (source_currency_code, exchanged_currency_code) tuples.
+        date_from (str): The start date of the range in "YYYY-MM-DD" format.
+        date_to (str): The end date of the range in "YYYY-MM-DD" format.
+
+    Returns:
+        dict: (valuation_date, rate_value) tuples sorted by valuation date, keyed by
+            requested pair. Pairs without stored rates have an empty list.
+    """
+    ids = currency_ids.get_ids(
+        {code for currency_pair in currency_pairs for code in currency_pair}
+    )
+    pair_rows = {currency_pair: [] for currency_pair in currency_pairs}
+    rows = (
+        CurrencyExchangeRate.objects.filter(
+            source_currency_id__in={
+                ids[source] for source, _ in currency_pairs if source in ids
+            },
+            target_currency_id__in={
+                ids[target] for _, target in currency_pairs if target in ids
+            },
+            valuation_date__range=[date_from, date_to],
+        )
+        .order_by("valuation_date", "provider__priority")
+        .values_list(
+            "source_currency_id", "target_currency_id", "valuation_date", "rate_value"
+        )
+    )
+
+    codes = currency_ids.get_codes()
+    for source_currency_id, target_currency_id, valuation_date, rate_value in rows:
+        series = pair_rows.get(
+            (codes.get(source_currency_id), codes.get(target_currency_id))
+        )
+        # Rows of a date are consecutive, highest priority provider first
+        if series is not None and (not series or series[-1][0] != valuation_date):
+            series.append((valuation_date, rate_value))
+    return pair_rows
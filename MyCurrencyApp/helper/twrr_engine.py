@@ -0,0 +1,174 @@
+import math
+from decimal import Decimal
+
+import numpy as np
+
+RATE_DECIMALS = 6  # Precision of CurrencyExchangeRate.rate_value
+AMOUNT_DECIMALS = 6
+RETURN_DECIMALS = 10
+INT64_MAX = np.iinfo(np.int64).max
+# Largest value whose scaled float64 is still rounded to the exact integer
+MAX_FLOAT_SCALED = 2**52
+
+
+def to_scaled_ints(values, decimals):
+    """
+    Converts decimal values to integers scaled by 10**decimals, rounded half to even.
+
+    Values with at most ``decimals`` decimal places are converted exactly through a
+    float64 array; values too large for that go through Decimal instead.
+
+    Returns:
+        numpy.ndarray: An int64 array, or an object array of Python ints.
+    """
+    scale = 10**decimals
+    scaled = np.asarray(values, dtype=np.float64) * scale
+    if not len(scaled) or np.abs(scaled).max() < MAX_FLOAT_SCALED:
+        return np.rint(scaled).astype(np.int64)
+
+    return np.array(
+        [
+            int(Decimal(str(value)).scaleb(decimals).to_integral_value())
+            for value in values
+        ],
+        dtype=object,
+    )
+
+
+def _multiply_scaled(left, right):
+    """
+    Multiplies scaled integer arrays, in Python ints where the product would overflow int64.
+    """
+    if left.dtype == object or right.dtype == object:
+        return left.astype(object) * right.astype(object)
+
+    largest_product = int(np.abs(left).max(initial=0)) * int(
+        np.abs(right).max(initial=0)
+    )
+    if largest_product > INT64_MAX:
+        return left.astype(object) * right.astype(object)
+    return left * right
+
+
+class TwrrSeries:
+    """
+    Rate series of a currency pair held in contiguous arrays for bulk return maths.
+
+    Rates are stored as integers scaled by 10**RATE_DECIMALS, so rates and position
+    values are exact. Returns are ratios of rates and are computed in float64, whose
+    relative error (about 1e-16) is far below the RETURN_DECIMALS they are rounded to.
+    Decimals and dicts are only built by ``to_dicts``, at the serialization boundary.
+    """
+
+    def __init__(self, valuation_dates, rates):
+        self.valuation_dates = valuation_dates
+        self.rates = rates
+
+    @classmethod
+    def from_rate_series(cls, rate_series):
+        """
+        Builds a series from (valuation_date, rate_value) tuples sorted by date.
+        """
+        valuation_dates = [valuation_date for valuation_date, _ in rate_series]
+        rates = to_scaled_ints(
+            [rate_value for _, rate_value in rate_series], RATE_DECIMALS
+        )
+        return cls(valuation_dates, rates)
+
+    def __len__(self):
+        return len(self.valuation_dates)
+
+    def __getitem__(self, index):
+        """
+        Returns the series of the dates selected by the slice ``index``.
+        """
+        return TwrrSeries(self.valuation_dates[index], self.rates[index])
+
+    def period_returns(self):
+        """
+        Returns the return of every period, rate / previous rate - 1; 0 for the first one.
+        """
+        rates = self.rates.astype(np.float64)
+        returns = np.zeros(len(rates))
+        returns[1:] = rates[1:] / rates[:-1] - 1
+        return returns
+
+    def cumulative_returns(self):
+        """
+        Returns the TWRR from the first date to every date. The product of the period
+        returns (1 + r1)(1 + r2)...(1 + rt) telescopes to rate_t / rate_0.
+        """
+        rates = self.rates.astype(np.float64)
+        return rates / rates[0] - 1
+
+    def rolling_returns(self, window_days):
+        """
+        Returns the TWRR of the ``window_days`` days ending on every date, rate_t over
+        the rate of the last date at least ``window_days`` days earlier, minus 1; NaN
+        while the series is shorter than the window. The window starts of all dates
+        are found with one vectorized binary search over the sorted dates, so the
+        whole rolling series is one pass over the rates whatever the window length.
+        """
+        valuation_dates = np.array(self.valuation_dates, dtype="datetime64[D]")
+        window_starts = (
+            np.searchsorted(
+                valuation_dates,
+                valuation_dates - np.timedelta64(window_days, "D"),
+                side="right",
+            )
+            - 1
+        )
+        rates = self.rates.astype(np.float64)
+        returns = np.full(len(rates), np.nan)
+        full_windows = window_starts >= 0
+        returns[full_windows] = (
+            rates[full_windows] / rates[window_starts[full_windows]] - 1
+        )
+        return returns
+
+    def position_values(self, amount):
+        """
+        Returns the value of ``amount`` on every date as integers scaled by
+        10**(AMOUNT_DECIMALS + RATE_DECIMALS).
+        """
+        amount = to_scaled_ints([amount], AMOUNT_DECIMALS)
+        return _multiply_scaled(self.rates, amount)
+
+    def to_dicts(self, amount, rolling_returns=None):
+        """
+        Returns one dict per date with its rate, period return ("twrr"), cumulative
+        TWRR and the value of ``amount``. Rates and values are exact Decimals; returns
+        are floats rounded to RETURN_DECIMALS. ``rolling_returns`` of the dates, as
+        returned by ``rolling_returns``, are added as "rolling_twrr" (None for NaN).
+        """
+        period_returns = np.round(self.period_returns(), RETURN_DECIMALS).tolist()
+        cumulative_returns = np.round(
+            self.cumulative_returns(), RETURN_DECIMALS
+        ).tolist()
+        rates = self.rates.tolist()
+        values = self.position_values(amount).tolist()
+
+        points = [
+            {
+                "valuation_date": valuation_date.isoformat(),
+                "rate_value": Decimal(rate).scaleb(-RATE_DECIMALS),
+                "twrr": period_return,
+                "cumulative_twrr": cumulative_return,
+                "amount": Decimal(value).scaleb(-(AMOUNT_DECIMALS + RATE_DECIMALS)),
+            }
+            for valuation_date, rate, period_return, cumulative_return, value in zip(
+                self.valuation_dates,
+                rates,
+                period_returns,
+                cumulative_returns,
+                values,
+            )
+        ]
+
+        if rolling_returns is not None:
+            rolling_returns = np.round(rolling_returns, RETURN_DECIMALS).tolist()
+            for point, rolling_return in zip(points, rolling_returns):
+                point["rolling_twrr"] = (
+                    None if math.isnan(rolling_return) else rolling_return
+                )
+        return points
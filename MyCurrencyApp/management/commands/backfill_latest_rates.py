@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from MyCurrencyApp.models import CurrencyExchangeRate, LatestExchangeRate
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the LatestExchangeRate table from the exchange rate history, "
+        "keeping the most recent rate of each currency pair and provider."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of latest rates written per statement.",
+        )
+
+    def handle(self, *args, batch_size, **options):
+        latest_rates = {}
+
+        # The history is streamed in date order, so later rows replace earlier ones.
+        for (
+            source_currency_id,
+            source_currency_code,
+            target_currency_id,
+            target_currency_code,
+            provider_id,
+            valuation_date,
+            rate_value,
+        ) in (
+            CurrencyExchangeRate.objects.order_by("valuation_date", "updated_at")
+            .values_list(
+                "source_currency_id",
+                "source_currency__code",
+                "target_currency_id",
+                "target_currency__code",
+                "provider_id",
+                "valuation_date",
+                "rate_value",
+            )
+            .iterator(chunk_size=batch_size)
+        ):
+            key = LatestExchangeRate.make_key(
+                source_currency_code, target_currency_code, provider_id
+            )
+            latest_rates[key] = LatestExchangeRate(
+                key=key,
+                source_currency_id=source_currency_id,
+                target_currency_id=target_currency_id,
+                provider_id=provider_id,
+                valuation_date=valuation_date,
+                rate_value=rate_value,
+            )
+
+        with transaction.atomic():
+            LatestExchangeRate.objects.all().delete()
+            LatestExchangeRate.objects.bulk_create(
+                latest_rates.values(), batch_size=batch_size
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled {len(latest_rates)} latest exchange rates")
+        )
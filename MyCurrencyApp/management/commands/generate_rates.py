@@ -0,0 +1,252 @@
+import csv
+import json
+import os
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from MyCurrencyApp.cache.currency_ids import currency_ids
+from MyCurrencyApp.enums.iso_currencies import IsoCurrencies
+from MyCurrencyApp.helper.cross_rates import get_base_currency_code
+from MyCurrencyApp.helper.rate_generator import iter_generated_rates
+from MyCurrencyApp.helper.rate_import import (
+    refresh_imported_pairs,
+    write_exchange_rate_rows,
+)
+from MyCurrencyApp.models import Currency, CurrencyProvider
+
+FIELD_NAMES = [
+    "source_currency_code",
+    "target_currency_code",
+    "valuation_date",
+    "rate_value",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates a synthetic exchange rate history from a seeded random walk and "
+        "inserts it into the database, or writes it to CSV, JSON or JSON Lines files "
+        "for import_rates and ingest_rates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--years", type=float, default=1, help="Years of daily history."
+        )
+        parser.add_argument(
+            "--end-date",
+            help='Last valuation date, "YYYY-MM-DD" (default: today).',
+        )
+        parser.add_argument(
+            "--currencies",
+            type=int,
+            default=len(IsoCurrencies.CODES),
+            help="Number of currencies, most traded first (missing ones are created).",
+        )
+        parser.add_argument(
+            "--sources",
+            nargs="+",
+            help="Source currencies whose rates to every other currency are generated "
+            "(default: the cross rate base currency).",
+        )
+        parser.add_argument(
+            "--providers",
+            nargs="+",
+            default=["Mock"],
+            help="Names of the providers quoting the rates.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--volatility",
+            type=float,
+            default=0.005,
+            help="Standard deviation of the daily log return.",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write a .csv, .json or .jsonl file instead of inserting the rates. "
+            "With several providers, one file per provider is written.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Number of rows inserted at once.",
+        )
+
+    def handle(
+        self,
+        *args,
+        years,
+        end_date,
+        currencies,
+        sources,
+        providers,
+        seed,
+        volatility,
+        output,
+        batch_size,
+        **options,
+    ):
+        try:
+            end_date = date.fromisoformat(end_date) if end_date else date.today()
+        except ValueError:
+            raise CommandError(f"Invalid end date: {end_date}")
+
+        currency_codes = IsoCurrencies.CODES[: max(2, currencies)]
+        source_codes = sources or [get_base_currency_code()]
+        unknown_codes = set(source_codes) - set(currency_codes)
+        if unknown_codes:
+            raise CommandError(
+                f"Sources are not generated currencies: {', '.join(sorted(unknown_codes))}"
+            )
+
+        provider_ids = dict(
+            CurrencyProvider.objects.filter(name__in=providers).values_list(
+                "name", "id"
+            )
+        )
+        missing_providers = [name for name in providers if name not in provider_ids]
+        if missing_providers:
+            raise CommandError(
+                f"Providers do not exist: {', '.join(missing_providers)}"
+            )
+
+        output_format = None
+        if output:
+            output_format = os.path.splitext(output)[-1].lower()
+            if output_format not in (".csv", ".json", ".jsonl"):
+                raise CommandError(f"Unsupported file type: {output_format}")
+
+        # Imported files only resolve currencies that exist
+        Currency.objects.bulk_create(
+            [Currency(code=code) for code in currency_codes], ignore_conflicts=True
+        )
+        currency_ids.clear()
+
+        day_count = round(years * 365.25)
+        valuation_dates = [
+            end_date - timedelta(days=offset) for offset in range(day_count)
+        ][::-1]
+        rates = iter_generated_rates(
+            currency_codes,
+            source_codes,
+            valuation_dates,
+            provider_count=len(providers),
+            seed=seed,
+            volatility=volatility,
+        )
+
+        started = time.perf_counter()
+        if output:
+            written = self.write_files(rates, output, output_format, providers)
+        else:
+            written = self.insert_rates(
+                rates, [provider_ids[name] for name in providers], batch_size
+            )
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {written} rates of {len(currency_codes)} currencies over "
+                f"{day_count} days for {len(providers)} providers in {elapsed:.1f}s "
+                f"({written / elapsed if elapsed else 0:.0f} rows/sec)"
+            )
+        )
+
+    def insert_rates(self, rates, provider_ids, batch_size):
+        ids = currency_ids.get_ids(IsoCurrencies.CODES)
+        imported_pairs = set()
+        rows = []
+        written = 0
+
+        for provider_index, source_code, target_code, valuation_date, rate in rates:
+            rows.append(
+                (
+                    ids[source_code],
+                    ids[target_code],
+                    provider_ids[provider_index],
+                    valuation_date,
+                    Decimal(f"{rate:.6f}"),
+                )
+            )
+            if len(rows) >= batch_size:
+                written += self.write_rows(rows, batch_size, imported_pairs)
+                rows = []
+        written += self.write_rows(rows, batch_size, imported_pairs)
+
+        if written:
+            refresh_imported_pairs(imported_pairs, stdout=self.stdout)
+        return written
+
+    def write_rows(self, rows, batch_size, imported_pairs):
+        write_exchange_rate_rows(rows, batch_size=batch_size)
+        imported_pairs.update(row[:2] for row in rows)
+        return len(rows)
+
+    def write_files(self, rates, output, output_format, providers):
+        if len(providers) == 1:
+            paths = [output]
+        else:
+            root = os.path.splitext(output)[0]
+            paths = [f"{root}.{name}{output_format}" for name in providers]
+
+        rate_files = [open(path, "w", newline="") for path in paths]
+        written = 0
+        try:
+            writers = [
+                _RateFileWriter(rate_file, output_format) for rate_file in rate_files
+            ]
+            for provider_index, source_code, target_code, valuation_date, rate in rates:
+                writers[provider_index].write(
+                    [
+                        source_code,
+                        target_code,
+                        valuation_date.isoformat(),
+                        f"{rate:.6f}",
+                    ]
+                )
+                written += 1
+            for writer in writers:
+                writer.close()
+        finally:
+            for rate_file in rate_files:
+                rate_file.close()
+
+        for path in paths:
+            self.stdout.write(f"Wrote {path}")
+        return written
+
+
+class _RateFileWriter:
+    """
+    Streams records to a CSV file, a JSON array or a JSON Lines file.
+    """
+
+    def __init__(self, rate_file, output_format):
+        self.rate_file = rate_file
+        self.output_format = output_format
+        self.records = 0
+        if output_format == ".csv":
+            self.csv_writer = csv.writer(rate_file)
+            self.csv_writer.writerow(FIELD_NAMES)
+        elif output_format == ".json":
+            rate_file.write("[")
+
+    def write(self, values):
+        if self.output_format == ".csv":
+            self.csv_writer.writerow(values)
+        else:
+            record = json.dumps(dict(zip(FIELD_NAMES, values)))
+            if self.output_format == ".json":
+                self.rate_file.write(f",\n{record}" if self.records else f"\n{record}")
+            else:
+                self.rate_file.write(f"{record}\n")
+        self.records += 1
+
+    def close(self):
+        if self.output_format == ".json":
+            self.rate_file.write("\n]\n")
@@ -0,0 +1,117 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from MyCurrencyApp.helper.rate_files import iter_rate_records, normalize_record
+from MyCurrencyApp.helper.rate_import import (
+    ImportCheckpoint,
+    refresh_imported_pairs,
+    write_exchange_rate_rows,
+)
+from MyCurrencyApp.models import Currency, CurrencyProvider
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams historical exchange rates from CSV, JSON or JSON Lines files into the "
+        "database in chunks. Existing rates are kept, and an interrupted import "
+        "resumes from its checkpoint."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("files", nargs="+", help="Files to import.")
+        parser.add_argument(
+            "--provider",
+            default="Mock",
+            help="Name of the provider the rates are attributed to.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Number of records written and checkpointed at once.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore existing checkpoints and import the files from the start.",
+        )
+
+    def handle(self, *args, files, provider, chunk_size, restart, **options):
+        try:
+            provider_id = CurrencyProvider.objects.get(name=provider).id
+        except CurrencyProvider.DoesNotExist:
+            raise CommandError(f"Provider '{provider}' does not exist")
+
+        currency_ids = dict(Currency.objects.values_list("code", "id"))
+        imported_pairs = set()
+        total_written = 0
+
+        for file_path in files:
+            written, pairs = self.import_file(
+                file_path, currency_ids, provider_id, chunk_size, restart
+            )
+            total_written += written
+            imported_pairs |= pairs
+
+        if imported_pairs:
+            refresh_imported_pairs(imported_pairs, stdout=self.stdout)
+
+    def import_file(self, file_path, currency_ids, provider_id, chunk_size, restart):
+        """
+        Imports one file chunk by chunk, checkpointing after every committed chunk.
+
+        Returns:
+            tuple: The number of rows inserted and the (source_id, target_id) pairs
+                whose latest rates must be refreshed, including the pairs of chunks
+                committed by an interrupted run.
+        """
+        checkpoint = ImportCheckpoint(file_path)
+        resume_from = 0 if restart else checkpoint.load()
+        if resume_from:
+            self.stdout.write(f"{file_path}: resuming after record {resume_from}")
+
+        records = resume_from
+        written = invalid = 0
+        pairs = set()
+        rows = []
+        started = time.perf_counter()
+
+        for position, record in enumerate(iter_rate_records(file_path)):
+            row = normalize_record(record, currency_ids, provider_id)
+            if position < resume_from:
+                # Committed before the interruption, possibly without the refresh
+                if row is not None:
+                    pairs.add(row[:2])
+                continue
+
+            records += 1
+            if row is None:
+                invalid += 1
+            else:
+                rows.append(row)
+                pairs.add(row[:2])
+
+            if records % chunk_size == 0:
+                written += write_exchange_rate_rows(rows)
+                checkpoint.save(records)
+                rows = []
+                self._report(file_path, records, written, started)
+
+        written += write_exchange_rate_rows(rows)
+        checkpoint.clear()
+
+        self._report(file_path, records, written, started)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{file_path}: inserted {written} rows, skipped {invalid} invalid records"
+            )
+        )
+        return written, pairs if written or resume_from else set()
+
+    def _report(self, file_path, records, written, started):
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"{file_path}: {records} records read, {written} rows inserted, "
+            f"{written / elapsed if elapsed else 0:.0f} inserted rows/sec"
+        )
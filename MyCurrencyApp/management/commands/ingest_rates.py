@@ -0,0 +1,142 @@
+import glob
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from queue import Empty
+
+from django.core.management.base import BaseCommand, CommandError
+
+from MyCurrencyApp.helper.rate_files import init_parse_worker, parse_rate_file
+from MyCurrencyApp.helper.rate_import import (
+    refresh_imported_pairs,
+    write_exchange_rate_rows,
+)
+from MyCurrencyApp.models import Currency, CurrencyProvider
+
+
+class Command(BaseCommand):
+    help = (
+        "Ingests many exchange rate files at once: a pool of processes parses, "
+        "validates and normalizes the files into row batches, and this process "
+        "writes every batch to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths", nargs="+", help="Files, directories or glob patterns to ingest."
+        )
+        parser.add_argument(
+            "--provider",
+            default="Mock",
+            help="Name of the provider the rates are attributed to.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of parse processes.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of rows sent to the writer and written at once.",
+        )
+
+    def handle(self, *args, paths, provider, workers, batch_size, **options):
+        try:
+            provider_id = CurrencyProvider.objects.get(name=provider).id
+        except CurrencyProvider.DoesNotExist:
+            raise CommandError(f"Provider '{provider}' does not exist")
+
+        files = self.find_files(paths)
+        if not files:
+            raise CommandError("No rate files found")
+
+        currency_ids = dict(Currency.objects.values_list("code", "id"))
+        # Bounded, so parse workers wait for the writer instead of filling memory.
+        queue = multiprocessing.Queue(maxsize=workers * 4)
+        pending_files = set(files)
+        imported_pairs = set()
+        failed_files = []
+        written = 0
+        started = time.perf_counter()
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(files)),
+            initializer=init_parse_worker,
+            initargs=(queue, currency_ids, provider_id, batch_size),
+        ) as executor:
+            futures = [
+                executor.submit(parse_rate_file, file_path) for file_path in files
+            ]
+
+            try:
+                while pending_files:
+                    try:
+                        message, file_path, payload = queue.get(timeout=1)
+                    except Empty:
+                        if all(future.done() for future in futures) and queue.empty():
+                            # A worker died without reporting its files.
+                            failed_files += sorted(pending_files)
+                            break
+                        continue
+
+                    if message == "rows":
+                        written += write_exchange_rate_rows(
+                            payload, batch_size=batch_size
+                        )
+                        imported_pairs.update(row[:2] for row in payload)
+                    elif message == "done":
+                        pending_files.discard(file_path)
+                        self.stdout.write(
+                            f"{file_path}: {payload['records']} records, "
+                            f"{payload['invalid']} invalid"
+                        )
+                    else:
+                        pending_files.discard(file_path)
+                        failed_files.append(file_path)
+                        self.stderr.write(f"{file_path}: {payload}")
+            except BaseException:
+                self.stop_workers(futures, queue)
+                raise
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Inserted {written} rows from {len(files) - len(failed_files)} files "
+                f"in {elapsed:.1f}s "
+                f"({written / elapsed if elapsed else 0:.0f} inserted rows/sec)"
+            )
+        )
+
+        if written:
+            refresh_imported_pairs(imported_pairs, stdout=self.stdout)
+        if failed_files:
+            raise CommandError(f"Failed to ingest: {', '.join(failed_files)}")
+
+    def stop_workers(self, futures, queue):
+        """
+        Cancels the files not parsed yet and drains the queue until the running
+        workers finish, since they block on the bounded queue once the writer stops
+        and the executor waits for them on shutdown.
+        """
+        for future in futures:
+            future.cancel()
+        while True:
+            try:
+                queue.get(timeout=0.1)
+            except Empty:
+                if all(future.done() for future in futures):
+                    break
+
+    def find_files(self, paths):
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for pattern in ("*.csv", "*.json", "*.jsonl", "*.ndjson"):
+                    files.extend(glob.glob(os.path.join(path, pattern)))
+            else:
+                files.extend(glob.glob(path))
+        return sorted(set(files))
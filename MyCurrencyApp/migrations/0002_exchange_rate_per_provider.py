@@ -0,0 +1,55 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:17
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def remove_duplicate_exchange_rates(apps, schema_editor):
+    """
+    Keeps the most recently saved rate of each currency pair, date and provider.
+    """
+    CurrencyExchangeRate = apps.get_model("MyCurrencyApp", "CurrencyExchangeRate")
+    duplicates = (
+        CurrencyExchangeRate.objects.values(
+            "source_currency", "target_currency", "valuation_date", "provider"
+        )
+        .annotate(latest_id=Max("id"), rate_count=Count("id"))
+        .filter(rate_count__gt=1)
+    )
+
+    for duplicate in duplicates:
+        CurrencyExchangeRate.objects.filter(
+            source_currency=duplicate["source_currency"],
+            target_currency=duplicate["target_currency"],
+            valuation_date=duplicate["valuation_date"],
+            provider=duplicate["provider"],
+        ).exclude(id=duplicate["latest_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("MyCurrencyApp", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="currencyexchangerate",
+            unique_together=set(),
+        ),
+        migrations.RunPython(
+            remove_duplicate_exchange_rates, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="currencyexchangerate",
+            constraint=models.UniqueConstraint(
+                fields=(
+                    "source_currency",
+                    "target_currency",
+                    "valuation_date",
+                    "provider",
+                ),
+                name="unique_exchange_rate_per_provider",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("MyCurrencyApp", "0002_exchange_rate_per_provider"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestExchangeRate",
+            fields=[
+                (
+                    "key",
+                    models.CharField(max_length=32, primary_key=True, serialize=False),
+                ),
+                ("valuation_date", models.DateField()),
+                ("rate_value", models.DecimalField(decimal_places=6, max_digits=18)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "provider",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_rates",
+                        to="MyCurrencyApp.currencyprovider",
+                    ),
+                ),
+                (
+                    "source_currency",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="MyCurrencyApp.currency",
+                    ),
+                ),
+                (
+                    "target_currency",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="MyCurrencyApp.currency",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("MyCurrencyApp", "0003_latest_exchange_rate"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="currencyexchangerate",
+            index=models.Index(
+                fields=["source_currency", "valuation_date"],
+                include=("target_currency", "rate_value"),
+                name="exchange_rate_source_date_idx",
+            ),
+        ),
+    ]
@@ -53,15 +53,59 @@ class CurrencyExchangeRate(models.Model):
 
     class Meta:
         """
-        Ensures uniqueness for exchange rates.
+        Ensures a single exchange rate per currency pair, valuation date and provider,
+        which is the conflict target of bulk upserts. Its index also serves pair and
+        date range lookups; rates of one source currency over a date range use the
+        source/date index, which covers the target currency and rate on PostgreSQL.
         """
 
-        unique_together = (
-            "source_currency",
-            "target_currency",
-            "valuation_date",
-            "rate_value",
-        )
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "source_currency",
+                    "target_currency",
+                    "valuation_date",
+                    "provider",
+                ],
+                name="unique_exchange_rate_per_provider",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["source_currency", "valuation_date"],
+                include=["target_currency", "rate_value"],
+                name="exchange_rate_source_date_idx",
+            )
+        ]
 
     def __str__(self):
         return f"{self.source_currency.code} to {self.target_currency.code} on {self.valuation_date}: {self.rate_value}"
+
+
+class LatestExchangeRate(models.Model):
+    """
+    The most recent exchange rate of each currency pair and provider, kept up to date
+    on write so current rates are read by primary key instead of scanning the history
+    in CurrencyExchangeRate. The key is "SOURCE:TARGET:provider_id".
+    """
+
+    key = models.CharField(max_length=32, primary_key=True)
+    source_currency = models.ForeignKey(
+        Currency, on_delete=models.CASCADE, related_name="+"
+    )
+    target_currency = models.ForeignKey(
+        Currency, on_delete=models.CASCADE, related_name="+"
+    )
+    provider = models.ForeignKey(
+        CurrencyProvider, on_delete=models.CASCADE, related_name="latest_rates"
+    )
+    valuation_date = models.DateField()
+    rate_value = models.DecimalField(max_digits=18, decimal_places=6)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def make_key(source_currency_code, target_currency_code, provider_id):
+        return f"{source_currency_code}:{target_currency_code}:{provider_id}"
+
+    def __str__(self):
+        return f"{self.key} on {self.valuation_date}: {self.rate_value}"
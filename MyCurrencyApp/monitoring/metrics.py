@@ -0,0 +1,270 @@
+import bisect
+import math
+import threading
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class _ShardedValues:
+    """
+    Values keyed by label tuple, written to a dict owned by the writing thread.
+
+    A thread only ever updates its own shard, so updates take no lock; the lock is
+    only taken when a thread writes its first value and when values are read. Reads
+    merge the shards of every thread with ``merge(total, value)``; the shards of
+    exited threads are folded into a single retired shard at that point, so threads
+    created per request do not grow the shard list.
+    """
+
+    def __init__(self, merge):
+        self._merge = merge
+        self._local = threading.local()
+        self._shards = []
+        self._retired = {}
+        self._lock = threading.Lock()
+
+    def shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def totals(self):
+        with self._lock:
+            live_shards = []
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live_shards.append((thread, shard))
+                else:
+                    self._add(self._retired, shard)
+            self._shards = live_shards
+
+            totals = self._add({}, self._retired)
+            for _, shard in live_shards:
+                self._add(totals, shard)
+        return totals
+
+    def _add(self, totals, shard):
+        for key, value in list(shard.items()):
+            totals[key] = self._merge(totals.get(key), value)
+        return totals
+
+
+class Counter:
+    """
+    A monotonically increasing value per label set.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = _ShardedValues(
+            lambda total, value: value if total is None else total + value
+        )
+
+    def inc(self, amount=1, **labels):
+        shard = self._values.shard()
+        key = _label_values(self.labelnames, labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def values(self):
+        """
+        Returns the total of every label set, keyed by label values.
+        """
+        return self._values.totals()
+
+    def samples(self):
+        return [
+            (self.name, dict(zip(self.labelnames, key)), value)
+            for key, value in sorted(self.values().items())
+        ]
+
+
+class Histogram:
+    """
+    Observations counted in cumulative buckets per label set, with their count and sum.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values = _ShardedValues(
+            lambda total, counts: (
+                list(counts)
+                if total is None
+                else [left + right for left, right in zip(total, counts)]
+            )
+        )
+
+    def observe(self, value, **labels):
+        shard = self._values.shard()
+        key = _label_values(self.labelnames, labels)
+        counts = shard.get(key)
+        if counts is None:
+            # One count per bucket, then the sum of the observations
+            counts = shard[key] = [0] * len(self.buckets) + [0.0]
+
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def values(self):
+        """
+        Returns the per-bucket counts and sum of every label set, keyed by label values.
+        """
+        return self._values.totals()
+
+    def samples(self):
+        samples = []
+        for key, counts in sorted(self.values().items()):
+            labels = dict(zip(self.labelnames, key))
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets, counts):
+                cumulative_count += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(upper_bound)},
+                        cumulative_count,
+                    )
+                )
+            samples.append((f"{self.name}_count", labels, cumulative_count))
+            samples.append((f"{self.name}_sum", labels, counts[-1]))
+        return samples
+
+
+class Gauge:
+    """
+    A value computed by ``collect`` when the metrics are rendered. ``collect`` returns
+    the value of every label set keyed by label values.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name, documentation, labelnames, collect):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+
+    def samples(self):
+        return [
+            (self.name, dict(zip(self.labelnames, key)), value)
+            for key, value in sorted(self.collect().items())
+        ]
+
+
+def _label_values(labelnames, labels):
+    return tuple(str(labels.get(labelname, "")) for labelname in labelnames)
+
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+        + "}"
+    )
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(metrics):
+    """
+    Renders metrics in the Prometheus text exposition format.
+    """
+    lines = []
+    for metric in metrics:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+request_latency = Histogram(
+    "mycurrency_request_duration_seconds",
+    "Latency of API requests by endpoint.",
+    ["endpoint", "method"],
+)
+provider_calls = Counter(
+    "mycurrency_provider_calls_total",
+    "Calls to exchange rate providers.",
+    ["provider"],
+)
+provider_errors = Counter(
+    "mycurrency_provider_errors_total",
+    "Provider calls that failed or returned no data.",
+    ["provider"],
+)
+provider_latency = Histogram(
+    "mycurrency_provider_call_duration_seconds",
+    "Latency of calls to exchange rate providers.",
+    ["provider"],
+)
+cache_lookups = Counter(
+    "mycurrency_cache_lookups_total",
+    "Rate cache lookups by cache layer and result.",
+    ["cache", "result"],
+)
+cache_hit_ratio = Gauge(
+    "mycurrency_cache_hit_ratio",
+    "Share of rate cache lookups served from the cache.",
+    ["cache"],
+    lambda: _get_cache_hit_ratios(cache_lookups.values()),
+)
+exchange_rate_rows_written = Counter(
+    "mycurrency_exchange_rate_rows_written_total",
+    "Exchange rate rows saved by bulk upserts.",
+)
+
+REGISTRY = [
+    request_latency,
+    provider_calls,
+    provider_errors,
+    provider_latency,
+    cache_lookups,
+    cache_hit_ratio,
+    exchange_rate_rows_written,
+]
+
+
+def _get_cache_hit_ratios(lookups):
+    totals = {}
+    for (cache_name, result), count in lookups.items():
+        hits, total = totals.get(cache_name, (0, 0))
+        totals[cache_name] = (hits + (count if result == "hit" else 0), total + count)
+    return {(cache_name,): hits / total for cache_name, (hits, total) in totals.items()}
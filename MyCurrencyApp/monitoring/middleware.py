@@ -0,0 +1,52 @@
+import json
+import logging
+from contextlib import ExitStack
+
+from django.db import connections
+
+from .metrics import request_latency
+from .request_metrics import QueryTimer, start_request_metrics, stop_request_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetricsMiddleware:
+    """
+    Collects the database queries, provider calls and cache lookups of every request.
+    The metrics are returned in a Server-Timing header and logged as one JSON line, and
+    request latencies are added to the process metrics served by /api/metrics.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics, token = start_request_metrics()
+        try:
+            with ExitStack() as stack:
+                query_timer = QueryTimer(metrics)
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(query_timer))
+                response = self.get_response(request)
+        finally:
+            stop_request_metrics(token)
+
+        resolver_match = request.resolver_match
+        request_latency.observe(
+            metrics.elapsed,
+            endpoint=resolver_match.url_name if resolver_match else "unmatched",
+            method=request.method,
+        )
+        response["Server-Timing"] = metrics.server_timing()
+        logger.info(
+            json.dumps(
+                {
+                    "event": "request",
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    **metrics.as_dict(),
+                }
+            )
+        )
+        return response
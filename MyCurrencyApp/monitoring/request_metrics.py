@@ -0,0 +1,208 @@
+import functools
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from . import metrics as process_metrics
+
+_current_metrics = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    Database, provider and cache activity of one request.
+
+    The metrics of the current request are found through a context variable, so code
+    deep in the helpers records into them without threading them through every call.
+    Provider fetches running on the fetch pool record into the same object, hence
+    the lock.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.query_count = 0
+        self.query_time = 0.0
+        self.providers = {}
+        self.caches = {}
+        self.spans = {}
+        self._lock = threading.Lock()
+
+    def record_query(self, duration):
+        with self._lock:
+            self.query_count += 1
+            self.query_time += duration
+
+    def record_provider_call(self, provider_name, duration, failed=False):
+        with self._lock:
+            calls = self.providers.setdefault(
+                provider_name, {"calls": 0, "errors": 0, "time": 0.0}
+            )
+            calls["calls"] += 1
+            calls["errors"] += int(failed)
+            calls["time"] += duration
+
+    def record_cache_lookup(self, cache_name, hit):
+        with self._lock:
+            lookups = self.caches.setdefault(cache_name, {"hits": 0, "misses": 0})
+            lookups["hits" if hit else "misses"] += 1
+
+    def record_span(self, name, duration):
+        with self._lock:
+            self.spans[name] = self.spans.get(name, 0.0) + duration
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self):
+        """
+        Formats the metrics as a Server-Timing header value, durations in milliseconds.
+        """
+        with self._lock:
+            metrics = [
+                f'db;dur={_ms(self.query_time)};desc="{self.query_count} queries"'
+            ]
+            metrics += [
+                f"provider-{_token(name)};dur={_ms(calls['time'])};"
+                f'desc="{calls["calls"]} calls, {calls["errors"]} errors"'
+                for name, calls in sorted(self.providers.items())
+            ]
+            metrics += [
+                f"cache-{_token(name)};"
+                f'desc="{lookups["hits"]} hits, {lookups["misses"]} misses"'
+                for name, lookups in sorted(self.caches.items())
+            ]
+            metrics += [
+                f"{_token(name)};dur={_ms(duration)}"
+                for name, duration in sorted(self.spans.items())
+            ]
+        metrics.append(f"total;dur={_ms(self.elapsed)}")
+        return ", ".join(metrics)
+
+    def as_dict(self):
+        """
+        Returns the metrics as a JSON serializable dict, durations in milliseconds.
+        """
+        with self._lock:
+            return {
+                "duration_ms": _ms(self.elapsed),
+                "db": {
+                    "queries": self.query_count,
+                    "duration_ms": _ms(self.query_time),
+                },
+                "providers": {
+                    name: {
+                        "calls": calls["calls"],
+                        "errors": calls["errors"],
+                        "duration_ms": _ms(calls["time"]),
+                    }
+                    for name, calls in self.providers.items()
+                },
+                "cache": {name: dict(lookups) for name, lookups in self.caches.items()},
+                "spans": {name: _ms(duration) for name, duration in self.spans.items()},
+            }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+def _token(name):
+    return re.sub(r"[^A-Za-z0-9_-]", "_", str(name)).lower()
+
+
+def start_request_metrics():
+    """
+    Starts collecting the metrics of the current request.
+
+    Returns:
+        tuple: The new RequestMetrics and the token passed to ``stop_request_metrics``.
+    """
+    metrics = RequestMetrics()
+    return metrics, _current_metrics.set(metrics)
+
+
+def stop_request_metrics(token):
+    _current_metrics.reset(token)
+
+
+def get_request_metrics():
+    """
+    Returns the metrics of the current request, or None outside of a request.
+    """
+    return _current_metrics.get()
+
+
+def record_cache_lookup(cache_name, hit):
+    process_metrics.cache_lookups.inc(cache=cache_name, result="hit" if hit else "miss")
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record_cache_lookup(cache_name, hit)
+
+
+@contextmanager
+def measure(name):
+    """
+    Adds the time spent in the block to the span ``name`` of the current request.
+    """
+    metrics = _current_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.record_span(name, time.perf_counter() - started_at)
+
+
+def timed_provider_call(method):
+    """
+    Wraps a provider method so its calls are counted and timed in the process metrics
+    and in the metrics of the current request.
+    """
+
+    @functools.wraps(method)
+    def wrapper(provider_instance, *args, **kwargs):
+        started_at = time.perf_counter()
+        failed = True
+        try:
+            result = method(provider_instance, *args, **kwargs)
+            failed = result is None
+            return result
+        finally:
+            _record_provider_call(
+                provider_instance.name, time.perf_counter() - started_at, failed
+            )
+
+    return wrapper
+
+
+def _record_provider_call(provider_name, duration, failed):
+    process_metrics.provider_calls.inc(provider=provider_name)
+    process_metrics.provider_latency.observe(duration, provider=provider_name)
+    if failed:
+        process_metrics.provider_errors.inc(provider=provider_name)
+
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record_provider_call(provider_name, duration, failed)
+
+
+class QueryTimer:
+    """
+    Database execute wrapper recording the count and duration of queries.
+    """
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def __call__(self, execute, sql, params, many, context):
+        started_at = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.metrics.record_query(time.perf_counter() - started_at)
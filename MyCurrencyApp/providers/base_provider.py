@@ -1,9 +1,29 @@
+from ..monitoring.request_metrics import timed_provider_call
+from .http_session import get_http_session
+
+
 class BaseProvider:
+    # Providers able to return many dates in one call set this and implement
+    # get_exchange_rate_series.
+    supports_timeseries = False
+    max_timeseries_days = 365
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Provider calls are counted and timed in the metrics of the current request
+        for method_name in ("get_exchange_rate_data", "get_exchange_rate_series"):
+            if method_name in cls.__dict__:
+                setattr(
+                    cls, method_name, timed_provider_call(cls.__dict__[method_name])
+                )
+
     def __init__(self, provider_model, url):
+        self.name = provider_model.name
         self.url = url
         self.api_key = provider_model.api_key
         self.timeout = 10  # Timeout of 10 seconds per request
         self.base_currency = provider_model.default_base_currency
+        self.session = get_http_session()  # Pooled keep-alive connections
 
     def get_exchange_rate_data(
         self, source_currency, exchanged_currency, valuation_date
@@ -13,5 +33,15 @@ class BaseProvider:
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def get_exchange_rate_series(
+        self, source_currency, exchanged_currency, start_date, end_date
+    ):
+        """
+        Optional range fetch, implemented by providers with ``supports_timeseries``.
+        Returns the rates of every date between ``start_date`` and ``end_date``
+        ("YYYY-MM-DD", inclusive) keyed by date under "rates".
+        """
+        raise NotImplementedError("Provider does not support time series.")
+
     def set_url(self, url, endpoint):
         self.url = f"{url}/{endpoint}"
@@ -0,0 +1,193 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+
+class ProviderUnavailable(Exception):
+    """
+    Raised instead of calling a provider whose circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    The circuit opens after ``failure_threshold`` consecutive failures and calls are
+    then skipped immediately. After ``recovery_timeout`` seconds it becomes half-open and
+    lets a single trial call through: a success closes it, a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, failure_threshold=3, recovery_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.recovery_timeout
+            ):
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logging.warning(f"Circuit of provider {self.name} opened")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "provider": self.name,
+                "state": self.state,
+                "failures": self.failures,
+                "seconds_until_retry": (
+                    max(
+                        0.0,
+                        self.recovery_timeout - (time.monotonic() - self.opened_at),
+                    )
+                    if self.state == self.OPEN
+                    else 0.0
+                ),
+            }
+
+
+class NegativeCache:
+    """
+    Remembers failed (provider, source currency, target currencies, valuation date)
+    lookups for ``ttl`` seconds.
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._expiries = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            expiry = self._expiries.get(key)
+            if expiry is not None and expiry < time.monotonic():
+                del self._expiries[key]
+                expiry = None
+            return expiry is not None
+
+    def add(self, key):
+        with self._lock:
+            self._expiries[key] = time.monotonic() + self.ttl
+
+    def clear(self):
+        with self._lock:
+            self._expiries.clear()
+
+    def __len__(self):
+        with self._lock:
+            now = time.monotonic()
+            return sum(1 for expiry in self._expiries.values() if expiry >= now)
+
+
+_config = getattr(settings, "PROVIDER_CIRCUIT_BREAKER", {})
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+failed_lookups = NegativeCache(ttl=_config.get("negative_cache_ttl", 60))
+
+
+def get_circuit_breaker(provider_name):
+    with _circuit_breakers_lock:
+        if provider_name not in _circuit_breakers:
+            _circuit_breakers[provider_name] = CircuitBreaker(
+                provider_name,
+                failure_threshold=_config.get("failure_threshold", 3),
+                recovery_timeout=_config.get("recovery_timeout", 30),
+            )
+        return _circuit_breakers[provider_name]
+
+
+def get_circuit_breaker_states():
+    """
+    Returns the state of every provider circuit, for monitoring.
+    """
+    with _circuit_breakers_lock:
+        circuit_breakers = list(_circuit_breakers.values())
+    return [circuit_breaker.snapshot() for circuit_breaker in circuit_breakers]
+
+
+def reset_circuit_breakers():
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
+    failed_lookups.clear()
+
+
+def guarded_fetch(provider, lookup, fetch):
+    """
+    Calls ``fetch`` for a provider through its circuit breaker and the negative cache.
+
+    Args:
+        provider (CurrencyProvider): The provider being called.
+        lookup (tuple): The source currency code, exchanged currency code ("" for all)
+            and date or date span being looked up, part of the negative cache key.
+        fetch (callable): Performs the provider call and returns its data.
+
+    Returns:
+        dict or None: The provider data, or None if the lookup failed recently or now.
+            Data without rates is returned as is.
+
+    Raises:
+        ProviderUnavailable: If the provider circuit is open.
+        Exception: Any error raised by ``fetch``, after it is recorded as a failure.
+    """
+    key = (provider.name, *(str(part) for part in lookup))
+    if key in failed_lookups:
+        return None
+
+    circuit_breaker = get_circuit_breaker(provider.name)
+    if not circuit_breaker.allow_request():
+        raise ProviderUnavailable(f"Circuit of provider {provider.name} is open")
+
+    try:
+        data = fetch()
+    except Exception:
+        circuit_breaker.record_failure()
+        failed_lookups.add(key)
+        raise
+
+    if data is None:
+        circuit_breaker.record_failure()
+        failed_lookups.add(key)
+        return None
+
+    circuit_breaker.record_success()
+    return data
@@ -0,0 +1,89 @@
+import contextvars
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+
+_executor = None
+_executor_lock = threading.Lock()
+_provider_slots = {}
+_provider_slots_lock = threading.Lock()
+
+
+def get_max_workers():
+    return getattr(settings, "PROVIDER_FETCH", {}).get("max_workers", 8)
+
+
+def get_provider_concurrency(provider_name):
+    """
+    Returns how many requests to a provider may run at once. Providers without a
+    configured limit may use every worker.
+    """
+    limits = getattr(settings, "PROVIDER_FETCH", {}).get("max_concurrency", {})
+    return max(1, min(limits.get(provider_name, get_max_workers()), get_max_workers()))
+
+
+def _get_executor():
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_max_workers(), thread_name_prefix="provider-fetch"
+            )
+        return _executor
+
+
+def _get_provider_slots(provider_name, concurrency):
+    with _provider_slots_lock:
+        key = (provider_name, concurrency)
+        if key not in _provider_slots:
+            _provider_slots[key] = threading.BoundedSemaphore(concurrency)
+        return _provider_slots[key]
+
+
+def fetch_concurrently(provider, provider_instance, fetch, items):
+    """
+    Calls ``fetch(provider_instance, item)`` for every item on the shared provider fetch
+    pool, with at most the provider's concurrency limit in flight across the process.
+    Each call gets its own copy of the provider client, since clients keep the
+    endpoint of the current request in their URL.
+
+    Args:
+        provider (CurrencyProvider): The provider being called.
+        provider_instance (BaseProvider): The provider client to copy.
+        fetch (callable): Called with a client and an item.
+        items (list): The items to fetch, e.g. valuation dates.
+
+    Returns:
+        list: One (item, result, error) tuple per item, in the order of ``items``.
+    """
+    concurrency = get_provider_concurrency(provider.name)
+
+    if concurrency == 1 or len(items) < 2:
+        return [_call(fetch, provider_instance, item) for item in items]
+
+    provider_slots = _get_provider_slots(provider.name, concurrency)
+
+    def run(item):
+        try:
+            with provider_slots:
+                return _call(fetch, copy.copy(provider_instance), item)
+        finally:
+            connections.close_all()
+
+    # Each task runs in a copy of the caller's context to record into its request metrics
+    futures = [
+        _get_executor().submit(contextvars.copy_context().run, run, item)
+        for item in items
+    ]
+    return [future.result() for future in futures]
+
+
+def _call(fetch, provider_instance, item):
+    try:
+        return item, fetch(provider_instance, item), None
+    except Exception as e:
+        return item, None, e
@@ -5,6 +5,8 @@ from ..enums.available_currencies import AvailableCurrencies
 
 
 class FixerProvider(BaseProvider):
+    supports_timeseries = True
+
     def __init__(self, provider_model, url):
         super().__init__(provider_model, url)
 
@@ -24,7 +26,7 @@ class FixerProvider(BaseProvider):
             "access_key": self.api_key,
         }
         try:
-            response = requests.get(self.url, params=params, timeout=self.timeout)
+            response = self.session.get(self.url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -34,6 +36,8 @@ class FixerProvider(BaseProvider):
                 )
                 params["symbols"] = ",".join(AvailableCurrencies.CURRENCIES)
                 data = self.get_adjusted_rates(source_currency, params)
+                if data is None:
+                    return None
 
                 return {
                     "source_currency": source_currency,
@@ -42,6 +46,8 @@ class FixerProvider(BaseProvider):
                     "valuation_date": (
                         data.get("date") if data.get("date") else valuation_date
                     ),
+                    "base_currency": self.base_currency,
+                    "base_rates": data.get("base_rates", {}),
                 }
 
             return {
@@ -49,6 +55,12 @@ class FixerProvider(BaseProvider):
                 "exchanged_currency": exchanged_currency,
                 "rates": data.get("rates", []),
                 "valuation_date": valuation_date,
+                "base_currency": source_currency,
+                "base_rates": (
+                    data.get("rates", {})
+                    if source_currency == self.base_currency
+                    else {}
+                ),
             }
         except Exception as e:
             logging.error(f"Error fetching data from FixerProvider: {e}")
@@ -59,11 +71,13 @@ class FixerProvider(BaseProvider):
         Fetches rates with a default base currency and recalculates them to use the desired base currency.
 
         Returns:
-            dict: A dictionary of rates adjusted to the desired base currency.
+            dict: A dictionary of rates adjusted to the desired base currency, along with
+                the fetched base currency vector under "base_rates", or None if the
+                request failed.
         """
         try:
             params["base"] = self.base_currency
-            response = requests.get(self.url, params=params, timeout=self.timeout)
+            response = self.session.get(self.url, params=params, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
 
@@ -72,17 +86,98 @@ class FixerProvider(BaseProvider):
                 logging.info(
                     f"Desired base currency '{target_base_currency}' not found in the response."
                 )
-                return {"rates": {}}
-
-            target_base_rate = rates[target_base_currency]
+                return {"rates": {}, "base_rates": rates}
 
-            adjusted_rates = {}
-            for currency, rate in rates.items():
-                if currency != target_base_currency:
-                    adjusted_rates[currency] = rate / target_base_rate
-
-            return {"rates": adjusted_rates}
+            return {
+                "rates": self.adjust_rates(rates, target_base_currency),
+                "base_rates": rates,
+            }
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Error fetching data from provider: {e}")
-            return {"rates": {}}
+            return None
+
+    def get_exchange_rate_series(
+        self, source_currency, exchanged_currency, start_date, end_date
+    ):
+        """
+        Get the exchange rates of a date range from the Fixer timeseries endpoint.
+        Returns None if Fixer rejects the request, so the dates are fetched one by one.
+        """
+        params = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "base": source_currency,
+            "symbols": (
+                exchanged_currency
+                if exchanged_currency
+                else ",".join(AvailableCurrencies.CURRENCIES)
+            ),
+            "access_key": self.api_key,
+        }
+        try:
+            response = self.session.get(self.url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+
+            if not data.get("success", True) and data.get("error").get("code") == 105:
+                logging.warning(
+                    f"Provider only supports {self.base_currency} as base. Adjusting rates for {source_currency}."
+                )
+                params["base"] = self.base_currency
+                params["symbols"] = ",".join(AvailableCurrencies.CURRENCIES)
+                response = self.session.get(
+                    self.url, params=params, timeout=self.timeout
+                )
+                response.raise_for_status()
+                data = response.json()
+                if not data.get("success", True):
+                    logging.error(
+                        f"FixerProvider rejected the time series: {data.get('error')}"
+                    )
+                    return None
+                base_rates = data.get("rates", {})
+
+                return {
+                    "source_currency": source_currency,
+                    "exchanged_currency": exchanged_currency,
+                    "rates": {
+                        valuation_date: self.adjust_rates(rates, source_currency)
+                        for valuation_date, rates in base_rates.items()
+                        if source_currency in rates
+                    },
+                    "base_currency": self.base_currency,
+                    "base_rates": base_rates,
+                }
+
+            if not data.get("success", True):
+                logging.error(
+                    f"FixerProvider rejected the time series: {data.get('error')}"
+                )
+                return None
+
+            rates = data.get("rates", {})
+            return {
+                "source_currency": source_currency,
+                "exchanged_currency": exchanged_currency,
+                "rates": rates,
+                "base_currency": source_currency,
+                "base_rates": rates if source_currency == self.base_currency else {},
+            }
+        except Exception as e:
+            logging.error(f"Error fetching time series from FixerProvider: {e}")
+            return None
+
+    @staticmethod
+    def adjust_rates(rates, target_base_currency):
+        """
+        Recalculates rates of another base currency to use ``target_base_currency`` as base.
+        """
+        target_base_rate = rates[target_base_currency]
+
+        adjusted_rates = {}
+        for currency, rate in rates.items():
+            if currency != target_base_currency:
+                adjusted_rates[currency] = rate / target_base_rate
+
+        return adjusted_rates
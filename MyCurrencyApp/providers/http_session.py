@@ -0,0 +1,75 @@
+import threading
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_HTTP_CONFIG = {
+    "pool_connections": 4,
+    "pool_maxsize": 16,
+    "keep_alive": True,
+    "max_retries": 2,
+    "backoff_factor": 0.2,
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def build_http_session(
+    pool_connections=4,
+    pool_maxsize=16,
+    keep_alive=True,
+    max_retries=2,
+    backoff_factor=0.2,
+):
+    """
+    Builds a requests session with pooled keep-alive connections and retries on
+    connection errors and transient server errors. Read timeouts are not retried, as
+    each attempt can take the whole timeout, and rate limiting (429) is left to the
+    provider circuit breaker.
+
+    Args:
+        pool_connections (int): Number of hosts whose connections are pooled.
+        pool_maxsize (int): Maximum number of connections kept per host.
+        keep_alive (bool): Reuse connections between requests.
+        max_retries (int): Retries of idempotent requests.
+        backoff_factor (float): Exponential backoff between retries, in seconds.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=max_retries,
+            read=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_http_session():
+    """
+    Returns the process-wide session shared by every provider instance.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_http_session(
+                    **{**DEFAULT_HTTP_CONFIG, **getattr(settings, "PROVIDER_HTTP", {})}
+                )
+    return _session
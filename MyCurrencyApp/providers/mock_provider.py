@@ -1,9 +1,12 @@
 import random
+from datetime import datetime, timedelta
 from .base_provider import BaseProvider
 from ..models import Currency
 
 
 class MockProvider(BaseProvider):
+    supports_timeseries = True
+
     def __init__(self, provider_model, url):
         super().__init__(provider_model, url)
 
@@ -28,3 +31,29 @@ class MockProvider(BaseProvider):
             "rates": rates,
             "valuation_date": valuation_date,
         }
+
+    def get_exchange_rate_series(
+        self, source_currency, exchanged_currency, start_date, end_date
+    ):
+        """
+        Simulate getting exchange rates for every date of the given range.
+        """
+        currencies = Currency.objects.exclude(code=source_currency).values_list(
+            "code", flat=True
+        )
+        start_date = datetime.strptime(start_date, "%Y-%m-%d")
+        days = (datetime.strptime(end_date, "%Y-%m-%d") - start_date).days + 1
+
+        rates = {}
+
+        for day in range(days):
+            valuation_date = (start_date + timedelta(days=day)).strftime("%Y-%m-%d")
+            rates[valuation_date] = {
+                currency: random.uniform(0.85, 1.25) for currency in currencies
+            }
+
+        return {
+            "source_currency": source_currency,
+            "exchanged_currency": exchanged_currency,
+            "rates": rates,
+        }
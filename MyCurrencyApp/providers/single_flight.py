@@ -0,0 +1,78 @@
+import hashlib
+import threading
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls sharing a key within a process: the first caller
+    (the leader) runs the function while later callers wait and receive its result,
+    or its exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+
+@contextmanager
+def advisory_lock(key):
+    """
+    Serializes a block across processes sharing the database. On PostgreSQL this takes
+    a session-level advisory lock derived from ``key``, released when the block ends,
+    so the block can call a provider without holding a transaction open; other
+    databases serialize writes themselves and the block runs without a lock.
+    """
+    if connection.vendor != "postgresql":
+        yield
+        return
+
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).digest()
+    lock_id = int.from_bytes(digest, "big", signed=True)
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+
+provider_fetches = SingleFlight()
@@ -0,0 +1,53 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache.active_providers import active_providers
+from .cache.currency_ids import currency_ids
+from .cache.rate_cache import invalidate_pair
+from .models import Currency, CurrencyExchangeRate, CurrencyProvider
+from .utils import refresh_latest_exchange_rate, update_latest_exchange_rates
+
+
+@receiver(post_save, sender=CurrencyExchangeRate)
+@receiver(post_delete, sender=CurrencyExchangeRate)
+def invalidate_cached_rates(sender, instance, **kwargs):
+    """
+    Keeps cached rates consistent with rates edited outside the helpers (e.g. in the admin).
+    """
+    invalidate_pair(instance.source_currency.code, instance.target_currency.code)
+
+
+@receiver(post_save, sender=CurrencyExchangeRate)
+def update_latest_rate(sender, instance, **kwargs):
+    """
+    Keeps LatestExchangeRate up to date with rates saved one by one.
+    """
+    update_latest_exchange_rates([instance])
+
+
+@receiver(post_delete, sender=CurrencyExchangeRate)
+def refresh_latest_rate(sender, instance, **kwargs):
+    """
+    Falls back to the previous rate of the pair when its latest rate is deleted.
+    """
+    refresh_latest_exchange_rate(
+        instance.source_currency, instance.target_currency, instance.provider_id
+    )
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def clear_currency_ids(sender, instance, **kwargs):
+    """
+    Reloads the currency code to id map after currencies change.
+    """
+    currency_ids.clear()
+
+
+@receiver(post_save, sender=CurrencyProvider)
+@receiver(post_delete, sender=CurrencyProvider)
+def clear_active_providers(sender, instance, **kwargs):
+    """
+    Reloads the active provider list after providers change.
+    """
+    active_providers.clear()
@@ -43,10 +43,10 @@ class ConverterAdminTests(TestCase):
         conversion_result = response.context["conversion_result"]
         self.assertIsInstance(conversion_result, dict)
 
-    @patch("MyCurrencyApp.admin_views.converter_admin.get_or_create_exchange_rate")
-    def test_converter_view_with_mocked_exchange_rate(self, mock_get_exchange_rate):
+    @patch("MyCurrencyApp.admin_views.converter_admin.get_or_create_exchange_rates")
+    def test_converter_view_with_mocked_exchange_rate(self, mock_get_exchange_rates):
         # Mock the exchange rate to simulate a known conversion rate
-        mock_get_exchange_rate.return_value = Decimal("1.1")
+        mock_get_exchange_rates.return_value = {("USD", "EUR"): Decimal("1.1")}
 
         response = self.client.post(
             self.url,
@@ -79,10 +79,10 @@ class ConverterAdminTests(TestCase):
         conversion_result = response.context["conversion_result"]
         self.assertEqual(conversion_result["USD"], Decimal("100"))
 
-    @patch("MyCurrencyApp.admin_views.converter_admin.get_or_create_exchange_rate")
-    def test_converter_view_with_exchange_rate_failure(self, mock_get_exchange_rate):
+    @patch("MyCurrencyApp.admin_views.converter_admin.get_or_create_exchange_rates")
+    def test_converter_view_with_exchange_rate_failure(self, mock_get_exchange_rates):
         # Simulate a failure in retrieving the exchange rate
-        mock_get_exchange_rate.return_value = None
+        mock_get_exchange_rates.return_value = {("USD", "EUR"): None}
 
         response = self.client.post(
             self.url,
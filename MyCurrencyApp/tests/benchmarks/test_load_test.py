@@ -0,0 +1,109 @@
+import random
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.test import LiveServerTestCase, SimpleTestCase, override_settings
+
+from benchmarks.load_test import (
+    build_params,
+    compare_results,
+    get_query_count,
+    reload_providers,
+    run_endpoint,
+    summarize,
+)
+from MyCurrencyApp.cache.shared_rate_cache import shared_rate_cache
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+
+
+class LoadTestTests(SimpleTestCase):
+    def test_summary_percentiles(self):
+        """Test case for the latency percentiles, throughput and query counts."""
+        results = [(index / 1000, 200, 2) for index in range(1, 101)]
+        results[-1] = (0.1, 500, None)
+
+        summary = summarize(results, elapsed=2)
+
+        self.assertEqual(summary["requests"], 100)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["throughput_rps"], 50)
+        self.assertAlmostEqual(summary["p50_ms"], 50.5)
+        self.assertAlmostEqual(summary["p99_ms"], 99.01)
+        self.assertEqual(summary["queries_per_request"], 2)
+
+    def test_regressions_above_the_threshold(self):
+        """Test case for comparing a run with a baseline."""
+        baseline = {
+            "rates": {"p95_ms": 100, "throughput_rps": 50, "queries_per_request": 2}
+        }
+        results = {
+            "rates": {"p95_ms": 108, "throughput_rps": 40, "queries_per_request": 3}
+        }
+
+        regressions = compare_results(results, baseline, threshold=0.1)
+
+        self.assertEqual(
+            [(endpoint, metric) for endpoint, metric, *_ in regressions],
+            [("rates", "queries_per_request"), ("rates", "throughput_rps")],
+        )
+
+    def test_query_count_is_read_from_server_timing(self):
+        """Test case for parsing the query count of a Server-Timing header."""
+        self.assertEqual(
+            get_query_count(
+                'provider-mock;dur=1.2;desc="1 calls, 0 errors", '
+                'db;dur=0.5;desc="12 queries", total;dur=3'
+            ),
+            12,
+        )
+        self.assertIsNone(get_query_count(None))
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "rates": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-load-test",
+            },
+        }
+    )
+    @patch("benchmarks.load_test.time.sleep")
+    def test_provider_reload_waits_for_a_process_local_cache(self, mock_sleep):
+        """Test case for waiting until the server reloads its providers."""
+        generation = shared_rate_cache.provider_generation()
+
+        with patch("sys.stderr"):
+            reload_providers()
+
+        self.assertNotEqual(shared_rate_cache.provider_generation(), generation)
+        mock_sleep.assert_called_once()
+
+
+class LoadTestServerTests(LiveServerTestCase):
+    def test_endpoints_are_driven_end_to_end(self):
+        """Test case for load testing every endpoint of a live server."""
+        usd = create_source_currency("USD", "US Dollar")
+        eur = create_source_currency("EUR", "Euro")
+        provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        end_date = date.today()
+        start_date = end_date - timedelta(days=10)
+        for day in range(11):
+            valuation_date = start_date + timedelta(days=day)
+            add_exchange_rate(usd, eur, provider, valuation_date=valuation_date)
+            add_exchange_rate(eur, usd, provider, valuation_date=valuation_date)
+
+        rng = random.Random(0)
+        for endpoint in ("converter", "rates", "twrr"):
+            params_list = [
+                build_params(endpoint, rng, ["USD", "EUR"], start_date, end_date, 5)
+                for _ in range(4)
+            ]
+            summary = run_endpoint(
+                self.live_server_url, endpoint, params_list, concurrency=1
+            )
+
+            self.assertEqual(summary["errors"], 0, endpoint)
+            self.assertIsNotNone(summary["queries_per_request"], endpoint)
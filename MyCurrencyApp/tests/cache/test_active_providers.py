@@ -0,0 +1,55 @@
+from django.test import TestCase, override_settings
+
+from MyCurrencyApp.cache.active_providers import ActiveProviderList
+from MyCurrencyApp.cache.shared_rate_cache import shared_rate_cache
+from MyCurrencyApp.models import CurrencyProvider
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "rates": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-active-providers",
+        },
+    }
+)
+class ActiveProviderListTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Fixer", url="http://fixer.url", active=True, priority=0
+        )
+        self.active_providers = ActiveProviderList()
+
+    def test_list_is_loaded_once(self):
+        """Test case for serving the active providers without a query once loaded."""
+        self.active_providers.get()
+
+        with self.assertNumQueries(0):
+            providers = self.active_providers.get()
+
+        self.assertEqual([provider.url for provider in providers], ["http://fixer.url"])
+
+    def test_change_in_another_process_reloads_the_list(self):
+        """Test case for reloading the list when another process bumps its generation."""
+        self.active_providers.get()
+        # Another process updates the provider without signals and bumps the generation
+        CurrencyProvider.objects.filter(pk=self.provider.pk).update(
+            url="http://127.0.0.1:8001"
+        )
+        shared_rate_cache.bump_providers()
+
+        providers = self.active_providers.get()
+
+        self.assertEqual(
+            [provider.url for provider in providers], ["http://127.0.0.1:8001"]
+        )
+
+    def test_saved_provider_bumps_the_generation_on_commit(self):
+        """Test case for publishing provider changes to other processes on commit."""
+        generation = shared_rate_cache.provider_generation()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.provider.save()
+
+        self.assertNotEqual(shared_rate_cache.provider_generation(), generation)
@@ -0,0 +1,114 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from MyCurrencyApp.cache.latest_rate_cache import LatestRateCache
+from MyCurrencyApp.helper.get_create_exchange_rate import get_or_create_exchange_rate
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.tests.confest import create_source_currency, add_exchange_rate
+from MyCurrencyApp.utils import update_exchange_rate_activity
+
+
+class LatestRateCacheTests(TestCase):
+    def test_hit_and_miss_counters(self):
+        """Test case for the hit/miss counters of the cache."""
+        cache = LatestRateCache(max_entries=10, ttl=60)
+        self.assertIsNone(cache.get("USD", "EUR", "2024-01-01"))
+        cache.set("USD", "EUR", "2024-01-01", Decimal("1.1"))
+        self.assertEqual(cache.get("USD", "EUR", "2024-01-01"), Decimal("1.1"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test case for LRU eviction once the cache is full."""
+        cache = LatestRateCache(max_entries=2, ttl=60)
+        cache.set("USD", "EUR", "2024-01-01", Decimal("1.1"))
+        cache.set("USD", "GBP", "2024-01-01", Decimal("0.8"))
+        cache.get("USD", "EUR", "2024-01-01")
+        cache.set("USD", "CHF", "2024-01-01", Decimal("0.9"))
+
+        self.assertIsNone(cache.get("USD", "GBP", "2024-01-01"))
+        self.assertEqual(cache.get("USD", "EUR", "2024-01-01"), Decimal("1.1"))
+
+    def test_expired_entry_is_a_miss(self):
+        """Test case for entries outliving their TTL."""
+        cache = LatestRateCache(max_entries=10, ttl=-1)
+        cache.set("USD", "EUR", "2024-01-01", Decimal("1.1"))
+        self.assertIsNone(cache.get("USD", "EUR", "2024-01-01"))
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "rates": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-latest-rates",
+        },
+    }
+)
+class CachedExchangeRateTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.source_currency = create_source_currency("USD", "US Dollar")
+        self.target_currency = create_source_currency("EUR", "Euro")
+        self.cache = LatestRateCache(max_entries=10, ttl=60)
+        patcher = patch(
+            "MyCurrencyApp.cache.rate_cache.latest_rate_cache",
+            self.cache,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_warm_conversion_costs_zero_queries(self):
+        """Test case for serving a rate from the cache without database access."""
+        add_exchange_rate(
+            self.source_currency, self.target_currency, self.provider, rate_value=1.09
+        )
+        self.assertEqual(get_or_create_exchange_rate("USD", "EUR"), Decimal("1.09"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_or_create_exchange_rate("USD", "EUR"), Decimal("1.09"))
+
+    def test_new_rate_invalidates_cached_pair(self):
+        """Test case for invalidation when a new rate is written."""
+        add_exchange_rate(
+            self.source_currency, self.target_currency, self.provider, rate_value=1.09
+        )
+        get_or_create_exchange_rate("USD", "EUR")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_exchange_rate_activity(
+                self.source_currency,
+                self.target_currency,
+                Decimal("1.2"),
+                date.today(),
+                self.provider,
+            )
+
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_rolled_back_rate_keeps_cached_pair(self):
+        """Test case for invalidation waiting for the write to commit."""
+        add_exchange_rate(
+            self.source_currency, self.target_currency, self.provider, rate_value=1.09
+        )
+        get_or_create_exchange_rate("USD", "EUR")
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            update_exchange_rate_activity(
+                self.source_currency,
+                self.target_currency,
+                Decimal("1.2"),
+                date.today(),
+                self.provider,
+            )
+            self.assertEqual(self.cache.stats()["size"], 1)
+            raise RuntimeError("rollback")
+
+        self.assertEqual(self.cache.stats()["size"], 1)
+        self.assertEqual(get_or_create_exchange_rate("USD", "EUR"), Decimal("1.09"))
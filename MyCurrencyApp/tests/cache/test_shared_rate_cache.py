@@ -0,0 +1,119 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from MyCurrencyApp.cache.shared_rate_cache import SharedRateCache
+from MyCurrencyApp.helper.get_currency_rates import get_currency_rates_data
+from MyCurrencyApp.helper.get_twrr_series import _get_rate_series
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.tests.confest import create_source_currency, add_exchange_rate
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "rates": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-shared-rates",
+        },
+    }
+)
+class SharedRateCacheTests(TestCase):
+    def setUp(self):
+        caches["rates"].clear()
+        self.cache = SharedRateCache()
+
+    def test_bump_supersedes_cached_values(self):
+        """Test case for values cached under an older generation becoming unreachable."""
+        generation = self.cache.generation("USD", "EUR")
+        self.cache.set("latest", generation, "USD", "EUR", value=Decimal("1.1"))
+        self.assertEqual(
+            self.cache.get("latest", generation, "USD", "EUR"), Decimal("1.1")
+        )
+
+        self.cache.bump("USD", "EUR")
+
+        new_generation = self.cache.generation("USD", "EUR")
+        self.assertNotEqual(new_generation, generation)
+        self.assertIsNone(self.cache.get("latest", new_generation, "USD", "EUR"))
+
+    def test_bump_supersedes_source_generation(self):
+        """Test case for pair writes superseding multi-target values of the source."""
+        generation = self.cache.source_generation("USD")
+        pair_generation = self.cache.generation("USD", "EUR")
+
+        self.cache.bump("USD", "GBP")
+
+        self.assertNotEqual(self.cache.source_generation("USD"), generation)
+        self.assertEqual(self.cache.generation("USD", "EUR"), pair_generation)
+
+    def test_base_and_inverse_writes_supersede_derived_values(self):
+        """Test case for cross and inverse rates cached under the derived pair."""
+        generation = self.cache.generation("USD", "GBP")
+        source_generation = self.cache.source_generation("USD")
+
+        self.cache.bump("EUR", "GBP")
+
+        self.assertNotEqual(self.cache.generation("USD", "GBP"), generation)
+        self.assertNotEqual(self.cache.source_generation("USD"), source_generation)
+
+        generation = self.cache.generation("USD", "GBP")
+        self.cache.bump("GBP", "USD")
+        self.assertNotEqual(self.cache.generation("USD", "GBP"), generation)
+
+    def test_rates_range_is_served_from_cache(self):
+        """Test case for a repeated range lookup costing no database queries."""
+        provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        source_currency = create_source_currency("USD", "US Dollar")
+        target_currency = create_source_currency("EUR", "Euro")
+        add_exchange_rate(
+            source_currency,
+            target_currency,
+            provider,
+            rate_value=1.09,
+            valuation_date="2024-01-01",
+        )
+
+        first_response = get_currency_rates_data("USD", "2024-01-01", "2024-01-01")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_currency_rates_data("USD", "2024-01-01", "2024-01-01"),
+                first_response,
+            )
+
+    def test_incomplete_range_is_not_cached(self):
+        """Test case for a range with dates no provider returned."""
+        create_source_currency("USD", "US Dollar")
+        create_source_currency("EUR", "Euro")
+
+        with patch(
+            "MyCurrencyApp.helper.get_currency_rates._fetch_and_save_from_providers",
+            return_value={},
+        ) as mock_fetch:
+            self.assertEqual(
+                get_currency_rates_data("USD", "2024-01-01", "2024-01-02"), {}
+            )
+            get_currency_rates_data("USD", "2024-01-01", "2024-01-02")
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    def test_incomplete_series_is_not_cached(self):
+        """Test case for a TWRR series with dates no provider returned."""
+        create_source_currency("USD", "US Dollar")
+        create_source_currency("EUR", "Euro")
+
+        with patch(
+            "MyCurrencyApp.helper.get_twrr_series._fetch_and_save_from_providers",
+            return_value=[],
+        ) as mock_fetch:
+            self.assertEqual(
+                _get_rate_series("USD", "EUR", "2024-01-01", "2024-01-02"), []
+            )
+            _get_rate_series("USD", "EUR", "2024-01-01", "2024-01-02")
+
+        self.assertEqual(mock_fetch.call_count, 2)
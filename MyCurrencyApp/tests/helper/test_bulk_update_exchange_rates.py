@@ -0,0 +1,98 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from MyCurrencyApp.models import (
+    CurrencyExchangeRate,
+    CurrencyProvider,
+    LatestExchangeRate,
+)
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+from MyCurrencyApp.utils import bulk_update_exchange_rates
+
+
+class BulkUpdateExchangeRatesTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.currencies = [
+            create_source_currency(code, code)
+            for code in ["USD", "EUR", "CHF", "GBP", "JPY", "CAD"]
+        ]
+        self.usd, self.eur = self.currencies[:2]
+
+    def _rows(self, days):
+        start_date = date(2024, 1, 1)
+        return [
+            (
+                self.usd,
+                target_currency,
+                start_date + timedelta(days=i),
+                1.1,
+                self.provider,
+            )
+            for target_currency in self.currencies[1:]
+            for i in range(days)
+        ]
+
+    def test_statement_count_does_not_grow_with_the_batch(self):
+        """Test case for saving batches with a constant number of statements."""
+        with CaptureQueriesContext(connection) as small_batch:
+            bulk_update_exchange_rates(self._rows(1))
+        with CaptureQueriesContext(connection) as large_batch:
+            bulk_update_exchange_rates(self._rows(10))
+
+        self.assertEqual(len(small_batch), len(large_batch))
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 50)
+
+    def test_existing_rate_is_updated(self):
+        """Test case for upserting the rate of a pair, date and provider."""
+        add_exchange_rate(
+            self.usd, self.eur, self.provider, Decimal("1.1"), date(2024, 1, 1)
+        )
+
+        bulk_update_exchange_rates(
+            [(self.usd, self.eur, "2024-01-01", Decimal("1.2"), self.provider)]
+        )
+
+        exchange_rate = CurrencyExchangeRate.objects.get()
+        self.assertEqual(exchange_rate.rate_value, Decimal("1.2"))
+
+    def test_latest_rate_moves_forward_only(self):
+        """Test case for keeping the latest rate of each pair and provider."""
+        add_exchange_rate(
+            self.usd, self.eur, self.provider, Decimal("1.0"), date(2024, 2, 1)
+        )
+
+        bulk_update_exchange_rates(self._rows(3))
+
+        key = LatestExchangeRate.make_key("USD", "EUR", self.provider.id)
+        self.assertEqual(
+            LatestExchangeRate.objects.get(pk=key).valuation_date, date(2024, 2, 1)
+        )
+        self.assertEqual(
+            LatestExchangeRate.objects.get(
+                pk=LatestExchangeRate.make_key("USD", "CHF", self.provider.id)
+            ).valuation_date,
+            date(2024, 1, 3),
+        )
+        self.assertFalse(CurrencyExchangeRate.objects.filter(active=False).exists())
+
+    def test_deleting_the_latest_rate_restores_the_previous_one(self):
+        """Test case for refreshing the latest rate when it is deleted."""
+        bulk_update_exchange_rates(self._rows(2))
+        key = LatestExchangeRate.make_key("USD", "EUR", self.provider.id)
+
+        CurrencyExchangeRate.objects.get(
+            target_currency=self.eur, valuation_date=date(2024, 1, 2)
+        ).delete()
+        self.assertEqual(
+            LatestExchangeRate.objects.get(pk=key).valuation_date, date(2024, 1, 1)
+        )
+
+        CurrencyExchangeRate.objects.filter(target_currency=self.eur).delete()
+        self.assertFalse(LatestExchangeRate.objects.filter(pk=key).exists())
@@ -0,0 +1,103 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from MyCurrencyApp.helper.cross_rates import (
+    get_cross_rate,
+    get_cross_rates_for_dates,
+    save_base_rates,
+)
+from MyCurrencyApp.helper.get_currency_rates import get_currency_rates_data
+from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
+from MyCurrencyApp.tests.confest import create_source_currency, add_exchange_rate
+
+
+class CrossRatesTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.eur = create_source_currency("EUR", "Euro")
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.gbp = create_source_currency("GBP", "British Pound")
+        self.valuation_date = date(2024, 1, 2)
+
+        save_base_rates(
+            {
+                "base_currency": "EUR",
+                "base_rates": {"USD": 1.1, "GBP": 0.88},
+            },
+            self.valuation_date,
+            self.provider,
+        )
+
+    def test_pair_is_derived_from_base_vector(self):
+        """Test case for deriving a pair missing from the database."""
+        self.assertEqual(
+            get_cross_rate("USD", "GBP", self.valuation_date), Decimal("0.8")
+        )
+        self.assertEqual(
+            get_cross_rate("USD", "EUR", self.valuation_date), Decimal("0.909091")
+        )
+
+    def test_direct_pair_wins(self):
+        """Test case for a stored direct-pair rate taking precedence."""
+        add_exchange_rate(
+            self.usd,
+            self.gbp,
+            self.provider,
+            rate_value=Decimal("0.79"),
+            valuation_date=self.valuation_date,
+        )
+        self.assertEqual(
+            get_cross_rate("USD", "GBP", self.valuation_date), Decimal("0.79")
+        )
+
+    def test_missing_base_vector(self):
+        """Test case for dates without a stored base vector."""
+        self.assertIsNone(get_cross_rate("USD", "GBP", date(2024, 1, 3)))
+        self.assertEqual(get_cross_rates_for_dates("USD", ["2024-01-03"]), {})
+
+    @patch("MyCurrencyApp.helper.get_currency_rates._fetch_and_save_from_providers")
+    def test_rates_range_is_derived_without_provider_calls(self, mock_fetch):
+        """Test case for range lookups derived from stored base vectors."""
+        response_data = get_currency_rates_data("USD", "2024-01-02", "2024-01-02")
+
+        mock_fetch.assert_not_called()
+        self.assertEqual(response_data["GBP"][0]["rate_value"], Decimal("0.8"))
+        self.assertEqual(
+            CurrencyExchangeRate.objects.filter(source_currency=self.usd).count(), 0
+        )
+
+    @patch("MyCurrencyApp.helper.get_currency_rates._fetch_and_save_from_providers")
+    def test_rates_range_with_a_gap_is_in_date_order(self, mock_fetch):
+        """Test case for derived rates of a gap in the middle of the range."""
+        for valuation_date in [date(2024, 1, 1), date(2024, 1, 3)]:
+            add_exchange_rate(
+                self.usd, self.gbp, self.provider, Decimal("0.79"), valuation_date
+            )
+
+        response_data = get_currency_rates_data("USD", "2024-01-01", "2024-01-03")
+
+        mock_fetch.assert_not_called()
+        self.assertEqual(
+            [str(rate["valuation_date"]) for rate in response_data["GBP"]],
+            ["2024-01-01", "2024-01-02", "2024-01-03"],
+        )
+
+    @patch("MyCurrencyApp.helper.get_currency_rates._fetch_and_save_from_providers")
+    def test_fetched_rates_are_added_to_stored_rates(self, mock_fetch):
+        """Test case for a range completed with provider rates of the same target."""
+        mock_fetch.return_value = {
+            "GBP": [{"rate_value": 0.81, "valuation_date": "2024-01-03"}]
+        }
+
+        response_data = get_currency_rates_data("USD", "2024-01-02", "2024-01-03")
+
+        mock_fetch.assert_called_once_with("USD", ["2024-01-03"])
+        self.assertEqual(
+            [rate["rate_value"] for rate in response_data["GBP"]],
+            [Decimal("0.8"), 0.81],
+        )
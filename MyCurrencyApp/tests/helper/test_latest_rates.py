@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils.timezone import now
+
+from MyCurrencyApp.cache.active_providers import active_providers
+from MyCurrencyApp.helper.get_create_exchange_rate import get_or_create_exchange_rate
+from MyCurrencyApp.helper.latest_rates import get_latest_rate
+from MyCurrencyApp.models import CurrencyProvider, LatestExchangeRate
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+
+
+class LatestRatesTests(TestCase):
+    def setUp(self):
+        self.fixer = CurrencyProvider.objects.create(
+            name="Fixer", url="http://fixer.url", active=True, priority=0
+        )
+        self.mock = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=1
+        )
+        self.eur = create_source_currency("EUR", "Euro")
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.chf = create_source_currency("CHF", "Swiss Franc")
+        self.today = date(2024, 1, 2)
+
+    def test_current_rate_is_a_single_lookup(self):
+        """Test case for reading the rate of the highest priority provider."""
+        add_exchange_rate(self.usd, self.chf, self.mock, Decimal("0.9"), self.today)
+        add_exchange_rate(self.usd, self.chf, self.fixer, Decimal("0.8"), self.today)
+
+        with self.assertNumQueries(1):
+            rate_value = get_latest_rate(
+                "USD", "CHF", self.today, [self.fixer, self.mock]
+            )
+
+        self.assertEqual(rate_value, Decimal("0.8"))
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "rates": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-latest-rates-lookup",
+            },
+        }
+    )
+    def test_stored_rate_conversion_is_a_single_lookup(self):
+        """Test case for converting with a stored rate without loading currencies."""
+        add_exchange_rate(self.usd, self.chf, self.mock, Decimal("0.9"), now().date())
+        # The active provider list is loaded once per process
+        active_providers.get()
+
+        with self.assertNumQueries(1):
+            rate_value = get_or_create_exchange_rate("USD", "CHF")
+
+        self.assertEqual(rate_value, Decimal("0.9"))
+
+    def test_current_rate_is_derived_from_the_base_vector(self):
+        """Test case for deriving a current rate from the latest base currency rates."""
+        add_exchange_rate(self.eur, self.usd, self.mock, Decimal("1.1"), self.today)
+        add_exchange_rate(self.eur, self.chf, self.mock, Decimal("0.99"), self.today)
+        add_exchange_rate(
+            self.usd, self.chf, self.mock, Decimal("0.5"), date(2024, 1, 1)
+        )
+
+        rate_value = get_latest_rate("USD", "CHF", self.today, [self.fixer, self.mock])
+
+        self.assertEqual(rate_value, Decimal("0.900000"))
+
+    def test_backfill_command(self):
+        """Test case for rebuilding the latest rates from the history."""
+        add_exchange_rate(
+            self.usd, self.chf, self.mock, Decimal("0.5"), date(2024, 1, 1)
+        )
+        add_exchange_rate(self.usd, self.chf, self.mock, Decimal("0.9"), self.today)
+        LatestExchangeRate.objects.all().delete()
+
+        call_command("backfill_latest_rates", stdout=StringIO())
+
+        latest_rate = LatestExchangeRate.objects.get()
+        self.assertEqual(latest_rate.key, f"USD:CHF:{self.mock.id}")
+        self.assertEqual(latest_rate.valuation_date, self.today)
+        self.assertEqual(latest_rate.rate_value, Decimal("0.9"))
@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from MyCurrencyApp.helper.get_twrr_series import _fetch_and_save_from_providers
+from MyCurrencyApp.helper.provider_rates import fetch_provider_rates
+from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
+from MyCurrencyApp.providers.circuit_breaker import reset_circuit_breakers
+from MyCurrencyApp.providers.fixer_provider import FixerProvider
+from MyCurrencyApp.providers.mock_provider import MockProvider
+from MyCurrencyApp.tests.confest import create_source_currency
+from MyCurrencyApp.utils import get_date_range, get_date_spans
+
+
+class ProviderRatesTests(TestCase):
+    def setUp(self):
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+        CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        create_source_currency("USD", "US Dollar")
+        create_source_currency("EUR", "Euro")
+
+    def test_date_spans(self):
+        """Test case for grouping dates into bounded runs of consecutive days."""
+        dates = ["2024-01-05", "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-06"]
+
+        self.assertEqual(
+            get_date_spans(dates, 2),
+            [
+                ("2024-01-01", "2024-01-02"),
+                ("2024-01-03", "2024-01-03"),
+                ("2024-01-05", "2024-01-06"),
+            ],
+        )
+
+    def test_range_is_fetched_with_one_call(self):
+        """Test case for backfilling a contiguous range with a single provider call."""
+        dates = get_date_range("2024-01-01", "2024-03-31")
+
+        with patch.object(
+            MockProvider,
+            "get_exchange_rate_series",
+            autospec=True,
+            side_effect=MockProvider.get_exchange_rate_series,
+        ) as mock_series, patch.object(
+            MockProvider, "get_exchange_rate_data"
+        ) as mock_daily:
+            new_rates = _fetch_and_save_from_providers("USD", "EUR", dates)
+
+        self.assertEqual(mock_series.call_count, 1)
+        mock_daily.assert_not_called()
+        self.assertEqual(len(new_rates), len(dates))
+        self.assertEqual(
+            CurrencyExchangeRate.objects.filter(source_currency__code="USD").count(),
+            len(dates),
+        )
+
+    def test_daily_fallback_without_time_series(self):
+        """Test case for one call per date for providers without time series."""
+        dates = ["2024-01-01", "2024-01-02", "2024-01-04"]
+
+        with patch.object(MockProvider, "supports_timeseries", False), patch.object(
+            MockProvider,
+            "get_exchange_rate_data",
+            autospec=True,
+            side_effect=MockProvider.get_exchange_rate_data,
+        ) as mock_daily:
+            new_rates = _fetch_and_save_from_providers("USD", "EUR", dates)
+
+        self.assertEqual(mock_daily.call_count, len(dates))
+        self.assertEqual(len(new_rates), len(dates))
+
+    def test_failed_day_does_not_discard_the_other_days(self):
+        """Test case for skipping a date returned without rates among good ones."""
+        dates = ["2024-01-01", "2024-01-02", "2024-01-03"]
+        get_exchange_rate_data = MockProvider.get_exchange_rate_data
+
+        def fetch(provider, source_currency, exchanged_currency, valuation_date):
+            if valuation_date == "2024-01-02":
+                # Fixer answers failed requests with an empty list of rates
+                return {"rates": [], "valuation_date": valuation_date}
+            return get_exchange_rate_data(
+                provider, source_currency, exchanged_currency, valuation_date
+            )
+
+        with patch.object(MockProvider, "supports_timeseries", False), patch.object(
+            MockProvider, "get_exchange_rate_data", fetch
+        ):
+            new_rates = _fetch_and_save_from_providers("USD", "EUR", dates)
+
+        self.assertEqual(
+            sorted(rate.valuation_date.isoformat() for rate in new_rates),
+            ["2024-01-01", "2024-01-03"],
+        )
+
+    def test_fixer_series_adjusts_unsupported_base(self):
+        """Test case for rebasing a Fixer time series when the base is not supported."""
+        provider = FixerProvider(
+            SimpleNamespace(name="Fixer", api_key="test", default_base_currency="EUR"),
+            "http://fixer.url",
+        )
+        provider.session = Mock()
+        provider.session.get.side_effect = [
+            Mock(json=Mock(return_value={"success": False, "error": {"code": 105}})),
+            Mock(
+                json=Mock(
+                    return_value={
+                        "success": True,
+                        "rates": {"2024-01-01": {"USD": 2.0, "GBP": 0.5}},
+                    }
+                )
+            ),
+        ]
+
+        data = provider.get_exchange_rate_series("USD", "", "2024-01-01", "2024-01-01")
+
+        self.assertEqual(data["rates"], {"2024-01-01": {"GBP": 0.25}})
+        self.assertEqual(data["base_currency"], "EUR")
+        self.assertEqual(data["base_rates"]["2024-01-01"]["USD"], 2.0)
+
+    def test_rejected_fixer_series_falls_back_to_daily_calls(self):
+        """Test case for fetching day by day when Fixer rejects the time series."""
+        provider_model = SimpleNamespace(
+            name="Fixer",
+            url="http://fixer.url",
+            api_key="test",
+            default_base_currency="EUR",
+        )
+        provider = FixerProvider(provider_model, provider_model.url)
+        rejected = {"success": False, "error": {"code": 105}}
+
+        def get(url, params, timeout):
+            if url.endswith("/timeseries"):
+                return Mock(json=Mock(return_value=rejected))
+            return Mock(
+                json=Mock(return_value={"success": True, "rates": {"EUR": 0.9}})
+            )
+
+        provider.session = Mock()
+        provider.session.get.side_effect = get
+        dates = ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+        provider.set_url(provider_model.url, "timeseries")
+        self.assertIsNone(
+            provider.get_exchange_rate_series("USD", "EUR", dates[0], dates[-1])
+        )
+        provider.session.get.reset_mock()
+
+        fetched_data = fetch_provider_rates(
+            provider_model, provider, "USD", "EUR", dates
+        )
+
+        requested_urls = [call.args[0] for call in provider.session.get.call_args_list]
+        self.assertEqual(requested_urls.count("http://fixer.url/timeseries"), 2)
+        self.assertEqual(
+            sorted(url for url in requested_urls if not url.endswith("/timeseries")),
+            [f"http://fixer.url/{date}" for date in dates],
+        )
+        self.assertEqual([data["valuation_date"] for data in fetched_data], dates)
+        self.assertEqual(fetched_data[0]["rates"], {"EUR": 0.9})
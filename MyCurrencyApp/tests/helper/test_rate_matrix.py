@@ -0,0 +1,67 @@
+from datetime import date
+
+from django.test import TestCase
+
+from MyCurrencyApp.admin_views.graph_view_admin import _matrix_rates_data
+from MyCurrencyApp.cache.currency_ids import currency_ids
+from MyCurrencyApp.helper.rate_matrix import RateMatrix, load_rate_matrices
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.tests.confest import create_source_currency, add_exchange_rate
+
+
+class RateMatrixTests(TestCase):
+    def test_missing_pairs_are_completed(self):
+        """Test case for inverse and base-currency cross rates filling the matrix."""
+        matrix = RateMatrix.from_rows(
+            date(2024, 1, 1),
+            ["EUR", "GBP", "USD"],
+            [("EUR", "USD", 1.1), ("EUR", "GBP", 0.88), ("USD", "GBP", 0.79)],
+        )
+
+        self.assertEqual(matrix.rate("USD", "GBP"), 0.79)
+        self.assertAlmostEqual(matrix.rate("USD", "EUR"), 1 / 1.1)
+        self.assertAlmostEqual(matrix.rate("GBP", "USD"), 1 / 0.79)
+        self.assertEqual(matrix.rate("EUR", "EUR"), 1.0)
+        self.assertIsNone(matrix.rate("EUR", "CHF"))
+        self.assertTrue(matrix.is_complete_for("GBP"))
+
+    def test_consistency_errors(self):
+        """Test case for detecting direct rates that disagree with the cross rates."""
+        matrix = RateMatrix.from_rows(
+            date(2024, 1, 1),
+            ["EUR", "GBP", "USD"],
+            [("EUR", "USD", 1.1), ("EUR", "GBP", 0.88), ("USD", "GBP", 0.79)],
+        )
+
+        self.assertIn(("USD", "GBP"), matrix.consistency_errors())
+        self.assertNotIn(("EUR", "USD"), matrix.consistency_errors())
+
+    def test_matrices_are_loaded_with_one_query(self):
+        """Test case for bulk loading the matrices of a date range."""
+        provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        eur = create_source_currency("EUR", "Euro")
+        usd = create_source_currency("USD", "US Dollar")
+        for day in (1, 2):
+            add_exchange_rate(
+                eur,
+                usd,
+                provider,
+                rate_value=1 + day / 10,
+                valuation_date=date(2024, 1, day),
+            )
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            matrices = load_rate_matrices(
+                ["2024-01-01", "2024-01-02", "2024-01-03"], ["EUR", "USD"]
+            )
+
+        self.assertEqual(list(matrices), [date(2024, 1, 1), date(2024, 1, 2)])
+        self.assertEqual(matrices[date(2024, 1, 2)].rate("EUR", "USD"), 1.2)
+        self.assertEqual(
+            _matrix_rates_data(matrices, "EUR")["USD"][1],
+            {"rate_value": 1.2, "valuation_date": date(2024, 1, 2)},
+        )
@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+
+from MyCurrencyApp.helper.cross_rates import get_cross_rates_for_dates
+from MyCurrencyApp.helper.rate_rows import get_pair_rate_rows, get_rate_rows
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+
+
+class RateRowsTests(TestCase):
+    def setUp(self):
+        self.secondary = CurrencyProvider.objects.create(
+            name="Secondary", url="http://secondary.url", active=True, priority=1
+        )
+        self.primary = CurrencyProvider.objects.create(
+            name="Primary", url="http://primary.url", active=True, priority=0
+        )
+        self.eur = create_source_currency("EUR", "Euro")
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.gbp = create_source_currency("GBP", "British Pound")
+        self.valuation_dates = [
+            date(2024, 1, 1) + timedelta(days=day) for day in range(3)
+        ]
+
+        for valuation_date in self.valuation_dates:
+            for source, target, primary_rate, secondary_rate in [
+                (self.usd, self.eur, "0.9", "0.95"),
+                (self.eur, self.usd, "1.1", "1.05"),
+                (self.eur, self.gbp, "0.8", "0.85"),
+            ]:
+                add_exchange_rate(
+                    source, target, self.primary, Decimal(primary_rate), valuation_date
+                )
+                add_exchange_rate(
+                    source,
+                    target,
+                    self.secondary,
+                    Decimal(secondary_rate),
+                    valuation_date,
+                )
+
+    def test_rate_rows_keep_the_highest_priority_provider(self):
+        """Test case for one rate per date when several providers stored it."""
+        rate_rows = get_rate_rows("USD", "2024-01-01", "2024-01-03")
+
+        self.assertEqual(
+            rate_rows,
+            [
+                ("EUR", valuation_date, Decimal("0.9"))
+                for valuation_date in self.valuation_dates
+            ],
+        )
+
+    def test_pair_rate_rows_keep_the_highest_priority_provider(self):
+        """Test case for one rate per pair and date when several providers stored it."""
+        pair_rows = get_pair_rate_rows(
+            [("USD", "EUR"), ("EUR", "GBP")], "2024-01-01", "2024-01-03"
+        )
+
+        self.assertEqual(
+            pair_rows[("USD", "EUR")],
+            [
+                (valuation_date, Decimal("0.9"))
+                for valuation_date in self.valuation_dates
+            ],
+        )
+        self.assertEqual(
+            pair_rows[("EUR", "GBP")],
+            [
+                (valuation_date, Decimal("0.8"))
+                for valuation_date in self.valuation_dates
+            ],
+        )
+
+    def test_cross_rates_use_the_highest_priority_base_rates(self):
+        """Test case for cross rates derived from the highest priority base vector."""
+        cross_rates = get_cross_rates_for_dates("USD", ["2024-01-01"])
+
+        self.assertAlmostEqual(
+            float(cross_rates["GBP"][0]["rate_value"]), 0.8 / 1.1, places=6
+        )
@@ -0,0 +1,75 @@
+import math
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from MyCurrencyApp.helper.twrr_engine import TwrrSeries, to_scaled_ints
+
+
+class TwrrEngineTests(SimpleTestCase):
+    def setUp(self):
+        rates = ["1.100000", "1.210000", "1.089000", "1.089000"]
+        self.rate_series = [
+            (date(2024, 1, 1) + timedelta(days=day), Decimal(rate))
+            for day, rate in enumerate(rates)
+        ]
+
+    def test_series_matches_the_decimal_calculation(self):
+        """Test case for returns and values matching exact Decimal arithmetic."""
+        twrr_series = TwrrSeries.from_rate_series(self.rate_series).to_dicts(1000.5)
+
+        self.assertEqual(
+            [point["twrr"] for point in twrr_series],
+            [0, 0.1, -0.1, 0],
+        )
+        self.assertEqual(
+            [point["cumulative_twrr"] for point in twrr_series],
+            [0, 0.1, -0.01, -0.01],
+        )
+        for point, (_, rate_value) in zip(twrr_series, self.rate_series):
+            self.assertEqual(point["rate_value"], rate_value)
+            self.assertEqual(point["amount"], Decimal("1000.5") * rate_value)
+        self.assertEqual(twrr_series[1]["valuation_date"], "2024-01-02")
+
+    def test_rolling_returns_match_the_window_ratios(self):
+        """Test case for trailing returns of a series with a missing date."""
+        rate_series = self.rate_series[:2] + self.rate_series[3:]
+        series = TwrrSeries.from_rate_series(rate_series)
+
+        rolling_returns = series.rolling_returns(2).tolist()
+
+        # 2024-01-04 has no rate two days earlier and falls back to 2024-01-01
+        self.assertTrue(math.isnan(rolling_returns[0]))
+        self.assertTrue(math.isnan(rolling_returns[1]))
+        self.assertAlmostEqual(rolling_returns[2], 1.089 / 1.21 - 1)
+        self.assertEqual(
+            [point["rolling_twrr"] for point in series.to_dicts(1, rolling_returns)],
+            [None, None, -0.1],
+        )
+
+    def test_slices_keep_dates_and_rates_aligned(self):
+        """Test case for the cumulative TWRR of a slice starting at its first date."""
+        series = TwrrSeries.from_rate_series(self.rate_series)[2:]
+
+        self.assertEqual(len(series), 2)
+        self.assertEqual(series.valuation_dates[0], date(2024, 1, 3))
+        self.assertEqual(series.cumulative_returns().tolist(), [0, 0])
+
+    def test_large_values_do_not_overflow(self):
+        """Test case for exact position values beyond the int64 range."""
+        series = TwrrSeries.from_rate_series(
+            [(date(2024, 1, 1), Decimal("15000.123456"))]
+        )
+
+        amount = Decimal("987654321987.654321")
+        self.assertEqual(
+            series.to_dicts(amount)[0]["amount"], amount * Decimal("15000.123456")
+        )
+
+    def test_scaled_ints_are_rounded_half_to_even(self):
+        """Test case for converting values with more decimals than the scale."""
+        self.assertEqual(
+            to_scaled_ints([Decimal("0.0000025"), Decimal("0.0000035"), 2], 6).tolist(),
+            [2, 4, 2000000],
+        )
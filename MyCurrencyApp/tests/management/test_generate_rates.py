@@ -0,0 +1,129 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from MyCurrencyApp.helper.get_currency_rates import get_currency_rates_data
+from MyCurrencyApp.helper.get_twrr_series import calculate_twrr
+from MyCurrencyApp.helper.rate_generator import iter_generated_rates
+from MyCurrencyApp.models import (
+    Currency,
+    CurrencyExchangeRate,
+    CurrencyProvider,
+    LatestExchangeRate,
+)
+
+
+class GenerateRatesTests(TestCase):
+    def setUp(self):
+        for name, priority in (("Mock", 0), ("Fixer", 1)):
+            CurrencyProvider.objects.create(
+                name=name, url="http://mock.url", active=True, priority=priority
+            )
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_rates_are_inserted_for_every_provider(self):
+        """Test case for inserting a generated history for several providers."""
+        call_command(
+            "generate_rates",
+            years=0.1,
+            end_date="2024-01-31",
+            currencies=5,
+            providers=["Mock", "Fixer"],
+            batch_size=500,
+            stdout=StringIO(),
+        )
+
+        # 37 days of rates from EUR to four currencies, quoted by two providers
+        self.assertEqual(Currency.objects.count(), 5)
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 37 * 4 * 2)
+        self.assertEqual(
+            CurrencyExchangeRate.objects.filter(source_currency__code="EUR").count(),
+            37 * 4 * 2,
+        )
+        self.assertEqual(LatestExchangeRate.objects.count(), 4 * 2)
+        self.assertEqual(
+            str(LatestExchangeRate.objects.values_list("valuation_date").first()[0]),
+            "2024-01-31",
+        )
+
+    def test_readers_keep_one_rate_per_date_of_several_providers(self):
+        """Test case for rate lists and TWRR series of a history of two providers."""
+        call_command(
+            "generate_rates",
+            years=0.1,
+            end_date="2024-01-31",
+            currencies=5,
+            providers=["Mock", "Fixer"],
+            stdout=StringIO(),
+        )
+
+        mock_rates = dict(
+            CurrencyExchangeRate.objects.filter(
+                source_currency__code="EUR",
+                target_currency__code="USD",
+                provider__name="Mock",
+            ).values_list("valuation_date", "rate_value")
+        )
+        rates = get_currency_rates_data("EUR", "2024-01-01", "2024-01-31")["USD"]
+        self.assertEqual(
+            [(rate["valuation_date"], rate["rate_value"]) for rate in rates],
+            sorted(
+                (valuation_date, rate_value)
+                for valuation_date, rate_value in mock_rates.items()
+                if str(valuation_date) >= "2024-01-01"
+            ),
+        )
+
+        twrr_series = calculate_twrr("EUR", "USD", 100, "2024-01-01", "2024-01-31")
+        self.assertEqual(len(twrr_series), 31)
+        self.assertEqual(
+            len({point["valuation_date"] for point in twrr_series}), len(twrr_series)
+        )
+
+    def test_files_are_reproducible_and_importable(self):
+        """Test case for writing the same seeded history twice and importing it."""
+        output = os.path.join(self.directory.name, "rates.csv")
+        options = {
+            "years": 0.1,
+            "end_date": "2024-01-31",
+            "currencies": 4,
+            "sources": ["EUR", "USD"],
+            "output": output,
+            "stdout": StringIO(),
+        }
+
+        call_command("generate_rates", **options)
+        with open(output) as rate_file:
+            first_run = rate_file.read()
+        call_command("generate_rates", **options)
+        with open(output) as rate_file:
+            self.assertEqual(rate_file.read(), first_run)
+
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 0)
+        call_command("import_rates", output, provider="Mock", stdout=StringIO())
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 37 * 2 * 3)
+
+    def test_generated_rates_are_consistent(self):
+        """Test case for cross rates of the random walk matching the direct rates."""
+        rates = {
+            (source, target): rate
+            for _, source, target, _, rate in iter_generated_rates(
+                ["EUR", "USD", "GBP"], ["EUR", "USD"], ["2024-01-01"], spread=0
+            )
+        }
+
+        self.assertAlmostEqual(
+            rates[("EUR", "USD")] * rates[("USD", "GBP")],
+            rates[("EUR", "GBP")],
+            places=4,
+        )
+
+    def test_unknown_provider(self):
+        """Test case for generating rates of a provider that does not exist."""
+        with self.assertRaises(CommandError):
+            call_command("generate_rates", providers=["Unknown"], stdout=StringIO())
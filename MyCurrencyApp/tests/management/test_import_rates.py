@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from MyCurrencyApp.helper.rate_files import iter_rate_records
+from MyCurrencyApp.helper.rate_import import (
+    ImportCheckpoint,
+    write_exchange_rate_rows,
+)
+from MyCurrencyApp.models import (
+    CurrencyExchangeRate,
+    CurrencyProvider,
+    LatestExchangeRate,
+)
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+
+RECORDS = [
+    {
+        "source_currency_code": "USD",
+        "target_currency_code": "EUR",
+        "valuation_date": f"2024-01-{day:02d}",
+        "rate_value": 0.9 + day / 1000,
+    }
+    for day in range(1, 11)
+]
+
+
+class ImportRatesTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.eur = create_source_currency("EUR", "Euro")
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _write(self, name, content):
+        file_path = os.path.join(self.directory.name, name)
+        with open(file_path, "w") as rate_file:
+            rate_file.write(content)
+        return file_path
+
+    def _write_csv(self, records):
+        lines = ["source_currency_code,target_currency_code,valuation_date,rate_value"]
+        lines += [
+            f"{r['source_currency_code']},{r['target_currency_code']},"
+            f"{r['valuation_date']},{r['rate_value']}"
+            for r in records
+        ]
+        return self._write("rates.csv", "\n".join(lines) + "\n")
+
+    def test_json_array_is_streamed(self):
+        """Test case for decoding a JSON array across read boundaries."""
+        file_path = self._write("rates.json", json.dumps(RECORDS, indent=4))
+
+        with patch("MyCurrencyApp.helper.rate_files.JSON_READ_SIZE", 7):
+            self.assertEqual(list(iter_rate_records(file_path)), RECORDS)
+
+    def test_import_skips_invalid_and_existing_rates(self):
+        """Test case for importing a file with invalid and already stored rates."""
+        add_exchange_rate(
+            self.usd, self.eur, self.provider, Decimal("1.5"), date(2024, 1, 1)
+        )
+        file_path = self._write_csv(
+            RECORDS
+            + [{**RECORDS[0], "target_currency_code": "XXX"}]
+            + [{**RECORDS[0], "rate_value": "abc"}]
+        )
+
+        output = StringIO()
+        call_command("import_rates", file_path, chunk_size=3, stdout=output)
+
+        self.assertIn("inserted 9 rows, skipped 2 invalid records", output.getvalue())
+        self.assertEqual(CurrencyExchangeRate.objects.count(), len(RECORDS))
+        self.assertEqual(
+            CurrencyExchangeRate.objects.get(
+                valuation_date=date(2024, 1, 1)
+            ).rate_value,
+            Decimal("1.5"),
+        )
+        self.assertEqual(
+            LatestExchangeRate.objects.get().valuation_date, date(2024, 1, 10)
+        )
+        self.assertFalse(os.path.exists(f"{file_path}.checkpoint"))
+
+    def test_resumed_import_refreshes_pairs_of_committed_chunks(self):
+        """Test case for refreshing the latest rates of chunks written before a crash."""
+        file_path = self._write_csv(RECORDS)
+        # Every chunk was committed, then the import crashed before the refresh
+        write_exchange_rate_rows(
+            [
+                (self.usd.id, self.eur.id, self.provider.id, r["valuation_date"], 0.9)
+                for r in RECORDS
+            ]
+        )
+        ImportCheckpoint(file_path).save(len(RECORDS))
+
+        call_command("import_rates", file_path, stdout=StringIO())
+
+        latest_rate = LatestExchangeRate.objects.get(
+            pk=LatestExchangeRate.make_key("USD", "EUR", self.provider.id)
+        )
+        self.assertEqual(latest_rate.valuation_date, date(2024, 1, 10))
+
+    def test_import_resumes_from_checkpoint(self):
+        """Test case for resuming an interrupted import after its last chunk."""
+        file_path = self._write_csv(RECORDS)
+        ImportCheckpoint(file_path).save(4)
+
+        output = StringIO()
+        call_command("import_rates", file_path, stdout=output)
+
+        self.assertIn("resuming after record 4", output.getvalue())
+        self.assertEqual(CurrencyExchangeRate.objects.count(), len(RECORDS) - 4)
+        self.assertFalse(
+            CurrencyExchangeRate.objects.filter(
+                valuation_date__lte=date(2024, 1, 4)
+            ).exists()
+        )
@@ -0,0 +1,127 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from MyCurrencyApp.models import (
+    CurrencyExchangeRate,
+    CurrencyProvider,
+    LatestExchangeRate,
+)
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+
+
+class IngestRatesTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.currencies = {
+            code: create_source_currency(code, code) for code in ["USD", "EUR", "CHF"]
+        }
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _write_json(self, name, source_code, target_code, days):
+        with open(os.path.join(self.directory.name, name), "w") as rate_file:
+            json.dump(
+                [
+                    {
+                        "source_currency_code": source_code,
+                        "target_currency_code": target_code,
+                        "valuation_date": f"2024-01-{day:02d}",
+                        "rate_value": 1 + day / 100,
+                    }
+                    for day in range(1, days + 1)
+                ],
+                rate_file,
+            )
+
+    def test_files_are_parsed_in_parallel_and_written_once(self):
+        """Test case for ingesting a directory of files with a pool of parsers."""
+        self._write_json("usd_eur.json", "USD", "EUR", 20)
+        self._write_json("usd_chf.json", "USD", "CHF", 15)
+        self._write_json("eur_chf.json", "EUR", "CHF", 10)
+
+        call_command(
+            "ingest_rates",
+            self.directory.name,
+            workers=2,
+            batch_size=4,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 45)
+        self.assertEqual(LatestExchangeRate.objects.count(), 3)
+
+    def test_rerun_reports_no_inserted_rows(self):
+        """Test case for not counting rows that were already stored."""
+        self._write_json("usd_eur.json", "USD", "EUR", 5)
+        call_command("ingest_rates", self.directory.name, workers=1, stdout=StringIO())
+
+        output = StringIO()
+        call_command("ingest_rates", self.directory.name, workers=1, stdout=output)
+
+        self.assertIn("Inserted 0 rows from 1 files", output.getvalue())
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 5)
+
+    def test_unreadable_file_is_reported(self):
+        """Test case for failing files not stopping the other files."""
+        self._write_json("usd_eur.json", "USD", "EUR", 5)
+        with open(os.path.join(self.directory.name, "broken.json"), "w") as rate_file:
+            rate_file.write("{}")
+
+        with self.assertRaisesMessage(CommandError, "broken.json"):
+            call_command(
+                "ingest_rates",
+                self.directory.name,
+                workers=2,
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 5)
+
+    def test_only_the_latest_rates_of_imported_pairs_are_refreshed(self):
+        """Test case for leaving the latest rates of other pairs untouched."""
+        add_exchange_rate(
+            self.currencies["EUR"], self.currencies["CHF"], self.provider, 0.95
+        )
+        LatestExchangeRate.objects.all().delete()
+        self._write_json("usd_eur.json", "USD", "EUR", 5)
+
+        call_command("ingest_rates", self.directory.name, workers=1, stdout=StringIO())
+
+        latest_rate = LatestExchangeRate.objects.get()
+        self.assertEqual(
+            latest_rate.key, LatestExchangeRate.make_key("USD", "EUR", self.provider.id)
+        )
+        self.assertEqual(latest_rate.valuation_date.isoformat(), "2024-01-05")
+
+    @patch(
+        "MyCurrencyApp.management.commands.ingest_rates.write_exchange_rate_rows",
+        side_effect=RuntimeError("database down"),
+    )
+    def test_write_error_stops_the_parse_workers(self, mock_write):
+        """Test case for failing fast when the writer fails with workers still parsing."""
+        self._write_json("usd_eur.json", "USD", "EUR", 31)
+        self._write_json("usd_chf.json", "USD", "CHF", 31)
+        self._write_json("eur_chf.json", "EUR", "CHF", 31)
+
+        # Workers fill the bounded queue with single-row batches and block on it
+        with self.assertRaisesMessage(RuntimeError, "database down"):
+            call_command(
+                "ingest_rates",
+                self.directory.name,
+                workers=2,
+                batch_size=1,
+                stdout=StringIO(),
+            )
+
+        mock_write.assert_called_once()
+        self.assertFalse(CurrencyExchangeRate.objects.exists())
@@ -0,0 +1,99 @@
+import os
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from MyCurrencyApp.models import Currency, CurrencyExchangeRate, CurrencyProvider
+
+SEEDED_ROWS = 1_000_000
+CURRENCY_CODES = [f"C{index:02d}" for index in range(20)]
+
+
+@skipUnless(
+    os.environ.get("RUN_QUERY_PLAN_TESTS"),
+    "Seeds a million rows; set RUN_QUERY_PLAN_TESTS=1 to run it",
+)
+class ExchangeRateQueryPlanTests(TestCase):
+    """
+    Seeds a large rate table so the planner picks indexes the way it would in
+    production, then checks the plans of the hot rate queries. The tests are opt-in
+    as seeding takes a while.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        currencies = [Currency.objects.create(code=code) for code in CURRENCY_CODES]
+        cls.first_id = currencies[0].id
+        cls.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", priority=0
+        )
+
+        # Ten source currencies, ten target currencies and 100 rates per day
+        if connection.vendor == "postgresql":
+            valuation_date = "DATE '2000-01-01' + (n / 100)::int"
+        else:
+            valuation_date = "date('2000-01-01', '+' || (n / 100) || ' days')"
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {connection.ops.quote_name(CurrencyExchangeRate._meta.db_table)} "
+                "(source_currency_id, target_currency_id, provider_id, valuation_date, "
+                "rate_value, active, created_at, updated_at) "
+                "WITH RECURSIVE seq(n) AS "
+                "(SELECT 0 UNION ALL SELECT n + 1 FROM seq WHERE n < %s) "
+                f"SELECT %s + n %% 10, %s + 10 + (n / 10) %% 10, %s, {valuation_date}, "
+                "1 + (n %% 97) / 100.0, %s, %s, %s FROM seq",
+                [
+                    SEEDED_ROWS - 1,
+                    cls.first_id,
+                    cls.first_id,
+                    cls.provider.id,
+                    True,
+                    "2000-01-01 00:00:00",
+                    "2000-01-01 00:00:00",
+                ],
+            )
+            cursor.execute("ANALYZE")
+
+    def assertUsesPairIndex(self, queryset):
+        # SQLite creates the unique constraint inline, as an automatic index
+        if connection.vendor == "sqlite":
+            index_name = "sqlite_autoindex_MyCurrencyApp_currencyexchangerate"
+        else:
+            index_name = "unique_exchange_rate_per_provider"
+        self.assertIn(index_name, queryset.explain())
+
+    def test_seeded_rows(self):
+        """Test case for the seeded table size."""
+        self.assertEqual(CurrencyExchangeRate.objects.count(), SEEDED_ROWS)
+
+    def test_source_date_range_uses_source_date_index(self):
+        """Test case for the plan of the rates of a source currency over a date range."""
+        queryset = CurrencyExchangeRate.objects.filter(
+            source_currency_id=self.first_id,
+            valuation_date__range=["2010-01-01", "2010-01-31"],
+        ).values_list("target_currency_id", "valuation_date", "rate_value")
+
+        self.assertIn("exchange_rate_source_date_idx", queryset.explain())
+
+    def test_pair_date_range_uses_pair_index(self):
+        """Test case for the plan of the rates of a currency pair over a date range."""
+        queryset = CurrencyExchangeRate.objects.filter(
+            source_currency_id=self.first_id,
+            target_currency_id=self.first_id + 10,
+            valuation_date__gte="2020-01-01",
+        ).order_by("valuation_date")
+
+        self.assertUsesPairIndex(queryset)
+
+    def test_pair_date_lookup_uses_pair_index(self):
+        """Test case for the plan of the rate of a currency pair on a date."""
+        queryset = CurrencyExchangeRate.objects.filter(
+            source_currency_id=self.first_id,
+            target_currency_id=self.first_id + 10,
+            valuation_date="2020-01-01",
+            provider__active=True,
+        ).order_by("-provider__priority")
+
+        self.assertUsesPairIndex(queryset)
@@ -0,0 +1,92 @@
+import threading
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.monitoring.metrics import Counter, Gauge, Histogram, render_metrics
+from MyCurrencyApp.tests.confest import create_source_currency
+
+
+class MetricsTests(SimpleTestCase):
+    def test_counter_adds_up_thread_shards(self):
+        """Test case for counting from many threads without locking."""
+        counter = Counter("test_total", "Test counter.", ["provider"])
+
+        def increment():
+            for _ in range(1000):
+                counter.inc(provider="Fixer")
+            counter.inc(2, provider="Mock")
+
+        threads = [threading.Thread(target=increment) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(provider="Fixer")
+
+        self.assertEqual(counter.values(), {("Fixer",): 8001, ("Mock",): 16})
+        # Shards of exited threads are folded on read
+        self.assertEqual(len(counter._values._shards), 1)
+        self.assertEqual(counter.values(), {("Fixer",): 8001, ("Mock",): 16})
+
+    def test_histogram_renders_cumulative_buckets(self):
+        """Test case for the text exposition of a histogram."""
+        histogram = Histogram(
+            "test_seconds", "Test histogram.", ["endpoint"], buckets=(0.1, 1)
+        )
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, endpoint="currency-rates")
+
+        self.assertEqual(
+            render_metrics([histogram]),
+            "# HELP test_seconds Test histogram.\n"
+            "# TYPE test_seconds histogram\n"
+            'test_seconds_bucket{endpoint="currency-rates",le="0.1"} 2\n'
+            'test_seconds_bucket{endpoint="currency-rates",le="1"} 3\n'
+            'test_seconds_bucket{endpoint="currency-rates",le="+Inf"} 4\n'
+            'test_seconds_count{endpoint="currency-rates"} 4\n'
+            'test_seconds_sum{endpoint="currency-rates"} 3.65\n',
+        )
+
+    def test_gauge_is_collected_on_render(self):
+        """Test case for computing gauges and escaping label values on render."""
+        gauge = Gauge(
+            "test_ratio", "Test gauge.", ["cache"], lambda: {('sha"red',): 0.5}
+        )
+
+        self.assertIn('test_ratio{cache="sha\\"red"} 0.5', render_metrics([gauge]))
+
+
+class MetricsViewTests(APITestCase):
+    def test_scrape_reports_requests_without_queries(self):
+        """Test case for scraping request and provider metrics without the database."""
+        create_source_currency("USD", "US Dollar")
+        create_source_currency("EUR", "Euro")
+        CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.client.get(
+            reverse("currency-rates"),
+            {
+                "source_currency": "USD",
+                "date_from": "2024-01-01",
+                "date_to": "2024-01-02",
+            },
+        )
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn(
+            'mycurrency_request_duration_seconds_count{endpoint="currency-rates",'
+            'method="GET"}',
+            body,
+        )
+        self.assertIn('mycurrency_provider_calls_total{provider="Mock"}', body)
+        self.assertIn('mycurrency_cache_hit_ratio{cache="shared"}', body)
+        self.assertIn("mycurrency_exchange_rate_rows_written_total", body)
@@ -0,0 +1,91 @@
+import json
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.monitoring.request_metrics import (
+    get_request_metrics,
+    measure,
+    start_request_metrics,
+    stop_request_metrics,
+    timed_provider_call,
+)
+from MyCurrencyApp.providers.fetch_pool import fetch_concurrently
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+
+
+class RequestMetricsMiddlewareTests(APITestCase):
+    def setUp(self):
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.eur = create_source_currency("EUR", "Euro")
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.url = reverse("currency-rates")
+        self.params = {
+            "source_currency": "USD",
+            "date_from": "2024-01-01",
+            "date_to": "2024-01-02",
+        }
+
+    def test_server_timing_reports_queries(self):
+        """Test case for the database metrics of a request read from stored rates."""
+        for day in (1, 2):
+            add_exchange_rate(
+                self.usd, self.eur, self.provider, valuation_date=f"2024-01-0{day}"
+            )
+
+        response = self.client.get(self.url, self.params)
+
+        server_timing = response["Server-Timing"]
+        self.assertRegex(server_timing, r'^db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn("cache-shared;", server_timing)
+        self.assertIn("total;dur=", server_timing)
+        self.assertNotIn("provider-", server_timing)
+
+    def test_provider_calls_are_reported_and_logged(self):
+        """Test case for the provider metrics and the JSON log line of a request."""
+        with self.assertLogs("MyCurrencyApp.monitoring", "INFO") as logs:
+            response = self.client.get(self.url, self.params)
+
+        self.assertIn("provider-mock;dur=", response["Server-Timing"])
+        self.assertIn('desc="1 calls, 0 errors"', response["Server-Timing"])
+
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record["path"], self.url)
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["providers"]["Mock"]["calls"], 1)
+        self.assertGreater(record["db"]["queries"], 0)
+        self.assertIn("rate-save", record["spans"])
+
+
+@override_settings(PROVIDER_FETCH={"max_workers": 4, "max_concurrency": {}})
+class RequestMetricsTests(SimpleTestCase):
+    def test_hooks_are_noops_outside_of_requests(self):
+        """Test case for recording metrics without a current request."""
+        fetch = timed_provider_call(lambda client: {"rates": {}})
+
+        with measure("span"):
+            self.assertEqual(fetch(SimpleNamespace(name="Fixer")), {"rates": {}})
+        self.assertIsNone(get_request_metrics())
+
+    def test_pool_calls_record_into_the_request(self):
+        """Test case for provider calls on the fetch pool recording into the request."""
+        fetch = timed_provider_call(lambda client, item: item if item != 3 else None)
+        metrics, token = start_request_metrics()
+        try:
+            fetch_concurrently(
+                SimpleNamespace(name="Fixer"),
+                SimpleNamespace(name="Fixer"),
+                fetch,
+                [1, 2, 3, 4],
+            )
+        finally:
+            stop_request_metrics(token)
+
+        self.assertEqual(metrics.providers["Fixer"]["calls"], 4)
+        self.assertEqual(metrics.providers["Fixer"]["errors"], 1)
+        self.assertIsNone(get_request_metrics())
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from MyCurrencyApp.helper.get_currency_rates import _fetch_and_save_from_providers
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.providers.circuit_breaker import (
+    CircuitBreaker,
+    NegativeCache,
+    guarded_fetch,
+    reset_circuit_breakers,
+)
+from MyCurrencyApp.tests.confest import create_source_currency
+
+
+class CircuitBreakerTests(TestCase):
+    def test_circuit_opens_after_consecutive_failures(self):
+        """Test case for skipping a provider once its failure threshold is reached."""
+        circuit_breaker = CircuitBreaker("Fixer", failure_threshold=2)
+        circuit_breaker.record_failure()
+        self.assertTrue(circuit_breaker.allow_request())
+        circuit_breaker.record_failure()
+
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(circuit_breaker.allow_request())
+
+    def test_half_open_circuit_allows_a_single_trial(self):
+        """Test case for the recovery trial after the timeout."""
+        circuit_breaker = CircuitBreaker(
+            "Fixer", failure_threshold=1, recovery_timeout=0
+        )
+        circuit_breaker.record_failure()
+
+        self.assertTrue(circuit_breaker.allow_request())
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(circuit_breaker.allow_request())
+
+        circuit_breaker.record_success()
+        self.assertEqual(circuit_breaker.state, CircuitBreaker.CLOSED)
+
+    def test_negative_cache_expires(self):
+        """Test case for failed lookups being forgotten after their TTL."""
+        negative_cache = NegativeCache(ttl=-1)
+        negative_cache.add(("Fixer", "2024-01-01"))
+        self.assertNotIn(("Fixer", "2024-01-01"), negative_cache)
+
+
+class ProviderChainTests(TestCase):
+    def setUp(self):
+        reset_circuit_breakers()
+        self.addCleanup(reset_circuit_breakers)
+        self.fixer = CurrencyProvider.objects.create(
+            name="Fixer", url="http://fixer.url", active=True, priority=0
+        )
+        CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=1
+        )
+        create_source_currency("USD", "US Dollar")
+        create_source_currency("EUR", "Euro")
+
+    @override_settings(PROVIDER_FETCH={"max_workers": 1})
+    @patch(
+        "MyCurrencyApp.providers.fixer_provider.FixerProvider.supports_timeseries",
+        False,
+    )
+    @patch(
+        "MyCurrencyApp.providers.fixer_provider.FixerProvider.get_exchange_rate_data"
+    )
+    def test_open_provider_is_skipped_immediately(self, mock_fixer):
+        """Test case for falling back to the next provider without calling an open one."""
+        mock_fixer.return_value = None
+        dates = ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+
+        response_data = _fetch_and_save_from_providers("USD", dates)
+
+        self.assertEqual(mock_fixer.call_count, 3)
+        self.assertEqual(len(response_data["EUR"]), len(dates))
+
+        response = self.client.get(reverse("provider-status"))
+        states = {state["provider"]: state for state in response.json()["providers"]}
+        self.assertEqual(states["Fixer"]["state"], CircuitBreaker.OPEN)
+        self.assertEqual(states["Mock"]["state"], CircuitBreaker.CLOSED)
+        self.assertEqual(response.json()["failed_lookups"], 3)
+
+    def test_failed_lookup_does_not_skip_other_currencies(self):
+        """Test case for keying failed lookups by source and target currencies."""
+        self.assertIsNone(
+            guarded_fetch(self.fixer, ("USD", "EUR", "2024-01-01"), lambda: None)
+        )
+
+        self.assertIsNone(
+            guarded_fetch(
+                self.fixer, ("USD", "EUR", "2024-01-01"), lambda: {"rates": {}}
+            )
+        )
+        self.assertEqual(
+            guarded_fetch(
+                self.fixer, ("EUR", "USD", "2024-01-01"), lambda: {"rates": {}}
+            ),
+            {"rates": {}},
+        )
+        self.assertEqual(
+            guarded_fetch(self.fixer, ("USD", "", "2024-01-01"), lambda: {"rates": {}}),
+            {"rates": {}},
+        )
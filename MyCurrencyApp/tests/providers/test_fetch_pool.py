@@ -0,0 +1,72 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, override_settings
+
+from MyCurrencyApp.providers.fetch_pool import (
+    fetch_concurrently,
+    get_provider_concurrency,
+)
+
+
+class FakeClient:
+    def __init__(self):
+        self.url = None
+
+
+@override_settings(PROVIDER_FETCH={"max_workers": 8, "max_concurrency": {"Mock": 1}})
+class FetchPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def fetch(self, client, item):
+        client.url = item
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        if item == "2024-01-03":
+            raise ValueError("Provider error")
+        return {"url": client.url, "thread": threading.current_thread()}
+
+    def test_provider_concurrency_limits(self):
+        """Test case for the configured and default provider concurrency."""
+        self.assertEqual(get_provider_concurrency("Mock"), 1)
+        self.assertEqual(get_provider_concurrency("Fixer"), 8)
+
+    def test_dates_are_fetched_in_parallel_and_gathered_in_order(self):
+        """Test case for fanning out dates and gathering results in date order."""
+        dates = [f"2024-01-{day:02d}" for day in range(1, 9)]
+        client = FakeClient()
+
+        started = time.perf_counter()
+        results = fetch_concurrently(
+            SimpleNamespace(name="Fixer"), client, self.fetch, dates
+        )
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual([item for item, _, _ in results], dates)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLess(elapsed, 0.05 * len(dates))
+        self.assertIsInstance(results[2][2], ValueError)
+        for item, result, error in results:
+            if not error:
+                self.assertEqual(result["url"], item)
+        self.assertIsNone(client.url)
+
+    def test_limited_provider_runs_in_the_calling_thread(self):
+        """Test case for providers limited to one request at a time."""
+        dates = ["2024-01-01", "2024-01-02"]
+
+        results = fetch_concurrently(
+            SimpleNamespace(name="Mock"), FakeClient(), self.fetch, dates
+        )
+
+        self.assertEqual(self.max_in_flight, 1)
+        for _, result, _ in results:
+            self.assertIs(result["thread"], threading.current_thread())
@@ -0,0 +1,55 @@
+from datetime import date
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from benchmarks.fake_fixer import FakeFixerServer
+from benchmarks.http_session_benchmark import run
+from MyCurrencyApp.providers.fixer_provider import FixerProvider
+from MyCurrencyApp.providers.http_session import build_http_session, get_http_session
+
+
+class HttpSessionTests(SimpleTestCase):
+    def setUp(self):
+        self.provider_model = SimpleNamespace(
+            name="Fixer", api_key="test", default_base_currency="EUR"
+        )
+
+    def test_providers_share_the_process_session(self):
+        """Test case for reusing one pooled session across provider instances."""
+        first = FixerProvider(self.provider_model, "http://localhost")
+        second = FixerProvider(self.provider_model, "http://localhost")
+
+        self.assertIs(first.session, get_http_session())
+        self.assertIs(first.session, second.session)
+
+    def test_session_adapter_configuration(self):
+        """Test case for the pool size and retries of the session adapter."""
+        adapter = build_http_session(pool_maxsize=8, max_retries=5).get_adapter(
+            "https://data.fixer.io"
+        )
+
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertEqual(adapter.max_retries.read, 0)
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+
+    def test_keep_alive_reuses_the_connection(self):
+        """Test case for fetching many dates over a single connection."""
+        with FakeFixerServer() as server:
+            provider = FixerProvider(self.provider_model, server.url)
+            provider.session = build_http_session()
+
+            for valuation_date in ["2024-01-01", "2024-01-02", "2024-01-03"]:
+                provider.set_url(server.url, valuation_date)
+                data = provider.get_exchange_rate_data("EUR", "USD", valuation_date)
+                self.assertIn("USD", data["rates"])
+
+        self.assertEqual(server.connections, 1)
+
+    def test_benchmark_fetches_through_the_session(self):
+        """Test case for running the HTTP session benchmark against the stand-in API."""
+        with FakeFixerServer() as server:
+            result = run(server, build_http_session(), [date(2024, 1, 1)])
+
+        self.assertEqual(result["connections"], 1)
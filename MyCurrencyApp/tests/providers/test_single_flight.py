@@ -0,0 +1,151 @@
+import threading
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+
+from MyCurrencyApp.helper.get_batch_exchange_rates import fetch_latest_rates
+from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
+from MyCurrencyApp.providers.mock_provider import MockProvider
+from MyCurrencyApp.providers.single_flight import SingleFlight
+from MyCurrencyApp.tests.confest import create_source_currency
+
+
+class WaitingEvent:
+    """
+    Wraps the done event of a flight and counts the callers waiting on it, so tests
+    know every waiter joined the flight before the leader completes.
+    """
+
+    def __init__(self, event):
+        self.event = event
+        self.waiting = threading.Semaphore(0)
+
+    def wait(self, timeout=None):
+        self.waiting.release()
+        return self.event.wait(timeout)
+
+    def set(self):
+        self.event.set()
+
+    def wait_for_waiters(self, count):
+        return all(self.waiting.acquire(timeout=5) for _ in range(count))
+
+
+class SingleFlightTests(TestCase):
+    def start_leader(self, single_flight, fn, results):
+        started = threading.Event()
+        release = threading.Event()
+
+        def lead():
+            started.set()
+            release.wait(5)
+            return fn()
+
+        leader = threading.Thread(
+            target=self.run_call, args=(single_flight, lead, results)
+        )
+        leader.start()
+        self.assertTrue(started.wait(5))
+        done = WaitingEvent(single_flight._calls["key"].done)
+        single_flight._calls["key"].done = done
+        return leader, done, release
+
+    def run_call(self, single_flight, fn, results):
+        try:
+            results.append(single_flight.do("key", fn))
+        except Exception as e:
+            results.append(e)
+
+    def test_concurrent_callers_share_the_leader_result(self):
+        """Test case for coalescing concurrent calls with the same key."""
+        single_flight = SingleFlight()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            return {"EUR": 1.1}
+
+        leader, done, release = self.start_leader(single_flight, fetch, results)
+        waiters = [
+            threading.Thread(target=self.run_call, args=(single_flight, fetch, results))
+            for _ in range(4)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        self.assertTrue(done.wait_for_waiters(4))
+        release.set()
+        for thread in [leader, *waiters]:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"EUR": 1.1}] * 5)
+        self.assertEqual(single_flight.in_flight(), 0)
+
+    def test_waiters_receive_the_leader_error(self):
+        """Test case for propagating the leader's exception to waiters."""
+        single_flight = SingleFlight()
+        waiter_calls = []
+        leader_results = []
+        waiter_results = []
+
+        def fail():
+            raise ValueError("provider down")
+
+        leader, done, release = self.start_leader(single_flight, fail, leader_results)
+        waiter = threading.Thread(
+            target=self.run_call,
+            args=(single_flight, lambda: waiter_calls.append(1), waiter_results),
+        )
+        waiter.start()
+        self.assertTrue(done.wait_for_waiters(1))
+        release.set()
+        leader.join()
+        waiter.join()
+
+        self.assertIsInstance(leader_results[0], ValueError)
+        self.assertIs(waiter_results[0], leader_results[0])
+        self.assertEqual(waiter_calls, [])
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+
+
+class FetchLatestRatesTests(TestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.source_currency = create_source_currency("USD", "US Dollar")
+        create_source_currency("EUR", "Euro")
+
+    def test_rates_saved_by_another_process_are_reused(self):
+        """Test case for skipping the provider call once the rates are stored."""
+        rates = fetch_latest_rates(self.source_currency, self.provider)
+
+        with patch(
+            "MyCurrencyApp.providers.mock_provider.MockProvider.get_exchange_rate_data"
+        ) as mock_fetch:
+            self.assertEqual(
+                fetch_latest_rates(self.source_currency, self.provider).keys(),
+                rates.keys(),
+            )
+            mock_fetch.assert_not_called()
+
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 1)
+
+    def test_provider_is_called_outside_a_transaction(self):
+        """Test case for not holding a transaction open during the provider call."""
+        atomic_blocks = []
+        get_exchange_rate_data = MockProvider.get_exchange_rate_data
+
+        def fetch(provider, *args):
+            atomic_blocks.append(len(connection.atomic_blocks))
+            return get_exchange_rate_data(provider, *args)
+
+        # Test cases run inside their own transaction
+        outer_atomic_blocks = len(connection.atomic_blocks)
+        with patch.object(MockProvider, "get_exchange_rate_data", fetch):
+            fetch_latest_rates(self.source_currency, self.provider)
+
+        self.assertEqual(atomic_blocks, [outer_atomic_blocks])
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 1)
@@ -0,0 +1,108 @@
+from decimal import Decimal
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from MyCurrencyApp.cache.currency_ids import currency_ids
+from MyCurrencyApp.helper.get_batch_exchange_rates import get_or_create_exchange_rates
+from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
+from MyCurrencyApp.tests.confest import create_source_currency, add_exchange_rate
+
+
+class CurrencyBatchConverterViewTests(APITestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.eur = create_source_currency("EUR", "Euro")
+        self.gbp = create_source_currency("GBP", "British Pound")
+        self.url = reverse("currency-converter-batch")
+
+    def test_missing_parameters(self):
+        """Test case for missing required parameters in the request."""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Missing required parameters", response.data["error"])
+
+        response = self.client.post(self.url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_body_must_be_an_object(self):
+        """Test case for a JSON body that is not an object."""
+        response = self.client.post(
+            self.url,
+            [{"source_currency": "USD", "target_currency": "EUR", "amount": 1}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("must be a JSON object", response.data["error"])
+
+    def test_unsupported_currencies(self):
+        """Test case for unsupported currency codes in the request."""
+        response = self.client.get(
+            self.url,
+            {"source_currency": "USD", "target_currencies": "EUR,XYZ", "amount": "1"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Currencies not supported", response.data["error"])
+
+    def test_invalid_amount(self):
+        """Test case for invalid amount format in the request."""
+        response = self.client.get(
+            self.url,
+            {"source_currency": "USD", "target_currencies": "EUR", "amount": "abc"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Invalid amount format", response.data["error"])
+
+    def test_one_source_many_targets_from_database(self):
+        """Test case for converting into several targets with rates from the database."""
+        add_exchange_rate(self.usd, self.eur, self.provider, rate_value=1.09)
+        add_exchange_rate(self.usd, self.gbp, self.provider, rate_value=0.8)
+
+        response = self.client.get(
+            self.url,
+            {"source_currency": "USD", "target_currencies": "EUR,GBP", "amount": "10"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        conversions = response.data["conversions"]
+        self.assertEqual(conversions[0]["converted_amount"], Decimal("10.90"))
+        self.assertEqual(conversions[1]["converted_amount"], Decimal("8.0"))
+
+    def test_list_of_conversions_from_provider(self):
+        """Test case for converting a list of (source, target, amount) with the provider."""
+        response = self.client.post(
+            self.url,
+            {
+                "conversions": [
+                    {"source_currency": "USD", "target_currency": "EUR", "amount": 10},
+                    {"source_currency": "USD", "target_currency": "GBP", "amount": 5},
+                    {"source_currency": "GBP", "target_currency": "USD", "amount": 1},
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["conversions"]), 3)
+        for conversion in response.data["conversions"]:
+            self.assertTrue(0.85 <= conversion["exchange_rate"] <= 1.25)
+        # One provider call per source currency stores every rate it returned
+        self.assertEqual(CurrencyExchangeRate.objects.count(), 4)
+
+    def test_rates_are_resolved_with_a_single_query(self):
+        """Test case for resolving many stored rates with one database query."""
+        add_exchange_rate(self.usd, self.eur, self.provider, rate_value=1.09)
+        add_exchange_rate(self.usd, self.gbp, self.provider, rate_value=0.8)
+        add_exchange_rate(self.eur, self.gbp, self.provider, rate_value=0.85)
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            exchange_rates = get_or_create_exchange_rates(
+                [("USD", "EUR"), ("USD", "GBP"), ("EUR", "GBP"), ("EUR", "EUR")]
+            )
+
+        self.assertEqual(exchange_rates[("USD", "GBP")], Decimal("0.8"))
+        self.assertEqual(exchange_rates[("EUR", "EUR")], Decimal(1))
@@ -6,6 +6,7 @@ from rest_framework import status
 from django.urls import reverse
 from unittest.mock import patch
 
+from MyCurrencyApp.cache.currency_ids import currency_ids
 from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
 from MyCurrencyApp.tests.confest import (
     create_source_currency,
@@ -147,3 +148,33 @@ class CurrencyRatesListViewTests(APITestCase):
                 round(db_rate.rate_value, 3),
                 round(Decimal(response_rate["rate_value"]), 3),
             )
+
+    def test_stored_rates_are_read_with_one_query(self):
+        """Test case for reading every stored rate of a range with a single query."""
+        gbp = create_source_currency("GBP", "British Pound")
+        range_dates = get_date_range("2023-10-01", "2023-10-31")
+
+        for target_currency in (self.target_currency, gbp):
+            for valuation_date in range_dates:
+                add_exchange_rate(
+                    self.source_currency,
+                    target_currency,
+                    self.provider,
+                    valuation_date=valuation_date,
+                )
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url,
+                {
+                    "source_currency": "USD",
+                    "date_from": "2023-10-01",
+                    "date_to": "2023-10-31",
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data), ["EUR", "GBP"])
+        self.assertEqual(len(response.data["GBP"]), len(range_dates))
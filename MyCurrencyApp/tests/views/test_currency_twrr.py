@@ -6,6 +6,7 @@ from rest_framework import status
 from django.urls import reverse
 from unittest.mock import patch
 
+from MyCurrencyApp.cache.currency_ids import currency_ids
 from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
 from MyCurrencyApp.tests.confest import (
     create_source_currency,
@@ -144,6 +145,280 @@ class CurrencyTWRRViewTests(APITestCase):
         self.assertEqual(Decimal(response.data["amount_invested"]), Decimal("1000"))
         self.assertEqual(response.data["start_date"], start_date)
 
+    def test_stored_series_is_read_with_one_query(self):
+        """Test case for calculating TWRR from stored rates with a single query."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        start_date = (datetime.now() - timedelta(days=20)).strftime("%Y-%m-%d")
+        range_dates = get_date_range(start_date, datetime.now().strftime("%Y-%m-%d"))
+
+        for valuation_date in range_dates:
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                self.provider,
+                valuation_date=valuation_date,
+            )
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url,
+                {
+                    "source_currency": "USD",
+                    "exchanged_currency": "EUR",
+                    "amount": "1000",
+                    "start_date": start_date,
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["twrr_series"]), len(range_dates))
+
+    def test_series_has_one_rate_per_date_with_several_providers(self):
+        """Test case for a series stored by more than one provider."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        secondary = CurrencyProvider.objects.create(
+            name="Secondary", url="http://secondary.url", active=True, priority=1
+        )
+        start_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
+        range_dates = get_date_range(start_date, datetime.now().strftime("%Y-%m-%d"))
+
+        for valuation_date in range_dates:
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                secondary,
+                rate_value=Decimal("0.95"),
+                valuation_date=valuation_date,
+            )
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                self.provider,
+                rate_value=Decimal("0.9"),
+                valuation_date=valuation_date,
+            )
+
+        response = self.client.get(
+            self.url,
+            {
+                "source_currency": "USD",
+                "exchanged_currency": "EUR",
+                "amount": "1000",
+                "start_date": start_date,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        twrr_series = response.data["twrr_series"]
+        self.assertEqual(
+            [point["valuation_date"] for point in twrr_series], range_dates
+        )
+        self.assertEqual(
+            {point["rate_value"] for point in twrr_series}, {Decimal("0.9")}
+        )
+        self.assertEqual({point["twrr"] for point in twrr_series}, {0.0})
+
+    def test_summary_is_read_with_two_lookups(self):
+        """Test case for the TWRR of a period from its first and last stored rates."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        start_date = (datetime.now() - timedelta(days=20)).strftime("%Y-%m-%d")
+        range_dates = get_date_range(start_date, datetime.now().strftime("%Y-%m-%d"))
+
+        for index, valuation_date in enumerate(range_dates):
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                self.provider,
+                rate_value=Decimal("0.8") + Decimal(index) / 100,
+                valuation_date=valuation_date,
+            )
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.url,
+                {
+                    "source_currency": "USD",
+                    "exchanged_currency": "EUR",
+                    "amount": "1000",
+                    "start_date": start_date,
+                    "summary": "true",
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        twrr_summary = response.data["twrr_summary"]
+        self.assertEqual(twrr_summary["start_date"], range_dates[0])
+        self.assertEqual(twrr_summary["end_date"], range_dates[-1])
+        self.assertEqual(twrr_summary["start_amount"], Decimal("800"))
+        self.assertEqual(twrr_summary["end_amount"], Decimal("1000"))
+        self.assertEqual(twrr_summary["twrr"], 0.25)
+
+        series = self.client.get(
+            self.url,
+            {
+                "source_currency": "USD",
+                "exchanged_currency": "EUR",
+                "amount": "1000",
+                "start_date": start_date,
+            },
+        ).data["twrr_series"]
+        self.assertEqual(series[-1]["cumulative_twrr"], twrr_summary["twrr"])
+
+    def test_summary_matches_the_series_with_missing_boundary_rates(self):
+        """Test case for a summary whose end date has no stored rate."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        start_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
+        range_dates = get_date_range(start_date, datetime.now().strftime("%Y-%m-%d"))
+
+        for index, valuation_date in enumerate(range_dates[:2]):
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                self.provider,
+                rate_value=Decimal("1.0") + Decimal(index) / 10,
+                valuation_date=valuation_date,
+            )
+
+        parameters = {
+            "source_currency": "USD",
+            "exchanged_currency": "EUR",
+            "amount": "1000",
+            "start_date": start_date,
+        }
+        summary = self.client.get(self.url, {**parameters, "summary": "true"})
+        series = self.client.get(self.url, parameters)
+
+        self.assertEqual(summary.status_code, status.HTTP_200_OK)
+        twrr_summary = summary.data["twrr_summary"]
+        self.assertEqual(twrr_summary["end_date"], range_dates[-1])
+        self.assertEqual(
+            twrr_summary["twrr"], series.data["twrr_series"][-1]["cumulative_twrr"]
+        )
+
+    def test_summary_from_provider(self):
+        """Test case for the TWRR summary of a pair without stored rates."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        start_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
+
+        response = self.client.get(
+            self.url,
+            {
+                "source_currency": "USD",
+                "exchanged_currency": "EUR",
+                "amount": "1000",
+                "start_date": start_date,
+                "summary": "1",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["twrr_summary"]["start_date"], start_date)
+
+    def test_series_stops_at_end_date(self):
+        """Test case for a TWRR series over a period ending before today."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        start_date = (datetime.now() - timedelta(days=20)).strftime("%Y-%m-%d")
+        end_date = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+
+        for valuation_date in get_date_range(start_date, end_date):
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                self.provider,
+                valuation_date=valuation_date,
+            )
+
+        with patch(
+            "MyCurrencyApp.helper.get_twrr_series._fetch_and_save_from_providers"
+        ) as mock_fetch:
+            response = self.client.get(
+                self.url,
+                {
+                    "source_currency": "USD",
+                    "exchanged_currency": "EUR",
+                    "amount": "1000",
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_fetch.assert_not_called()
+        self.assertEqual(len(response.data["twrr_series"]), 11)
+        self.assertEqual(response.data["end_date"], end_date)
+        self.assertEqual(response.data["twrr_series"][-1]["valuation_date"], end_date)
+
+    def test_rolling_window_series(self):
+        """Test case for the trailing TWRR of every date of the period."""
+        delete_exchange_rate(self.source_currency, self.target_currency)
+        start_date = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+        history_start = (datetime.now() - timedelta(days=15)).strftime("%Y-%m-%d")
+        range_dates = get_date_range(history_start, datetime.now().strftime("%Y-%m-%d"))
+
+        for index, valuation_date in enumerate(range_dates):
+            add_exchange_rate(
+                self.source_currency,
+                self.target_currency,
+                self.provider,
+                rate_value=Decimal(1 + index),
+                valuation_date=valuation_date,
+            )
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url,
+                {
+                    "source_currency": "USD",
+                    "exchanged_currency": "EUR",
+                    "amount": "1000",
+                    "start_date": start_date,
+                    "window": "5",
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["window"], 5)
+        twrr_series = response.data["twrr_series"]
+        self.assertEqual(twrr_series[0]["valuation_date"], start_date)
+        self.assertEqual(twrr_series[0]["cumulative_twrr"], 0.0)
+        for offset, point in enumerate(twrr_series):
+            index = offset + 5
+            self.assertEqual(
+                point["rolling_twrr"], round((index + 1) / (index - 4) - 1, 10)
+            )
+
+    def test_invalid_period_parameters(self):
+        """Test case for rejecting invalid end dates and windows."""
+        parameters = {
+            "source_currency": "USD",
+            "exchanged_currency": "EUR",
+            "amount": "1000",
+            "start_date": "2024-01-10",
+        }
+        invalid_parameters = [
+            ({"end_date": "2024-01-09"}, "end_date must not be before start_date"),
+            ({"end_date": "10/01/2024"}, "Invalid date format"),
+            ({"end_date": "2999-01-05"}, "Dates must not be in the future"),
+            ({"start_date": "2999-01-05"}, "Dates must not be in the future"),
+            ({"window": "0"}, "window must be a positive number of days"),
+            ({"window": "week"}, "window must be a positive number of days"),
+            (
+                {"window": "5", "summary": "true"},
+                "window cannot be combined with summary",
+            ),
+        ]
+
+        for extra_parameters, error in invalid_parameters:
+            response = self.client.get(self.url, {**parameters, **extra_parameters})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(error, response.data["error"])
+
     def test_successful_twrr_calculation_from_provider(self):
         """Test case for successful TWRR calculation from the mock provider."""
         delete_exchange_rate(self.source_currency, self.target_currency)
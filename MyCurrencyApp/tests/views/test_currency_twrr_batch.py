@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from MyCurrencyApp.cache.currency_ids import currency_ids
+from MyCurrencyApp.helper.get_currency_rates import _fetch_and_save_from_providers
+from MyCurrencyApp.models import CurrencyExchangeRate, CurrencyProvider
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+from MyCurrencyApp.utils import get_date_range
+
+
+class CurrencyTWRRBatchViewTests(APITestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.eur = create_source_currency("EUR", "Euro")
+        self.gbp = create_source_currency("GBP", "British Pound")
+        self.url = reverse("currency-twrr-batch")
+        self.start_date = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+        self.range_dates = get_date_range(
+            self.start_date, datetime.now().strftime("%Y-%m-%d")
+        )
+
+    def test_missing_parameters(self):
+        """Test case for missing required parameters in the request."""
+        response = self.client.post(self.url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Missing required parameters", response.data["error"])
+
+        response = self.client.post(
+            self.url,
+            {
+                "start_date": self.start_date,
+                "investments": [{"source_currency": "USD", "amount": 1}],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_body_must_be_an_object(self):
+        """Test case for a JSON body that is not an object."""
+        response = self.client.post(
+            self.url,
+            [{"source_currency": "USD", "exchanged_currency": "EUR", "amount": 1}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("must be a JSON object", response.data["error"])
+
+    def test_invalid_investments(self):
+        """Test case for unsupported currencies, amounts and periods in the request."""
+        invalid_requests = [
+            ({"source_currency": "USD", "exchanged_currency": "XYZ"}, {}, "supported"),
+            ({"amount": -5}, {}, "Amount must be greater than zero"),
+            ({"amount": "abc"}, {}, "Invalid amount format"),
+            ({}, {"window": 0}, "window must be a positive number of days"),
+            ({}, {"end_date": "2000-01-01"}, "end_date must not be before"),
+        ]
+
+        for investment, parameters, error in invalid_requests:
+            response = self.client.post(
+                self.url,
+                {
+                    "start_date": self.start_date,
+                    "investments": [
+                        {
+                            "source_currency": "USD",
+                            "exchanged_currency": "EUR",
+                            "amount": 100,
+                            **investment,
+                        }
+                    ],
+                    **parameters,
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(error, response.data["error"])
+
+    def test_stored_series_are_read_with_one_query(self):
+        """Test case for the series of many pairs and amounts from stored rates."""
+        for index, valuation_date in enumerate(self.range_dates):
+            add_exchange_rate(
+                self.usd,
+                self.eur,
+                self.provider,
+                rate_value=Decimal("0.9") + Decimal(index) / 100,
+                valuation_date=valuation_date,
+            )
+            add_exchange_rate(
+                self.eur,
+                self.gbp,
+                self.provider,
+                rate_value=Decimal("0.8") - Decimal(index) / 100,
+                valuation_date=valuation_date,
+            )
+
+        investments = [
+            {"source_currency": "USD", "exchanged_currency": "EUR", "amount": 100},
+            {"source_currency": "EUR", "exchanged_currency": "GBP", "amount": 250},
+            {"source_currency": "USD", "exchanged_currency": "EUR", "amount": 1000},
+        ]
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.url,
+                {"start_date": self.start_date, "investments": investments},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["investments"]
+        self.assertEqual(len(results), 3)
+
+        for investment, result in zip(investments, results):
+            single_response = self.client.get(
+                reverse("currency-twrr"),
+                {**investment, "start_date": self.start_date},
+            )
+            self.assertEqual(
+                result["exchanged_currency"], investment["exchanged_currency"]
+            )
+            self.assertEqual(result["amount_invested"], investment["amount"])
+            self.assertEqual(result["twrr_series"], single_response.data["twrr_series"])
+
+    def test_missing_rates_are_fetched_once_per_source(self):
+        """Test case for one grouped provider fetch per source currency."""
+        with patch(
+            "MyCurrencyApp.helper.get_twrr_series._fetch_and_save_source_rates",
+            wraps=_fetch_and_save_from_providers,
+        ) as mock_fetch:
+            response = self.client.post(
+                self.url,
+                {
+                    "start_date": self.start_date,
+                    "investments": [
+                        {
+                            "source_currency": "USD",
+                            "exchanged_currency": "EUR",
+                            "amount": 100,
+                        },
+                        {
+                            "source_currency": "USD",
+                            "exchanged_currency": "GBP",
+                            "amount": 100,
+                        },
+                    ],
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_fetch.assert_called_once_with("USD", self.range_dates)
+        for result in response.data["investments"]:
+            self.assertEqual(len(result["twrr_series"]), len(self.range_dates))
+        self.assertTrue(
+            CurrencyExchangeRate.objects.filter(
+                source_currency=self.usd, target_currency=self.gbp
+            ).exists()
+        )
+
+    def test_investment_without_rates(self):
+        """Test case for an investment whose pair has no rate in the period."""
+        with patch(
+            "MyCurrencyApp.helper.get_twrr_series._fetch_and_save_source_rates",
+            return_value={},
+        ):
+            response = self.client.post(
+                self.url,
+                {
+                    "start_date": self.start_date,
+                    "investments": [
+                        {
+                            "source_currency": "USD",
+                            "exchanged_currency": "EUR",
+                            "amount": 100,
+                        }
+                    ],
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.data["investments"][0]
+        self.assertEqual(result["twrr_series"], [])
+        self.assertIn("No historical exchange rates available", result["error"])
@@ -0,0 +1,192 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from MyCurrencyApp.cache.currency_ids import currency_ids
+from MyCurrencyApp.helper.get_currency_rates import _fetch_and_save_from_providers
+from MyCurrencyApp.models import CurrencyProvider
+from MyCurrencyApp.tests.confest import add_exchange_rate, create_source_currency
+from MyCurrencyApp.utils import get_date_range
+
+
+class PortfolioValuationViewTests(APITestCase):
+    def setUp(self):
+        self.provider = CurrencyProvider.objects.create(
+            name="Mock", url="http://mock.url", active=True, priority=0
+        )
+        self.usd = create_source_currency("USD", "US Dollar")
+        self.eur = create_source_currency("EUR", "Euro")
+        self.gbp = create_source_currency("GBP", "British Pound")
+        self.chf = create_source_currency("CHF", "Swiss Franc")
+        self.url = reverse("portfolio-valuation")
+        self.start_date = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
+        self.range_dates = get_date_range(
+            self.start_date, datetime.now().strftime("%Y-%m-%d")
+        )
+        self.holdings = [
+            {"currency": "USD", "amount": 1000},
+            {"currency": "GBP", "amount": 500},
+            {"currency": "EUR", "amount": 100},
+        ]
+
+    def _add_rates(self, source_currency, target_currency, first_rate, step):
+        for index, valuation_date in enumerate(self.range_dates):
+            add_exchange_rate(
+                source_currency,
+                target_currency,
+                self.provider,
+                rate_value=Decimal(first_rate) + Decimal(step) * index,
+                valuation_date=valuation_date,
+            )
+
+    def test_missing_parameters(self):
+        """Test case for missing required parameters in the request."""
+        response = self.client.post(self.url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("Missing required parameters", response.data["error"])
+
+        response = self.client.post(
+            self.url,
+            {
+                "reporting_currency": "EUR",
+                "start_date": self.start_date,
+                "holdings": [{"amount": 1}],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_body_must_be_an_object(self):
+        """Test case for a JSON body that is not an object."""
+        response = self.client.post(
+            self.url, [{"currency": "USD", "amount": 1}], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("must be a JSON object", response.data["error"])
+
+    def test_invalid_holdings(self):
+        """Test case for unsupported currencies, amounts and dates in the request."""
+        invalid_requests = [
+            ({"reporting_currency": "XYZ"}, "Currencies not supported"),
+            ({"holdings": [{"currency": "XYZ", "amount": 1}]}, "supported"),
+            ({"holdings": [{"currency": "USD", "amount": "abc"}]}, "Invalid amount"),
+            ({"holdings": [{"currency": "USD", "amount": 0}]}, "greater than zero"),
+            ({"start_date": "01/01/2024"}, "Invalid date format"),
+        ]
+
+        for parameters, error in invalid_requests:
+            response = self.client.post(
+                self.url,
+                {
+                    "reporting_currency": "EUR",
+                    "start_date": self.start_date,
+                    "holdings": self.holdings,
+                    **parameters,
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(error, response.data["error"])
+
+    def test_stored_rates_are_read_with_one_query(self):
+        """Test case for the daily value and TWRR of a portfolio from stored rates."""
+        self._add_rates(self.usd, self.eur, "0.9", "0.01")
+        self._add_rates(self.gbp, self.eur, "1.2", "-0.02")
+
+        # The currency id map is loaded once per process
+        currency_ids.get_codes()
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.url,
+                {
+                    "reporting_currency": "EUR",
+                    "start_date": self.start_date,
+                    "holdings": self.holdings + [{"currency": "USD", "amount": 500}],
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["holdings"], {"USD": 1500, "GBP": 500, "EUR": 100}
+        )
+        self.assertEqual(response.data["missing_dates"], [])
+
+        valuation_series = response.data["valuation_series"]
+        self.assertEqual(
+            [point["valuation_date"] for point in valuation_series], self.range_dates
+        )
+        values = [
+            1500 * (0.9 + 0.01 * index) + 500 * (1.2 - 0.02 * index) + 100
+            for index in range(len(self.range_dates))
+        ]
+        for point, value in zip(valuation_series, values):
+            self.assertAlmostEqual(point["value"], value, places=6)
+        self.assertAlmostEqual(valuation_series[1]["twrr"], values[1] / values[0] - 1)
+        self.assertAlmostEqual(response.data["twrr"], values[-1] / values[0] - 1)
+        self.assertEqual(response.data["twrr"], valuation_series[-1]["cumulative_twrr"])
+
+    def test_value_in_a_cross_currency(self):
+        """Test case for values derived from the base currency rates."""
+        self._add_rates(self.eur, self.usd, "1.1", "0")
+        self._add_rates(self.eur, self.chf, "0.95", "0")
+
+        response = self.client.post(
+            self.url,
+            {
+                "reporting_currency": "CHF",
+                "start_date": self.start_date,
+                "holdings": [{"currency": "USD", "amount": 1100}],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for point in response.data["valuation_series"]:
+            self.assertAlmostEqual(point["value"], 950, places=6)
+            self.assertEqual(point["cumulative_twrr"], 0)
+
+    def test_missing_rates_are_fetched_for_the_reporting_currency(self):
+        """Test case for one grouped provider fetch of the missing dates."""
+        self._add_rates(self.usd, self.eur, "0.9", "0")
+
+        with patch(
+            "MyCurrencyApp.helper.portfolio_valuation._fetch_and_save_source_rates",
+            wraps=_fetch_and_save_from_providers,
+        ) as mock_fetch:
+            response = self.client.post(
+                self.url,
+                {
+                    "reporting_currency": "EUR",
+                    "start_date": self.start_date,
+                    "holdings": self.holdings,
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_fetch.assert_called_once_with("EUR", self.range_dates)
+        self.assertEqual(len(response.data["valuation_series"]), len(self.range_dates))
+        self.assertEqual(response.data["missing_dates"], [])
+
+    def test_no_rates_available(self):
+        """Test case for a portfolio without any rate in the period."""
+        with patch(
+            "MyCurrencyApp.helper.portfolio_valuation._fetch_and_save_source_rates",
+            return_value={},
+        ):
+            response = self.client.post(
+                self.url,
+                {
+                    "reporting_currency": "EUR",
+                    "start_date": self.start_date,
+                    "holdings": self.holdings,
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,8 +1,13 @@
 from django.urls import path
 
+from .views.currency_batch_converter_view import CurrencyBatchConverterView
 from .views.currency_converter_view import CurrencyConverterView
 from .views.currency_rates_list_view import CurrencyRatesListView
+from .views.currency_twrr_batch_view import CurrencyTWRRBatchView
 from .views.currency_twrr_view import CurrencyTWRRView
+from .views.metrics_view import MetricsView
+from .views.portfolio_valuation_view import PortfolioValuationView
+from .views.provider_status_view import ProviderStatusView
 
 urlpatterns = [
     path("currency-rates/", CurrencyRatesListView.as_view(), name="currency-rates"),
@@ -11,5 +16,22 @@ urlpatterns = [
         CurrencyConverterView.as_view(),
         name="currency-converter",
     ),
+    path(
+        "currency-converter/batch/",
+        CurrencyBatchConverterView.as_view(),
+        name="currency-converter-batch",
+    ),
     path("currency-twrr/", CurrencyTWRRView.as_view(), name="currency-twrr"),
+    path(
+        "currency-twrr/batch/",
+        CurrencyTWRRBatchView.as_view(),
+        name="currency-twrr-batch",
+    ),
+    path(
+        "portfolio-valuation/",
+        PortfolioValuationView.as_view(),
+        name="portfolio-valuation",
+    ),
+    path("provider-status/", ProviderStatusView.as_view(), name="provider-status"),
+    path("metrics", MetricsView.as_view(), name="metrics"),
 ]
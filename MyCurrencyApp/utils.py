@@ -1,6 +1,11 @@
 import logging
-from datetime import datetime, timedelta
-from .models import CurrencyExchangeRate
+from datetime import date, datetime, timedelta
+from django.db import transaction
+from django.utils.timezone import now
+from .cache.rate_cache import invalidate_pair
+from .models import CurrencyExchangeRate, LatestExchangeRate
+from .monitoring.metrics import exchange_rate_rows_written
+from .monitoring.request_metrics import measure
 from .providers.fixer_provider import FixerProvider
 from .providers.mock_provider import MockProvider
 
@@ -44,6 +49,43 @@ def get_date_range(date_from, date_to):
     ]
 
 
+def get_date_spans(valuation_dates, max_days):
+    """
+    Groups dates into runs of consecutive days, each at most ``max_days`` long.
+
+    Args:
+        valuation_dates (list): Date strings in 'YYYY-MM-DD' format.
+        max_days (int): Maximum number of days of a run.
+
+    Returns:
+        list: (start_date, end_date) tuples of date strings, both inclusive.
+    """
+    date_format = "%Y-%m-%d"
+    spans = []
+    start_date = previous_date = None
+
+    for valuation_date in sorted(
+        datetime.strptime(value, date_format) for value in set(valuation_dates)
+    ):
+        if (
+            start_date is None
+            or valuation_date - previous_date != timedelta(days=1)
+            or (valuation_date - start_date).days >= max_days
+        ):
+            if start_date is not None:
+                spans.append((start_date, previous_date))
+            start_date = valuation_date
+        previous_date = valuation_date
+
+    if start_date is not None:
+        spans.append((start_date, previous_date))
+
+    return [
+        (start_date.strftime(date_format), end_date.strftime(date_format))
+        for start_date, end_date in spans
+    ]
+
+
 def get_provider_instance(provider, url):
     """
     Factory method to instantiate the appropriate provider class.
@@ -74,7 +116,7 @@ def update_exchange_rate_activity(
     source_currency, target_currency, rate_value, valuation_date, provider
 ):
     """
-    Update the activity status of exchange rates and create a new exchange rate entry.
+    Saves a single exchange rate through bulk_update_exchange_rates.
 
     Args:
         source_currency (Currency): The source currency object.
@@ -86,24 +128,168 @@ def update_exchange_rate_activity(
     Returns:
         CurrencyExchangeRate: The newly created or updated exchange rate entry.
     """
-    CurrencyExchangeRate.objects.filter(
-        source_currency__code=source_currency.code,
-        target_currency__code=target_currency.code,
-        valuation_date__lt=valuation_date,
-    ).update(active=False)
+    return bulk_update_exchange_rates(
+        [(source_currency, target_currency, valuation_date, rate_value, provider)]
+    )[0]
 
-    new_rate, _ = CurrencyExchangeRate.objects.update_or_create(
-        source_currency=source_currency,
-        target_currency=target_currency,
-        valuation_date=valuation_date,
+
+def bulk_update_exchange_rates(rows):
+    """
+    Saves a batch of exchange rates with a constant number of statements: one upsert
+    on (source, target, valuation date, provider) into the history, and one read and
+    one upsert of the LatestExchangeRate rows the batch makes more recent. Cached
+    rates of every saved pair are invalidated once.
+
+    Args:
+        rows (iterable): (source_currency, target_currency, valuation_date, rate_value,
+            provider) tuples. Currencies and provider are model instances, dates are
+            date, datetime or "YYYY-MM-DD" values. Later rows of the same pair, date and
+            provider win.
+
+    Returns:
+        list: The saved CurrencyExchangeRate entries.
+    """
+    exchange_rates = {}
+    for source_currency, target_currency, valuation_date, rate_value, provider in rows:
+        valuation_date = to_date(valuation_date)
+        exchange_rates[
+            (source_currency.id, target_currency.id, valuation_date, provider.id)
+        ] = CurrencyExchangeRate(
+            source_currency=source_currency,
+            target_currency=target_currency,
+            valuation_date=valuation_date,
+            rate_value=rate_value,
+            provider=provider,
+            active=True,
+        )
+
+    if not exchange_rates:
+        return []
+
+    with measure("rate-save"), transaction.atomic():
+        saved_rates = CurrencyExchangeRate.objects.bulk_create(
+            exchange_rates.values(),
+            update_conflicts=True,
+            unique_fields=[
+                "source_currency",
+                "target_currency",
+                "valuation_date",
+                "provider",
+            ],
+            update_fields=["rate_value", "active", "updated_at"],
+        )
+        update_latest_exchange_rates(saved_rates)
+    exchange_rate_rows_written.inc(len(saved_rates))
+
+    currency_codes = {}
+    for exchange_rate in saved_rates:
+        currency_codes[
+            (exchange_rate.source_currency_id, exchange_rate.target_currency_id)
+        ] = (exchange_rate.source_currency.code, exchange_rate.target_currency.code)
+    for source_currency_code, target_currency_code in currency_codes.values():
+        invalidate_pair(source_currency_code, target_currency_code)
+
+    return saved_rates
+
+
+def update_latest_exchange_rates(exchange_rates):
+    """
+    Moves the LatestExchangeRate rows of the given exchange rates forward. Rates older
+    than the stored latest rate of their pair and provider are ignored.
+
+    Args:
+        exchange_rates (iterable): Saved CurrencyExchangeRate entries.
+    """
+    latest_rates = {}
+    for exchange_rate in exchange_rates:
+        key = LatestExchangeRate.make_key(
+            exchange_rate.source_currency.code,
+            exchange_rate.target_currency.code,
+            exchange_rate.provider_id,
+        )
+        valuation_date = to_date(exchange_rate.valuation_date)
+        latest_rate = latest_rates.get(key)
+        if latest_rate and latest_rate.valuation_date > valuation_date:
+            continue
+
+        latest_rates[key] = LatestExchangeRate(
+            key=key,
+            source_currency_id=exchange_rate.source_currency_id,
+            target_currency_id=exchange_rate.target_currency_id,
+            provider_id=exchange_rate.provider_id,
+            valuation_date=valuation_date,
+            rate_value=exchange_rate.rate_value,
+        )
+
+    with transaction.atomic():
+        # Insert the missing rows first so every row of the batch exists and can be
+        # locked; concurrent writers then compare dates one after the other instead
+        # of replacing a newer latest rate with an older one.
+        LatestExchangeRate.objects.bulk_create(
+            list(latest_rates.values()), ignore_conflicts=True
+        )
+        stored_rates = LatestExchangeRate.objects.select_for_update().in_bulk(
+            list(latest_rates)
+        )
+        updated_at = now()
+        updated_rates = []
+        for key, stored_rate in stored_rates.items():
+            latest_rate = latest_rates[key]
+            if stored_rate.valuation_date > latest_rate.valuation_date:
+                continue
+            stored_rate.valuation_date = latest_rate.valuation_date
+            stored_rate.rate_value = latest_rate.rate_value
+            stored_rate.updated_at = updated_at
+            updated_rates.append(stored_rate)
+
+        LatestExchangeRate.objects.bulk_update(
+            updated_rates, ["valuation_date", "rate_value", "updated_at"]
+        )
+
+
+def refresh_latest_exchange_rate(source_currency, target_currency, provider_id):
+    """
+    Recomputes the LatestExchangeRate row of a currency pair and provider from the
+    history, e.g. after its latest rate was deleted.
+    """
+    key = LatestExchangeRate.make_key(
+        source_currency.code, target_currency.code, provider_id
+    )
+    exchange_rate = (
+        CurrencyExchangeRate.objects.filter(
+            source_currency=source_currency,
+            target_currency=target_currency,
+            provider_id=provider_id,
+        )
+        .order_by("-valuation_date")
+        .first()
+    )
+
+    if exchange_rate is None:
+        LatestExchangeRate.objects.filter(key=key).delete()
+        return
+
+    LatestExchangeRate.objects.update_or_create(
+        key=key,
         defaults={
-            "rate_value": rate_value,
-            "provider": provider,
-            "active": True,
+            "source_currency": source_currency,
+            "target_currency": target_currency,
+            "provider_id": provider_id,
+            "valuation_date": exchange_rate.valuation_date,
+            "rate_value": exchange_rate.rate_value,
         },
-        updated_at=datetime.utcnow()
     )
-    return new_rate
+
+
+def to_date(value):
+    """
+    Converts a date, datetime or 'YYYY-MM-DD' string to a date.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
 
 
 def format_data_for_chart(data):
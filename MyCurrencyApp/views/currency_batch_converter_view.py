@@ -0,0 +1,118 @@
+import logging
+from decimal import Decimal, InvalidOperation
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from ..enums.available_currencies import AvailableCurrencies
+
+from ..helper.get_batch_exchange_rates import convert_amounts
+
+
+class CurrencyBatchConverterView(APIView):
+    """
+    API endpoint to convert amounts between many currency pairs at once, based on the
+    latest exchange rates. All rates are resolved with a single database query and at
+    most one provider call per source currency.
+
+    GET converts one amount from a source currency into several target currencies:
+    - source_currency (str): The currency you are converting from.
+    - target_currencies (str): Comma-separated currencies you are converting to.
+    - amount (float): The amount to convert.
+
+    POST converts a list of conversions sent as JSON:
+    {"conversions": [{"source_currency": "USD", "target_currency": "EUR", "amount": 100}]}
+    """
+
+    def get(self, request):
+        source_currency_code = request.query_params.get("source_currency")
+        target_currency_codes = request.query_params.get("target_currencies")
+        amount = request.query_params.get("amount")
+
+        if not all([source_currency_code, target_currency_codes, amount]):
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return self._convert(
+            [
+                (source_currency_code, target_currency_code.strip(), amount)
+                for target_currency_code in target_currency_codes.split(",")
+            ]
+        )
+
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            return Response(
+                {"error": "Request body must be a JSON object"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        conversions = request.data.get("conversions")
+
+        if not conversions or not isinstance(conversions, list):
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            conversions = [
+                (
+                    conversion["source_currency"],
+                    conversion["target_currency"],
+                    str(conversion["amount"]),
+                )
+                for conversion in conversions
+            ]
+        except (KeyError, TypeError):
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return self._convert(conversions)
+
+    @staticmethod
+    def _convert(conversions):
+        for source_currency_code, target_currency_code, amount in conversions:
+            if (
+                source_currency_code not in AvailableCurrencies.CURRENCIES
+                or target_currency_code not in AvailableCurrencies.CURRENCIES
+            ):
+                return Response(
+                    {"error": "Currencies not supported"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            try:
+                if Decimal(amount) <= 0:
+                    return Response(
+                        {"error": "Amount must be greater than zero."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            except InvalidOperation:
+                return Response(
+                    {"error": "Invalid amount format"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        try:
+            results = convert_amounts(
+                [
+                    (source_currency_code, target_currency_code, Decimal(amount))
+                    for source_currency_code, target_currency_code, amount in conversions
+                ]
+            )
+
+            for result in results:
+                if result["exchange_rate"] is None:
+                    result["error"] = "Exchange rate not available"
+
+            return Response({"conversions": results}, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logging.error(e)
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,126 @@
+from datetime import datetime
+import logging
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from ..enums.available_currencies import AvailableCurrencies
+from ..helper.get_twrr_series import calculate_twrr_batch
+from .currency_twrr_view import parse_twrr_period
+
+
+class CurrencyTWRRBatchView(APIView):
+    """
+    API endpoint to calculate the TWRR series of many investments over a shared period
+    at once. The rates of every pair are loaded with a single query, and missing dates
+    are fetched with at most one provider call per source currency.
+
+    POST body:
+    {"start_date": "2024-01-01", "end_date": "2024-06-30", "window": 30,
+     "investments": [{"source_currency": "USD", "exchanged_currency": "EUR", "amount": 100}]}
+
+    end_date (today by default) and window are optional, as in CurrencyTWRRView.
+    """
+
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            return Response(
+                {"error": "Request body must be a JSON object"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        data = request.data
+        investments = data.get("investments")
+        start_date = data.get("start_date")
+
+        if not investments or not isinstance(investments, list) or not start_date:
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            investments = [
+                (
+                    investment["source_currency"],
+                    investment["exchanged_currency"],
+                    investment["amount"],
+                )
+                for investment in investments
+            ]
+        except (KeyError, TypeError):
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        end_date = data.get("end_date")
+        window, error = parse_twrr_period(start_date, end_date, data.get("window"))
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        end_date = end_date or datetime.today().strftime("%Y-%m-%d")
+
+        for source_currency_code, exchanged_currency_code, amount in investments:
+            if (
+                source_currency_code not in AvailableCurrencies.CURRENCIES
+                or exchanged_currency_code not in AvailableCurrencies.CURRENCIES
+            ):
+                return Response(
+                    {"error": "Currencies not supported"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            try:
+                if float(amount) <= 0:
+                    return Response(
+                        {"error": "Amount must be greater than zero."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "Invalid amount format"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        investments = [
+            (source_currency_code, exchanged_currency_code, float(amount))
+            for source_currency_code, exchanged_currency_code, amount in investments
+        ]
+
+        try:
+            twrr_series_list = calculate_twrr_batch(
+                investments, start_date, end_date, window
+            )
+
+            results = []
+            for (
+                source_currency_code,
+                exchanged_currency_code,
+                amount,
+            ), twrr_series in zip(investments, twrr_series_list):
+                result = {
+                    "source_currency": source_currency_code,
+                    "exchanged_currency": exchanged_currency_code,
+                    "amount_invested": amount,
+                    "twrr_series": twrr_series or [],
+                }
+                if not twrr_series:
+                    result["error"] = (
+                        "No historical exchange rates available for the given parameters"
+                    )
+                results.append(result)
+
+            response_data = {"start_date": start_date, "end_date": end_date}
+            if window:
+                response_data["window"] = window
+            response_data["investments"] = results
+
+            return Response(response_data, status=status.HTTP_200_OK)
+
+        except Exception as e:
+            logging.error(f"Error calculating TWRR batch: {e}")
+            return Response(
+                {"error": "An error occurred while calculating TWRR"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
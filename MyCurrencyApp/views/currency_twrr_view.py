@@ -1,3 +1,4 @@
+from datetime import date, datetime
 import logging
 
 from rest_framework.views import APIView
@@ -5,21 +6,64 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from ..enums.available_currencies import AvailableCurrencies
-from ..helper.get_twrr_series import calculate_twrr
+from ..helper.get_twrr_series import calculate_twrr, calculate_twrr_summary
+
+
+def parse_twrr_period(start_date, end_date, window):
+    """
+    Validates the period parameters of a TWRR request.
+
+    Args:
+        start_date (str): The start date in "YYYY-MM-DD" format.
+        end_date (str): The end date in "YYYY-MM-DD" format, or None for today.
+            Neither date may be after today.
+        window (str): The rolling window in days, or None.
+
+    Returns:
+        tuple: (window as int or None, error message or None).
+    """
+    try:
+        first_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+        last_date = (
+            datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else date.today()
+        )
+    except (TypeError, ValueError):
+        return None, "Invalid date format, expected YYYY-MM-DD"
+
+    # Rates of future dates do not exist and must not be requested from providers
+    if max(first_date, last_date) > date.today():
+        return None, "Dates must not be in the future"
+    if last_date < first_date:
+        return None, "end_date must not be before start_date"
+
+    if window is None:
+        return None, None
+    try:
+        window = int(window)
+    except (TypeError, ValueError):
+        window = 0
+    if window <= 0:
+        return None, "window must be a positive number of days"
+    return window, None
 
 
 class CurrencyTWRRView(APIView):
     """
     API endpoint to calculate Time-Weighted Rate of Return (TWRR) for any given amount
-    invested from a source currency into an exchanged currency from a start date until today.
+    invested from a source currency into an exchanged currency from a start date until an
+    end date, today by default.
 
     Parameters:
     - source_currency (str): The currency you are converting from.
     - amount (float): The amount invested in the source currency.
     - exchanged_currency (str): The currency you are converting to.
     - start_date (str): The start date of the investment in format YYYY-MM-DD.
+    - end_date (str, optional): The end date of the investment in format YYYY-MM-DD.
+    - window (int, optional): Adds the trailing TWRR of this many days to every date.
+    - summary (bool, optional): Return only the TWRR of the whole period.
 
-    Expected response: A time series list of TWRR values for each available historical exchange rate.
+    Expected response: A time series list of TWRR values for each available historical exchange rate,
+    or the TWRR of the period with ``summary=true``.
     """
 
     def get(self, request):
@@ -27,6 +71,9 @@ class CurrencyTWRRView(APIView):
         exchanged_currency_code = request.query_params.get("exchanged_currency")
         amount = request.query_params.get("amount")
         start_date = request.query_params.get("start_date")
+        end_date = request.query_params.get("end_date")
+        window = request.query_params.get("window")
+        summary = request.query_params.get("summary", "").lower() in ("1", "true")
 
         if not all([source_currency_code, exchanged_currency_code, amount, start_date]):
             return Response(
@@ -55,10 +102,53 @@ class CurrencyTWRRView(APIView):
                 {"error": "Invalid amount format"}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        if window is not None and summary:
+            return Response(
+                {"error": "window cannot be combined with summary"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        window, error = parse_twrr_period(start_date, end_date, window)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
         try:
+            if summary:
+                twrr_summary = calculate_twrr_summary(
+                    source_currency_code,
+                    exchanged_currency_code,
+                    amount,
+                    start_date,
+                    end_date,
+                )
+                if not twrr_summary:
+                    return Response(
+                        {
+                            "error": "No historical exchange rates available for the given parameters"
+                        },
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+
+                return Response(
+                    {
+                        "source_currency": source_currency_code,
+                        "exchanged_currency": exchanged_currency_code,
+                        "amount_invested": amount,
+                        "start_date": start_date,
+                        "end_date": twrr_summary["end_date"],
+                        "twrr_summary": twrr_summary,
+                    },
+                    status=status.HTTP_200_OK,
+                )
+
             # Retrieve historical rates and calculate TWRR
             twrr_series = calculate_twrr(
-                source_currency_code, exchanged_currency_code, amount, start_date
+                source_currency_code,
+                exchanged_currency_code,
+                amount,
+                start_date,
+                end_date,
+                window,
             )
 
             if not twrr_series:
@@ -69,16 +159,18 @@ class CurrencyTWRRView(APIView):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            return Response(
-                {
-                    "source_currency": source_currency_code,
-                    "exchanged_currency": exchanged_currency_code,
-                    "amount_invested": amount,
-                    "start_date": start_date,
-                    "twrr_series": twrr_series,
-                },
-                status=status.HTTP_200_OK,
-            )
+            response_data = {
+                "source_currency": source_currency_code,
+                "exchanged_currency": exchanged_currency_code,
+                "amount_invested": amount,
+                "start_date": start_date,
+                "end_date": twrr_series[-1]["valuation_date"],
+            }
+            if window:
+                response_data["window"] = window
+            response_data["twrr_series"] = twrr_series
+
+            return Response(response_data, status=status.HTTP_200_OK)
 
         except Exception as e:
             logging.error(f"Error calculating TWRR: {e}")
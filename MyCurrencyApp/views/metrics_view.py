@@ -0,0 +1,17 @@
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from ..monitoring.metrics import REGISTRY, render_metrics
+
+
+class MetricsView(APIView):
+    """
+    API endpoint exposing the operational metrics of this worker in the Prometheus
+    text exposition format. Metrics are kept in memory, so scrapes never touch the
+    database.
+    """
+
+    def get(self, request):
+        return HttpResponse(
+            render_metrics(REGISTRY), content_type="text/plain; version=0.0.4"
+        )
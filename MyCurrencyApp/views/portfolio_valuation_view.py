@@ -0,0 +1,118 @@
+from datetime import datetime
+import logging
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from ..enums.available_currencies import AvailableCurrencies
+from ..helper.portfolio_valuation import value_portfolio
+from .currency_twrr_view import parse_twrr_period
+
+
+class PortfolioValuationView(APIView):
+    """
+    API endpoint to value a portfolio of currency holdings in a reporting currency on
+    every date of a period, with the TWRR of the portfolio.
+
+    POST body:
+    {"reporting_currency": "EUR", "start_date": "2024-01-01", "end_date": "2024-06-30",
+     "holdings": [{"currency": "USD", "amount": 1000}, {"currency": "GBP", "amount": 500}]}
+
+    end_date is optional and defaults to today. Holdings of the same currency are added up.
+    """
+
+    def post(self, request):
+        if not isinstance(request.data, dict):
+            return Response(
+                {"error": "Request body must be a JSON object"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        data = request.data
+        reporting_currency_code = data.get("reporting_currency")
+        holdings = data.get("holdings")
+        start_date = data.get("start_date")
+
+        if not all([reporting_currency_code, holdings, start_date]) or not isinstance(
+            holdings, list
+        ):
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            holdings = [
+                (holding["currency"], holding["amount"]) for holding in holdings
+            ]
+        except (KeyError, TypeError):
+            return Response(
+                {"error": "Missing required parameters"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        end_date = data.get("end_date")
+        _, error = parse_twrr_period(start_date, end_date, None)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        end_date = end_date or datetime.today().strftime("%Y-%m-%d")
+
+        amounts = {}
+        for currency_code, amount in holdings:
+            if (
+                currency_code not in AvailableCurrencies.CURRENCIES
+                or reporting_currency_code not in AvailableCurrencies.CURRENCIES
+            ):
+                return Response(
+                    {"error": "Currencies not supported"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            try:
+                amount = float(amount)
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": "Invalid amount format"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if amount <= 0:
+                return Response(
+                    {"error": "Amount must be greater than zero."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            amounts[currency_code] = amounts.get(currency_code, 0) + amount
+
+        try:
+            valuation = value_portfolio(
+                amounts, reporting_currency_code, start_date, end_date
+            )
+            valuation_series = valuation["valuation_series"]
+
+            if not valuation_series:
+                return Response(
+                    {
+                        "error": "No historical exchange rates available for the given parameters"
+                    },
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            return Response(
+                {
+                    "reporting_currency": reporting_currency_code,
+                    "holdings": amounts,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "twrr": valuation_series[-1]["cumulative_twrr"],
+                    "valuation_series": valuation_series,
+                    "missing_dates": valuation["missing_dates"],
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        except Exception as e:
+            logging.error(f"Error valuing portfolio: {e}")
+            return Response(
+                {"error": "An error occurred while valuing the portfolio"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -0,0 +1,21 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from ..providers.circuit_breaker import failed_lookups, get_circuit_breaker_states
+
+
+class ProviderStatusView(APIView):
+    """
+    API endpoint exposing the circuit breaker state of every provider called by this
+    worker, and the number of recently failed lookups being skipped.
+    """
+
+    def get(self, request):
+        return Response(
+            {
+                "providers": get_circuit_breaker_states(),
+                "failed_lookups": len(failed_lookups),
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,123 @@
+"""
+Local stand-in for the Fixer API, used by the benchmarks.
+
+Serves the ``latest``, ``timeseries`` and ``YYYY-MM-DD`` endpoints over HTTP/1.1 so
+clients can keep connections alive, and counts the TCP connections it accepts.
+An optional per-connection delay simulates the TCP/TLS handshake of a remote API.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+CURRENCIES = ["EUR", "USD", "CHF", "GBP", "JPY", "CAD", "AUD", "SEK", "NOK", "DKK"]
+
+
+def _rates(base, valuation_date, symbols=None):
+    rng = random.Random(f"{base}:{valuation_date}")
+    rates = {code: round(rng.uniform(0.5, 2.0), 6) for code in CURRENCIES}
+    rates[base] = 1.0
+    if symbols:
+        rates = {code: rates[code] for code in symbols if code in rates}
+    return rates
+
+
+class FakeFixerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        base = params.get("base", "EUR")
+        symbols = params["symbols"].split(",") if params.get("symbols") else None
+        endpoint = url.path.rstrip("/").rsplit("/", 1)[-1]
+
+        if endpoint == "timeseries":
+            start_date = date.fromisoformat(params["start_date"])
+            end_date = date.fromisoformat(params["end_date"])
+            days = (end_date - start_date).days + 1
+            body = {
+                "success": True,
+                "timeseries": True,
+                "base": base,
+                "start_date": params["start_date"],
+                "end_date": params["end_date"],
+                "rates": {
+                    str(start_date + timedelta(days=i)): _rates(
+                        base, start_date + timedelta(days=i), symbols
+                    )
+                    for i in range(days)
+                },
+            }
+        elif endpoint == "latest" or re.fullmatch(r"\d{4}-\d{2}-\d{2}", endpoint):
+            valuation_date = date.today() if endpoint == "latest" else endpoint
+            body = {
+                "success": True,
+                "base": base,
+                "date": str(valuation_date),
+                "rates": _rates(base, valuation_date, symbols),
+            }
+        else:
+            body = {"success": False, "error": {"code": 404, "type": "not_found"}}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeFixerServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, handshake_delay=0.0):
+        super().__init__((host, port), FakeFixerHandler)
+        self.handshake_delay = handshake_delay
+        self.connections = 0
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._connections_lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def finish_request(self, request, client_address):
+        if self.handshake_delay:
+            time.sleep(self.handshake_delay)
+        super().finish_request(request, client_address)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Runs a local stand-in Fixer API.")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--handshake-delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeFixerServer(port=args.port, handshake_delay=args.handshake_delay)
+    print(f"Fake Fixer API listening on {server.url}")
+    server.serve_forever()
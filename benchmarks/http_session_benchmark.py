@@ -0,0 +1,88 @@
+"""
+Measures what the pooled provider session saves per fetched date.
+
+Fetches the same dates through FixerProvider against the local stand-in Fixer API,
+first opening a connection per request (plain ``requests.get``, as providers did
+before) and then through the process-wide keep-alive session.
+
+Usage:
+    python -m benchmarks.http_session_benchmark --dates 200 --handshake-delay 0.02
+"""
+
+import argparse
+import os
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "MyCurrency.settings")
+django.setup()
+
+import requests  # noqa: E402
+
+from MyCurrencyApp.providers.fixer_provider import FixerProvider  # noqa: E402
+from MyCurrencyApp.providers.http_session import build_http_session  # noqa: E402
+
+from .fake_fixer import FakeFixerServer  # noqa: E402
+
+
+def run(server, session, valuation_dates):
+    provider = FixerProvider(
+        SimpleNamespace(name="Fixer", api_key="benchmark", default_base_currency="EUR"),
+        server.url,
+    )
+    provider.session = session
+
+    connections = server.connections
+    started = time.perf_counter()
+    for valuation_date in valuation_dates:
+        provider.set_url(server.url, str(valuation_date))
+        if provider.get_exchange_rate_data("EUR", "", str(valuation_date)) is None:
+            raise RuntimeError(f"Fetch of {valuation_date} failed")
+    elapsed = time.perf_counter() - started
+
+    return {
+        "seconds": elapsed,
+        "ms_per_date": elapsed * 1000 / len(valuation_dates),
+        "connections": server.connections - connections,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dates", type=int, default=100)
+    parser.add_argument(
+        "--handshake-delay",
+        type=float,
+        default=0.01,
+        help="Seconds the server waits on every new connection, like a TLS handshake.",
+    )
+    args = parser.parse_args()
+
+    valuation_dates = [
+        date.today() - timedelta(days=i) for i in range(args.dates, 0, -1)
+    ]
+
+    with FakeFixerServer(handshake_delay=args.handshake_delay) as server:
+        results = {
+            "connection per request": run(server, requests, valuation_dates),
+            "pooled session": run(server, build_http_session(), valuation_dates),
+        }
+
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['seconds']:8.3f}s  {result['ms_per_date']:7.2f} ms/date"
+            f"  {result['connections']:5d} connections"
+        )
+
+    baseline, pooled = results.values()
+    print(
+        f"Saved {baseline['ms_per_date'] - pooled['ms_per_date']:.2f} ms per fetched date"
+        f" ({baseline['seconds'] / pooled['seconds']:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
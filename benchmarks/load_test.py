@@ -0,0 +1,326 @@
+"""
+Load test of the converter, rate list and TWRR endpoints of a running server.
+
+Sends requests with random currencies and dates at a fixed concurrency, endpoint by
+endpoint, and reports the p50/p95/p99 latency, throughput and database queries per
+request (read from the Server-Timing header) of each one. Results are written as
+JSON; with ``--baseline`` the run fails when a metric is worse than the baseline by
+more than ``--threshold``.
+
+Seed the database with ``manage.py generate_rates`` and start the server first.
+``--fake-fixer`` points the Fixer provider at a local stand-in while the test runs,
+so dates missing from the database are fetched without calling the real API.
+
+Usage:
+    python -m benchmarks.load_test --concurrency 16 --requests 500 --output run.json
+    python -m benchmarks.load_test --baseline run.json --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import date, timedelta
+
+import numpy as np
+import requests
+
+from .fake_fixer import FakeFixerServer
+
+ENDPOINTS = {
+    "converter": "/api/currency-converter/",
+    "rates": "/api/currency-rates/",
+    "twrr": "/api/currency-twrr/",
+}
+DEFAULT_CURRENCIES = ["EUR", "CHF", "USD", "GBP"]
+
+# Metrics compared with the baseline, and whether a higher value is worse
+COMPARED_METRICS = {
+    "p50_ms": True,
+    "p95_ms": True,
+    "p99_ms": True,
+    "queries_per_request": True,
+    "error_rate": True,
+    "throughput_rps": False,
+}
+
+_QUERIES = re.compile(r'(?:^|,)\s*db;[^,]*desc="(\d+) queries"')
+
+
+def build_params(endpoint, rng, currencies, start_date, end_date, rates_days):
+    """
+    Returns random query parameters of a request to ``endpoint``.
+    """
+    source_currency, target_currency = rng.sample(currencies, 2)
+    day_count = (end_date - start_date).days
+
+    if endpoint == "converter":
+        return {
+            "source_currency": source_currency,
+            "target_currency": target_currency,
+            "amount": f"{rng.uniform(1, 10000):.2f}",
+        }
+    if endpoint == "rates":
+        date_from = start_date + timedelta(
+            days=rng.randint(0, max(0, day_count - rates_days))
+        )
+        date_to = min(date_from + timedelta(days=rates_days - 1), end_date)
+        return {
+            "source_currency": source_currency,
+            "date_from": str(date_from),
+            "date_to": str(date_to),
+        }
+    return {
+        "source_currency": source_currency,
+        "exchanged_currency": target_currency,
+        "amount": f"{rng.uniform(1, 10000):.2f}",
+        "start_date": str(start_date + timedelta(days=rng.randint(0, day_count))),
+    }
+
+
+def get_query_count(server_timing):
+    """
+    Returns the database query count reported in a Server-Timing header, or None.
+    """
+    match = _QUERIES.search(server_timing or "")
+    return int(match.group(1)) if match else None
+
+
+def run_endpoint(base_url, endpoint, params_list, concurrency, timeout=60):
+    """
+    Sends one request per entry of ``params_list`` with ``concurrency`` threads.
+
+    Returns:
+        dict: The summary of the requests, see ``summarize``.
+    """
+    local = threading.local()
+    url = base_url.rstrip("/") + ENDPOINTS[endpoint]
+
+    def send(params):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+
+        started = time.perf_counter()
+        try:
+            response = session.get(url, params=params, timeout=timeout)
+        except requests.RequestException:
+            return time.perf_counter() - started, None, None
+        return (
+            time.perf_counter() - started,
+            response.status_code,
+            get_query_count(response.headers.get("Server-Timing")),
+        )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, params_list))
+    return summarize(results, time.perf_counter() - started)
+
+
+def summarize(results, elapsed):
+    """
+    Summarizes (seconds, status_code, query_count) tuples of requests sent in
+    ``elapsed`` seconds. Failed requests have no status code; responses with a
+    status code of 500 or more count as errors.
+    """
+    latencies = np.array([seconds for seconds, _, _ in results]) * 1000
+    query_counts = [queries for _, _, queries in results if queries is not None]
+    errors = sum(1 for _, status, _ in results if status is None or status >= 500)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if results else (0, 0, 0)
+
+    return {
+        "requests": len(results),
+        "errors": errors,
+        "error_rate": errors / len(results) if results else 0,
+        "throughput_rps": len(results) / elapsed if elapsed else 0,
+        "mean_ms": float(latencies.mean()) if results else 0,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "queries_per_request": (
+            sum(query_counts) / len(query_counts) if query_counts else None
+        ),
+    }
+
+
+def compare_results(results, baseline, threshold):
+    """
+    Compares the endpoint summaries of a run with a baseline run.
+
+    Args:
+        results (dict): Summaries of this run keyed by endpoint.
+        baseline (dict): Summaries of the baseline run keyed by endpoint.
+        threshold (float): Relative change tolerated, e.g. 0.1 for 10%.
+
+    Returns:
+        list: (endpoint, metric, baseline, current, change) tuples of the metrics
+            that got worse by more than ``threshold``.
+    """
+    regressions = []
+    for endpoint, summary in results.items():
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            before = baseline.get(endpoint, {}).get(metric)
+            current = summary.get(metric)
+            if before is None or current is None:
+                continue
+
+            if before:
+                change = (current - before) / before
+            else:
+                change = 0 if current == before else float("inf")
+            if not higher_is_worse:
+                change = -change
+            if change > threshold:
+                regressions.append((endpoint, metric, before, current, change))
+    return regressions
+
+
+@contextmanager
+def fake_fixer(port):
+    """
+    Points the Fixer provider of the database at a local stand-in while the block runs.
+    """
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "MyCurrency.settings")
+    django.setup()
+    from MyCurrencyApp.models import CurrencyProvider
+
+    provider = CurrencyProvider.objects.get(name="Fixer")
+    url = provider.url
+    with FakeFixerServer(port=port) as server:
+        CurrencyProvider.objects.filter(pk=provider.pk).update(url=server.url)
+        try:
+            reload_providers()
+            yield server
+        finally:
+            CurrencyProvider.objects.filter(pk=provider.pk).update(url=url)
+            reload_providers(wait=False)
+
+
+def reload_providers(wait=True):
+    """
+    Makes the running server reload its active providers after they were updated
+    here. The server is told through the shared rate cache; a cache local to each
+    process cannot reach it, so the run waits until the server reloads them itself.
+    """
+    from django.core.cache import caches
+    from django.core.cache.backends.locmem import LocMemCache
+
+    from MyCurrencyApp.cache.active_providers import active_providers
+    from MyCurrencyApp.cache.shared_rate_cache import shared_rate_cache
+
+    shared_rate_cache.bump_providers()
+    if wait and isinstance(caches[shared_rate_cache.alias], LocMemCache):
+        print(
+            f"Waiting {active_providers.reload_interval}s for the server to reload "
+            "its providers (the rate cache is not shared between processes)",
+            file=sys.stderr,
+        )
+        time.sleep(active_providers.reload_interval + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS)
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Requests per endpoint."
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="Unmeasured requests per endpoint."
+    )
+    parser.add_argument("--currencies", nargs="+", default=DEFAULT_CURRENCIES)
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=365,
+        help="Requested dates are within this many days before today.",
+    )
+    parser.add_argument(
+        "--rates-days", type=int, default=90, help="Days per rate list request."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Results JSON file to compare with.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative regression tolerated by --baseline, e.g. 0.1 for 10%%.",
+    )
+    parser.add_argument(
+        "--fake-fixer",
+        action="store_true",
+        help="Serve the Fixer provider from a local stand-in during the run.",
+    )
+    parser.add_argument("--fake-fixer-port", type=int, default=8001)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    end_date = date.today()
+    start_date = end_date - timedelta(days=args.days)
+
+    with fake_fixer(args.fake_fixer_port) if args.fake_fixer else nullcontext():
+        results = {}
+        for endpoint in args.endpoints:
+            params_list = [
+                build_params(
+                    endpoint,
+                    rng,
+                    args.currencies,
+                    start_date,
+                    end_date,
+                    args.rates_days,
+                )
+                for _ in range(args.warmup + args.requests)
+            ]
+            run_endpoint(
+                args.base_url, endpoint, params_list[: args.warmup], args.concurrency
+            )
+            results[endpoint] = run_endpoint(
+                args.base_url, endpoint, params_list[args.warmup :], args.concurrency
+            )
+
+    print(
+        f"{'endpoint':<10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'req/s':>8} {'queries':>8} {'errors':>7}"
+    )
+    for endpoint, summary in results.items():
+        queries = summary["queries_per_request"]
+        print(
+            f"{endpoint:<10} {summary['p50_ms']:9.1f} {summary['p95_ms']:9.1f} "
+            f"{summary['p99_ms']:9.1f} {summary['throughput_rps']:8.1f} "
+            f"{'-' if queries is None else f'{queries:.1f}':>8} {summary['errors']:7d}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"config": vars(args), "results": results}, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare_results(results, baseline, args.threshold)
+        for endpoint, metric, before, current, change in regressions:
+            print(
+                f"REGRESSION {endpoint} {metric}: {before:.2f} -> {current:.2f} "
+                f"({change:+.0%})"
+            )
+        if regressions:
+            sys.exit(1)
+        print(f"No regression above {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
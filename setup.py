@@ -1,10 +1,5 @@
-import glob
 import os
 import django
-import csv
-import json
-from datetime import datetime
-from decimal import Decimal
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -12,7 +7,9 @@ load_dotenv()
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "MyCurrency.settings")
 django.setup()
 
-from MyCurrencyApp.models import Currency, CurrencyProvider, CurrencyExchangeRate
+from django.core.management import call_command
+
+from MyCurrencyApp.models import Currency, CurrencyProvider
 
 
 def run_migrations():
@@ -64,53 +61,12 @@ def add_providers():
         )
 
 
-def add_exchange_rates_from_file(file_path):
-    """Populate exchange rate data from a CSV or JSON file."""
-    file_extension = os.path.splitext(file_path)[-1].lower()
-
-    if file_extension == ".csv":
-        with open(file_path, "r") as csv_file:
-            reader = csv.DictReader(csv_file)
-            exchange_rate_data = list(reader)
-    elif file_extension == ".json":
-        with open(file_path, "r") as json_file:
-            exchange_rate_data = json.load(json_file)
-    else:
-        raise ValueError(f"Unsupported file type: {file_extension}")
-
-    for row in exchange_rate_data:
-        try:
-            source_currency = Currency.objects.get(code=row["source_currency_code"])
-            target_currency = Currency.objects.get(code=row["target_currency_code"])
-            provider = CurrencyProvider.objects.get(name="Mock")
-
-            CurrencyExchangeRate.objects.get_or_create(
-                source_currency=source_currency,
-                target_currency=target_currency,
-                valuation_date=datetime.strptime(
-                    row["valuation_date"], "%Y-%m-%d"
-                ).date(),
-                provider=provider,
-                defaults={"rate_value": Decimal(row["rate_value"]), "active": True},
-            )
-
-        except Exception as e:
-            print(f"Error adding exchange rate for {row}: {e}")
-
-
 def setup():
     run_migrations()
     add_currencies()
     add_providers()
 
-    file_patterns = ["*.csv", "*.json"]
-    all_files = []
-    for pattern in file_patterns:
-        all_files.extend(glob.glob(os.path.join("mock_data", pattern)))
-
-    for file_path in all_files:
-        add_exchange_rates_from_file(file_path)
-        print(f"Loaded exchange rates from {file_path}")
+    call_command("ingest_rates", "mock_data", provider="Mock")
 
 
 if __name__ == "__main__":